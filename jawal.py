@@ -9,6 +9,7 @@ JawaL - أداة إدارة سطح الهجوم واختبار الاختراق
 
 import os
 import sys
+import logging
 import argparse
 import time
 import json
@@ -48,7 +49,18 @@ from modules.web_scanner import WebScanner
 from modules.wordpress_scanner import WordpressScanner
 from modules.joomla_scanner import JoomlaScanner
 from modules.report_generator import ReportGenerator
-from modules.utils import setup_logger, validate_phone, validate_url, validate_username
+from modules.stage_scheduler import StageScheduler
+from modules.batch_scanner import BatchScanner, iter_targets, make_scan_function, default_batch_output
+from modules.scan_pipeline import build_pipeline, SCAN_PROFILES
+from modules.triage import make_triage_function, plan_deep_scans
+from modules.cms_detector import CMSDetector, enumerator_for
+from modules.canonical import resolve_base_url
+from modules.wordlist import parse_suffixes
+from modules.subdomain_scanner import SubdomainScanner, parse_resolvers
+from modules.vulndb import configure_vulndb
+from modules.joomla_fingerprint import configure_fingerprints
+from modules.concurrency import configure_governor, parse_budgets, new_token, cancel_all, shutdown_executor
+from modules.utils import setup_logger, validate_phone, validate_url, validate_username, extract_domain
 
 # إعداد وحدة التسجيل
 logger = setup_logger()
@@ -91,6 +103,8 @@ def parse_arguments():
         target_group.add_argument('--url', help='عنوان URL للموقع المستهدف')
         target_group.add_argument('--wordpress', help='عنوان URL لموقع ووردبريس للفحص')
         target_group.add_argument('--joomla', help='عنوان URL لموقع جوملا للفحص')
+        target_group.add_argument('--auto', metavar='URL', help='عنوان URL لموقع يُكشف نظام إدارة المحتوى فيه تلقائيًا ثم يُفحص بالفاحص المناسب')
+        target_group.add_argument('--targets', metavar='FILE|-', help='ملف يحتوي على عناوين URL (عنوان في كل سطر) أو - للقراءة من الإدخال القياسي')
         
         # خيارات المسح
         scan_group.add_argument('--social', action='store_true', help='تمكين فحص مواقع التواصل الاجتماعي')
@@ -98,6 +112,59 @@ def parse_arguments():
         scan_group.add_argument('--deep', action='store_true', help='تمكين الفحص العميق (يستغرق وقتًا أطول)')
         scan_group.add_argument('--ports', default='80,443', help='المنافذ للفحص (افتراضيًا: 80,443)')
         scan_group.add_argument('--timeout', type=int, default=30, help='مهلة الاتصال بالثواني (افتراضيًا: 30)')
+        scan_group.add_argument('--scan-type', choices=['web', 'wordpress', 'joomla', 'auto'], default='web',
+                                help='نوع الفحص المطبق على كل هدف في وضع --targets (افتراضيًا: web؛ auto للكشف التلقائي عن نظام إدارة المحتوى)')
+        scan_group.add_argument('--workers', type=int, default=10, help='عدد الأهداف التي تُفحص بالتوازي في وضع --targets (افتراضيًا: 10)')
+        scan_group.add_argument('--profile', choices=sorted(SCAN_PROFILES),
+                                help='ملف تعريف مخطط الفحص في وضع --targets (يُستخدم بدلًا من --scan-type)')
+        scan_group.add_argument('--triage', action='store_true',
+                                help='فرز سريع للأهداف قبل الفحص العميق في وضع --targets (يُفحص الأعلى درجة أولًا)')
+        scan_group.add_argument('--triage-threshold', type=int, default=1, metavar='SCORE',
+                                help='أدنى درجة فرز (0-100) لجدولة الفحص العميق (افتراضيًا: 1، أي كل هدف يمكن الوصول إليه)')
+        scan_group.add_argument('--deadline', type=float, metavar='SECONDS',
+                                help='المهلة الكلية لفحص كل هدف بالثواني؛ عند انتهائها تُعاد النتائج الجزئية')
+        scan_group.add_argument('--wp-vulndb', metavar='FILE',
+                                help='قاعدة بيانات ثغرات ووردبريس مخصصة (JSON أو SQLite) بدلًا من القاعدة المضمنة')
+        scan_group.add_argument('--joomla-vulndb', metavar='FILE',
+                                help='قاعدة بيانات ثغرات جوملا مخصصة (JSON أو SQLite) بدلًا من القاعدة المضمنة')
+        scan_group.add_argument('--joomla-fingerprints', metavar='FILE',
+                                help='قاعدة بصمات الملفات الثابتة لتحديد إصدار جوملا؛ لا توجد قاعدة مضمنة وبدونها لا يُستخدم هذا التحديد (تُبنى عبر python -m modules.joomla_fingerprint)')
+        scan_group.add_argument('--wp-enumerate', type=int, default=0, metavar='N',
+                                help='التعداد النشط لأشهر N إضافة وقالب ووردبريس من القوائم المضمنة (افتراضيًا: 0، معطل)')
+        scan_group.add_argument('--joomla-enumerate', type=int, default=0, metavar='N',
+                                help='التعداد النشط لأشهر N مكون ووحدة وإضافة جوملا من الفهرس المضمن (افتراضيًا: 0، معطل)')
+        scan_group.add_argument('--enum-budget', '--wp-enum-budget', dest='enum_budget', type=float, default=60, metavar='SECONDS',
+                                help='الميزانية الزمنية للتعداد النشط لكل هدف بالثواني (افتراضيًا: 60)')
+        scan_group.add_argument('--enum-rate', '--wp-enum-rate', dest='enum_rate', type=float, default=20, metavar='RPS',
+                                help='الحد الأقصى لطلبات التعداد النشط في الثانية لكل مضيف (افتراضيًا: 20)')
+        scan_group.add_argument('--discover', action='store_true',
+                                help='اكتشاف المجلدات والملفات في فحص الويب من قائمة كلمات (المضمنة افتراضيًا)')
+        scan_group.add_argument('--discover-wordlist', metavar='FILE',
+                                help='قائمة كلمات مخصصة لاكتشاف المحتوى (كلمة في كل سطر)')
+        scan_group.add_argument('--discover-ext', metavar='LIST', default='',
+                                help='امتدادات تُضاف إلى كل كلمة بلا امتداد في اكتشاف المحتوى (مثال: php,html,bak)')
+        scan_group.add_argument('--discover-case', action='store_true',
+                                help='تجربة صيغ الحالة لكل كلمة في اكتشاف المحتوى (صغيرة، كبيرة، أول حرف كبير)')
+        scan_group.add_argument('--discover-suffixes', metavar='SPEC', default='',
+                                help='لواحق تُضاف إلى كل كلمة في اكتشاف المحتوى (مثال: 1-3,2024,_old)')
+        scan_group.add_argument('--discover-depth', type=int, default=0, metavar='N',
+                                help='عمق التعمق في المجلدات المكتشفة (افتراضيًا: 0، بدون تعمق)')
+        scan_group.add_argument('--discover-rate', type=float, default=50, metavar='RPS',
+                                help='الحد الأقصى لطلبات اكتشاف المحتوى في الثانية لكل مضيف (افتراضيًا: 50؛ ارفع host في --concurrency للمعدلات العالية)')
+        scan_group.add_argument('--discover-budget', type=float, default=300, metavar='SECONDS',
+                                help='الميزانية الزمنية لاكتشاف المحتوى لكل هدف بالثواني (افتراضيًا: 300)')
+        scan_group.add_argument('--subdomains', action='store_true',
+                                help='اكتشاف النطاقات الفرعية لنطاق --url عبر DNS وفحص منافذ ومواقع كل نطاق فرعي فور حله')
+        scan_group.add_argument('--subdomain-wordlist', metavar='FILE',
+                                help='قائمة أسماء مخصصة لاكتشاف النطاقات الفرعية (اسم في كل سطر)')
+        scan_group.add_argument('--resolvers', metavar='LIST|FILE',
+                                help='خوادم DNS لاكتشاف النطاقات الفرعية مفصولة بفواصل أو ملف (افتراضيًا: خوادم النظام)')
+        scan_group.add_argument('--dns-concurrency', type=int, default=1000, metavar='N',
+                                help='عدد استعلامات DNS المعلقة في آن واحد (افتراضيًا: 1000)')
+        scan_group.add_argument('--subdomain-budget', type=float, default=600, metavar='SECONDS',
+                                help='الميزانية الزمنية لاكتشاف النطاقات الفرعية بالثواني (افتراضيًا: 600)')
+        scan_group.add_argument('--concurrency', metavar='SPEC',
+                                help='ميزانيات التوازي المشتركة لكل فئة موارد والحد لكل مضيف (مثال: http=64,socket=256,cpu=4,host=8)')
         
         # خيارات الإخراج
         output_group.add_argument('-o', '--output', help='اسم ملف التقرير (بدون لاحقة)')
@@ -118,7 +185,7 @@ def parse_arguments():
 
 def validate_arguments(args):
     """التحقق من صحة المعطيات المدخلة"""
-    if not any([args.phone, args.username, args.url, args.wordpress, args.joomla, args.update]):
+    if not any([args.phone, args.username, args.url, args.wordpress, args.joomla, args.auto, args.targets, args.update]):
         console.print("[bold red][!] خطأ: يجب تحديد هدف واحد على الأقل (رقم هاتف، اسم مستخدم، URL)[/bold red]")
         return False
     
@@ -128,7 +195,8 @@ def validate_arguments(args):
     
     if (args.url and not validate_url(args.url)) or \
        (args.wordpress and not validate_url(args.wordpress)) or \
-       (args.joomla and not validate_url(args.joomla)):
+       (args.joomla and not validate_url(args.joomla)) or \
+       (args.auto and not validate_url(args.auto)):
         console.print("[bold red][!] خطأ: عنوان URL غير صحيح. تأكد من إضافة http:// أو https://[/bold red]")
         return False
     
@@ -136,6 +204,74 @@ def validate_arguments(args):
         console.print("[bold red][!] خطأ: اسم المستخدم غير صحيح. يجب أن يتكون من أحرف وأرقام وشرطة سفلية ونقطة فقط (3-30 حرف)[/bold red]")
         return False
     
+    if args.targets and args.targets != '-' and not os.path.isfile(args.targets):
+        console.print(f"[bold red][!] خطأ: ملف الأهداف غير موجود: {args.targets}[/bold red]")
+        return False
+    
+    if args.workers < 1:
+        console.print("[bold red][!] خطأ: يجب أن يكون عدد العمال 1 على الأقل[/bold red]")
+        return False
+    
+    if args.triage and not args.targets:
+        console.print("[bold red][!] خطأ: يتطلب --triage تحديد قائمة أهداف عبر --targets[/bold red]")
+        return False
+    
+    if not 0 <= args.triage_threshold <= 100:
+        console.print("[bold red][!] خطأ: يجب أن تكون عتبة الفرز بين 0 و100[/bold red]")
+        return False
+    
+    if args.wp_vulndb and not os.path.isfile(args.wp_vulndb):
+        console.print(f"[bold red][!] خطأ: ملف قاعدة بيانات الثغرات غير موجود: {args.wp_vulndb}[/bold red]")
+        return False
+    
+    if args.joomla_vulndb and not os.path.isfile(args.joomla_vulndb):
+        console.print(f"[bold red][!] خطأ: ملف قاعدة بيانات الثغرات غير موجود: {args.joomla_vulndb}[/bold red]")
+        return False
+    
+    if args.wp_enumerate < 0 or args.joomla_enumerate < 0 or args.enum_budget <= 0 or args.enum_rate <= 0:
+        console.print("[bold red][!] خطأ: يجب أن تكون قيم التعداد النشط موجبة[/bold red]")
+        return False
+    
+    if args.discover_wordlist and not os.path.isfile(args.discover_wordlist):
+        console.print(f"[bold red][!] خطأ: ملف قائمة الكلمات غير موجود: {args.discover_wordlist}[/bold red]")
+        return False
+    
+    if args.discover_depth < 0 or args.discover_rate <= 0 or args.discover_budget <= 0:
+        console.print("[bold red][!] خطأ: يجب أن تكون قيم اكتشاف المحتوى موجبة[/bold red]")
+        return False
+    
+    if args.subdomains and not args.url:
+        console.print("[bold red][!] خطأ: يتطلب --subdomains تحديد الهدف عبر --url[/bold red]")
+        return False
+    
+    if args.subdomain_wordlist and not os.path.isfile(args.subdomain_wordlist):
+        console.print(f"[bold red][!] خطأ: ملف قائمة الأسماء غير موجود: {args.subdomain_wordlist}[/bold red]")
+        return False
+    
+    if args.dns_concurrency < 1 or args.subdomain_budget <= 0:
+        console.print("[bold red][!] خطأ: يجب أن تكون قيم اكتشاف النطاقات الفرعية موجبة[/bold red]")
+        return False
+    
+    try:
+        parse_resolvers(args.resolvers)
+    except ValueError as e:
+        console.print(f"[bold red][!] خطأ في خوادم DNS: {e}[/bold red]")
+        return False
+    
+    if args.joomla_fingerprints and not os.path.isfile(args.joomla_fingerprints):
+        console.print(f"[bold red][!] خطأ: ملف بصمات جوملا غير موجود: {args.joomla_fingerprints}[/bold red]")
+        return False
+    
+    if args.deadline is not None and args.deadline <= 0:
+        console.print("[bold red][!] خطأ: يجب أن تكون المهلة الكلية أكبر من صفر[/bold red]")
+        return False
+    
+    try:
+        parse_budgets(args.concurrency)
+    except ValueError as e:
+        console.print(f"[bold red][!] خطأ في ميزانيات التوازي: {e}[/bold red]")
+        return False
+    
     return True
 
 def update_tool():
@@ -258,7 +394,8 @@ def scan_username(username, args):
     """فحص اسم المستخدم"""
     console.print(f"\n[bold blue][*] بدء فحص اسم المستخدم: {username}[/bold blue]")
     
-    username_scanner = UsernameScanner(username, timeout=args.timeout, verbose=args.verbose)
+    username_scanner = UsernameScanner(username, timeout=args.timeout, verbose=args.verbose,
+                                       cancel_token=new_token(args.deadline))
     
     with Progress(
         TextColumn("[bold blue]{task.description}[/bold blue]"),
@@ -347,12 +484,42 @@ def scan_username(username, args):
         'deep_info': deep_info if args.deep else {}
     }
 
-def scan_web(url, args):
-    """فحص موقع الويب"""
+def resolve_target(url, args, cancel_token=None):
+    """العنوان الأساسي النهائي للهدف بعد تتبع التوجيه مرة واحدة (تُبنى عليه جميع الطلبات التالية)"""
+    base_url = resolve_base_url(url, timeout=args.timeout, cancel_token=cancel_token)
+    if base_url != url:
+        console.print(f"[bold blue][*] تمت إعادة توجيه الهدف إلى: {base_url}[/bold blue]")
+    return base_url
+
+def version_status(entry):
+    """حالة تحديث العنصر للعرض: محدث أو قديم أو غير معروف (عندما لا يُعرف آخر إصدار له)"""
+    is_latest = entry.get('is_latest')
+    if is_latest is None:
+        return "[bold yellow]غير معروف[/bold yellow]"
+    return "[bold green]محدث[/bold green]" if is_latest else "[bold red]قديم[/bold red]"
+
+def discovery_options(args):
+    """خيارات اكتشاف المحتوى من المعطيات (None إذا لم يُطلب)"""
+    if not args.discover:
+        return None
+    return {
+        'wordlist': args.discover_wordlist,
+        'extensions': [ext for ext in args.discover_ext.split(',') if ext.strip()],
+        'recursion': args.discover_depth,
+        'case': args.discover_case,
+        'suffixes': parse_suffixes(args.discover_suffixes),
+        'rate': args.discover_rate,
+        'time_budget': args.discover_budget,
+    }
+
+def scan_web(url, args, cancel_token=None):
+    """فحص موقع الويب (cancel_token رمز المهلة الموروث من مرحلة سابقة للهدف نفسه)"""
     console.print(f"\n[bold blue][*] بدء فحص موقع الويب: {url}[/bold blue]")
     
     ports = [int(p.strip()) for p in args.ports.split(',')]
-    web_scanner = WebScanner(url, ports=ports, timeout=args.timeout, verbose=args.verbose)
+    cancel_token = cancel_token or new_token(args.deadline)
+    url = resolve_target(url, args, cancel_token)
+    web_scanner = WebScanner(url, ports=ports, timeout=args.timeout, verbose=args.verbose, cancel_token=cancel_token)
     
     with Progress(
         TextColumn("[bold blue]{task.description}[/bold blue]"),
@@ -361,23 +528,46 @@ def scan_web(url, args):
         TimeElapsedColumn(),
     ) as progress:
         # إنشاء مهام التقدم
-        info_task = progress.add_task("[cyan]جمع معلومات الموقع...[/cyan]", total=100)
-        tech_task = progress.add_task("[cyan]تحديد التقنيات المستخدمة...[/cyan]", total=100)
-        vuln_task = progress.add_task("[cyan]فحص الثغرات الأمنية...[/cyan]", total=100)
-        port_task = progress.add_task("[cyan]فحص المنافذ المفتوحة...[/cyan]", total=100)
-        
-        # تنفيذ عمليات الفحص
-        site_info = web_scanner.get_site_info()
-        progress.update(info_task, completed=100)
+        tasks = {
+            'site_info': progress.add_task("[cyan]جمع معلومات الموقع...[/cyan]", total=100),
+            'technologies': progress.add_task("[cyan]تحديد التقنيات المستخدمة...[/cyan]", total=100),
+            'vulnerabilities': progress.add_task("[cyan]فحص الثغرات الأمنية...[/cyan]", total=100),
+            'open_ports': progress.add_task("[cyan]فحص المنافذ المفتوحة...[/cyan]", total=100),
+        }
+        discover = discovery_options(args)
+        if discover:
+            tasks['content'] = progress.add_task("[cyan]اكتشاف المجلدات والملفات...[/cyan]", total=100)
         
-        technologies = web_scanner.detect_technologies()
-        progress.update(tech_task, completed=100)
-        
-        vulnerabilities = web_scanner.scan_vulnerabilities()
-        progress.update(vuln_task, completed=100)
-        
-        open_ports = web_scanner.scan_ports()
-        progress.update(port_task, completed=100)
+        # تنفيذ مراحل الفحص المستقلة بالتوازي، ويتم تحديث كل شريط عند اكتمال مرحلته فعليًا
+        scheduler = StageScheduler(
+            on_stage_done=lambda name, _: progress.update(tasks[name], completed=100),
+            verbose=args.verbose,
+            cancel_token=cancel_token
+        )
+        scheduler.add_stage('site_info', web_scanner.get_site_info)
+        scheduler.add_stage('technologies', web_scanner.detect_technologies)
+        scheduler.add_stage('vulnerabilities', web_scanner.scan_vulnerabilities)
+        scheduler.add_stage('open_ports', web_scanner.scan_ports)
+        if discover:
+            # المسارات تُعرض فور اكتشافها دون انتظار نهاية المرحلة
+            scheduler.add_stage(
+                'content',
+                lambda: web_scanner.discover_content(
+                    on_found=lambda item: progress.console.print(
+                        f"[green][+] {item['path']} ({item['status']})"
+                        + (f" -> {item['location']}" if item['location'] else "") + "[/green]"),
+                    **discover)
+            )
+        stage_results = scheduler.run()
+    
+    if scheduler.truncated:
+        console.print("[bold yellow][!] انتهت المهلة الكلية قبل اكتمال الفحص؛ النتائج المعروضة جزئية[/bold yellow]")
+    
+    site_info = stage_results.get('site_info')
+    technologies = stage_results.get('technologies')
+    vulnerabilities = stage_results.get('vulnerabilities')
+    open_ports = stage_results.get('open_ports')
+    content = stage_results.get('content')
     
     # عرض النتائج
     console.print("\n[bold green][+] نتائج فحص موقع الويب:[/bold green]")
@@ -458,18 +648,105 @@ def scan_web(url, args):
     
     console.print(table)
     
-    return {
+    results = {
         'site_info': site_info,
         'technologies': technologies,
         'vulnerabilities': vulnerabilities,
-        'open_ports': open_ports
+        'open_ports': open_ports,
+        'truncated': scheduler.truncated
+    }
+    
+    # جدول المحتوى المكتشف
+    if discover:
+        table = Table(title="المجلدات والملفات المكتشفة")
+        table.add_column("المسار", style="cyan")
+        table.add_column("الحالة", style="green")
+        table.add_column("الحجم", style="blue")
+        
+        if content and content['found']:
+            for item in content['found']:
+                path = item['path'] + ('/' if item['directory'] else '')
+                table.add_row(path, str(item['status']), str(item['length'] if item['length'] is not None else ''))
+        else:
+            table.add_row("لم يُكتشف أي مسار", "", "")
+        
+        console.print(table)
+        if content and content.get('truncated'):
+            console.print("[bold yellow][!] انتهت ميزانية اكتشاف المحتوى قبل فحص جميع الكلمات[/bold yellow]")
+        results['content'] = content
+    
+    return results
+
+def scan_subdomain_host(url, address, ports, args, cancel_token):
+    """فحص نطاق فرعي محلول: معلومات الموقع والمنافذ المفتوحة على العنوان الذي حُل إليه"""
+    scanner = WebScanner(url, ports=ports, timeout=args.timeout, verbose=args.verbose, cancel_token=cancel_token)
+    return {
+        'site_info': scanner.get_site_info(),
+        'open_ports': scanner.scan_ports(ip=address),
     }
 
-def scan_wordpress(url, args):
-    """فحص موقع ووردبريس"""
+def scan_subdomains(url, args):
+    """اكتشاف النطاقات الفرعية لنطاق الهدف وتمرير كل نطاق فرعي إلى فحص المنافذ والموقع فور حله"""
+    domain = extract_domain(url).split(':')[0]
+    console.print(f"\n[bold blue][*] بدء اكتشاف النطاقات الفرعية: {domain}[/bold blue]")
+    
+    ports = [int(p.strip()) for p in args.ports.split(',')]
+    scheme = url.split('://', 1)[0] if '://' in url else 'http'
+    cancel_token = new_token(args.deadline)
+    scanner = SubdomainScanner(domain, resolvers=parse_resolvers(args.resolvers), concurrency=args.dns_concurrency,
+                               verbose=args.verbose, cancel_token=cancel_token, time_budget=args.subdomain_budget)
+    
+    # فحص كل نطاق فرعي يبدأ فور حله بالتوازي مع بقية استعلامات DNS
+    executor = ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix='jawal-subdomain')
+    host_scans = []
+    
+    def on_found(result):
+        console.print(f"[green][+] {result['host']} ({', '.join(result['addresses'])})[/green]")
+        host_scans.append((result, executor.submit(scan_subdomain_host, f"{scheme}://{result['host']}",
+                                                   result['addresses'][0], ports, args, cancel_token)))
+    
+    try:
+        results = scanner.run(wordlist=args.subdomain_wordlist, on_found=on_found)
+        for result, future in host_scans:
+            try:
+                result.update(future.result())
+            except Exception as e:
+                logger.error(f"خطأ في فحص النطاق الفرعي {result['host']}: {e}")
+    finally:
+        shutdown_executor(executor)
+    
+    if results['wildcard']:
+        console.print(f"[bold yellow][!] النطاق يستخدم DNS شاملًا ({', '.join(results['wildcard'])})؛ "
+                      f"استُبعدت الأسماء التي تُحل إليه فقط[/bold yellow]")
+    if results['truncated']:
+        console.print("[bold yellow][!] انتهت ميزانية اكتشاف النطاقات الفرعية قبل فحص جميع الأسماء[/bold yellow]")
+    
+    table = Table(title="النطاقات الفرعية المكتشفة")
+    table.add_column("النطاق الفرعي", style="cyan")
+    table.add_column("العناوين", style="green")
+    table.add_column("المنافذ المفتوحة", style="blue")
+    table.add_column("عنوان الصفحة", style="magenta")
+    
+    if results['subdomains']:
+        for result in results['subdomains']:
+            open_ports = ', '.join(str(port['port']) for port in result.get('open_ports') or [])
+            title = (result.get('site_info') or {}).get('العنوان', '')
+            table.add_row(result['host'], ', '.join(result['addresses']), open_ports, str(title or ''))
+    else:
+        table.add_row("لم يُكتشف أي نطاق فرعي", "", "", "")
+    
+    console.print(table)
+    
+    return results
+
+def scan_wordpress(url, args, session=None, cancel_token=None):
+    """فحص موقع ووردبريس (session ورمز المهلة cancel_token من مرحلة سابقة للهدف نفسه، مثل كاشف نظام إدارة المحتوى)"""
     console.print(f"\n[bold blue][*] بدء فحص موقع ووردبريس: {url}[/bold blue]")
     
-    wp_scanner = WordpressScanner(url, timeout=args.timeout, verbose=args.verbose)
+    cancel_token = cancel_token or new_token(args.deadline)
+    url = resolve_target(url, args, cancel_token)
+    wp_scanner = WordpressScanner(url, timeout=args.timeout, verbose=args.verbose, cancel_token=cancel_token,
+                                  session=session)
     
     with Progress(
         TextColumn("[bold blue]{task.description}[/bold blue]"),
@@ -478,23 +755,55 @@ def scan_wordpress(url, args):
         TimeElapsedColumn(),
     ) as progress:
         # إنشاء مهام التقدم
-        version_task = progress.add_task("[cyan]تحديد إصدار ووردبريس...[/cyan]", total=100)
-        theme_task = progress.add_task("[cyan]فحص القوالب...[/cyan]", total=100)
-        plugin_task = progress.add_task("[cyan]فحص الإضافات...[/cyan]", total=100)
-        vuln_task = progress.add_task("[cyan]فحص الثغرات الأمنية...[/cyan]", total=100)
+        tasks = {
+            'wp_version': progress.add_task("[cyan]تحديد إصدار ووردبريس...[/cyan]", total=100),
+            'themes': progress.add_task("[cyan]فحص القوالب...[/cyan]", total=100),
+            'plugins': progress.add_task("[cyan]فحص الإضافات...[/cyan]", total=100),
+            'users': progress.add_task("[cyan]تعداد المستخدمين...[/cyan]", total=100),
+            'vulnerabilities': progress.add_task("[cyan]فحص الثغرات الأمنية...[/cyan]", total=100),
+        }
+        if args.wp_enumerate:
+            tasks['active_components'] = progress.add_task("[cyan]التعداد النشط للإضافات والقوالب...[/cyan]", total=100)
         
-        # تنفيذ عمليات الفحص
-        wp_version = wp_scanner.detect_version()
-        progress.update(version_task, completed=100)
-        
-        themes = wp_scanner.enumerate_themes()
-        progress.update(theme_task, completed=100)
-        
-        plugins = wp_scanner.enumerate_plugins()
-        progress.update(plugin_task, completed=100)
-        
-        vulnerabilities = wp_scanner.scan_vulnerabilities()
-        progress.update(vuln_task, completed=100)
+        # القوالب والإضافات مستقلة، أما فحص الثغرات فيحتاج إلى الإصدار المكتشف
+        scheduler = StageScheduler(
+            on_stage_done=lambda name, _: progress.update(tasks[name], completed=100),
+            verbose=args.verbose,
+            cancel_token=cancel_token
+        )
+        scheduler.add_stage('wp_version', wp_scanner.detect_version)
+        scheduler.add_stage('themes', wp_scanner.enumerate_themes)
+        scheduler.add_stage('plugins', wp_scanner.enumerate_plugins)
+        scheduler.add_stage('users', wp_scanner.enumerate_users)
+        if args.wp_enumerate:
+            scheduler.add_stage(
+                'active_components',
+                lambda: wp_scanner.enumerate_components_active(limit=args.wp_enumerate, time_budget=args.enum_budget,
+                                                               rate=args.enum_rate)
+            )
+        scheduler.add_stage(
+            'vulnerabilities',
+            lambda wp_version: wp_scanner.scan_vulnerabilities(version=(wp_version or {}).get('version', '')),
+            depends_on=['wp_version']
+        )
+        stage_results = scheduler.run()
+    
+    if scheduler.truncated:
+        console.print("[bold yellow][!] انتهت المهلة الكلية قبل اكتمال الفحص؛ النتائج المعروضة جزئية[/bold yellow]")
+    
+    wp_version = stage_results.get('wp_version')
+    themes = stage_results.get('themes')
+    plugins = stage_results.get('plugins')
+    vulnerabilities = stage_results.get('vulnerabilities')
+    active_components = stage_results.get('active_components')
+    users = stage_results.get('users')
+    
+    # دمج ما وجده التعداد النشط ولم يظهر في الصفحة الرئيسية
+    if active_components:
+        themes = _merge_active_components(themes, active_components['themes'])
+        plugins = _merge_active_components(plugins, active_components['plugins'])
+        if active_components.get('truncated'):
+            console.print("[bold yellow][!] انتهت ميزانية التعداد النشط قبل فحص جميع المعرفات[/bold yellow]")
     
     # عرض النتائج
     console.print("\n[bold green][+] نتائج فحص موقع ووردبريس:[/bold green]")
@@ -507,7 +816,7 @@ def scan_wordpress(url, args):
     if wp_version:
         table.add_row("إصدار ووردبريس", wp_version.get('version', 'غير معروف'))
         table.add_row("آخر تحديث", wp_version.get('last_updated', 'غير معروف'))
-        table.add_row("الحالة", "[bold green]محدث[/bold green]" if wp_version.get('is_latest', False) else "[bold red]قديم[/bold red]")
+        table.add_row("الحالة", version_status(wp_version))
     else:
         table.add_row("إصدار ووردبريس", "غير معروف")
     
@@ -524,7 +833,7 @@ def scan_wordpress(url, args):
             table.add_row(
                 theme.get('name', ''),
                 theme.get('version', 'غير معروف'),
-                "[bold green]محدث[/bold green]" if theme.get('is_latest', False) else "[bold red]قديم[/bold red]"
+                version_status(theme)
             )
     else:
         table.add_row("لا توجد قوالب مكتشفة", "", "")
@@ -542,13 +851,27 @@ def scan_wordpress(url, args):
             table.add_row(
                 plugin.get('name', ''),
                 plugin.get('version', 'غير معروف'),
-                "[bold green]محدث[/bold green]" if plugin.get('is_latest', False) else "[bold red]قديم[/bold red]"
+                version_status(plugin)
             )
     else:
         table.add_row("لا توجد إضافات مكتشفة", "", "")
     
     console.print(table)
     
+    # جدول المستخدمين
+    table = Table(title="المستخدمون المكتشفون")
+    table.add_column("المعرف", style="cyan")
+    table.add_column("الاسم المختصر", style="green")
+    table.add_column("الاسم", style="blue")
+    
+    if users and users.get('users'):
+        for user in users['users']:
+            table.add_row(str(user.get('id', '')), user.get('slug') or '', user.get('name') or '')
+    else:
+        table.add_row("لا يوجد مستخدمون مكتشفون", "", "")
+    
+    console.print(table)
+    
     # جدول الثغرات الأمنية
     table = Table(title="الثغرات الأمنية المكتشفة")
     table.add_column("المكون", style="cyan")
@@ -587,14 +910,33 @@ def scan_wordpress(url, args):
         'wp_version': wp_version,
         'themes': themes,
         'plugins': plugins,
-        'vulnerabilities': vulnerabilities
+        'vulnerabilities': vulnerabilities,
+        'active_components': active_components,
+        'users': users,
+        'truncated': scheduler.truncated
     }
 
-def scan_joomla(url, args):
-    """فحص موقع جوملا"""
+def _merge_active_components(passive, active):
+    """إضافة العناصر المكتشفة بالتعداد النشط إلى القائمة المستخرجة من الصفحة الرئيسية دون تكرار"""
+    merged = list(passive or [])
+    known = {item.get('name') for item in merged}
+    for item in active:
+        name = item.get('name', item['slug'])
+        if name not in known:
+            entry = {'name': name, 'evidence': [item['url']]}
+            if item.get('version'):
+                entry['version'] = item['version']
+            merged.append(entry)
+    return merged
+
+def scan_joomla(url, args, session=None, cancel_token=None):
+    """فحص موقع جوملا (session ورمز المهلة cancel_token من مرحلة سابقة للهدف نفسه، مثل كاشف نظام إدارة المحتوى)"""
     console.print(f"\n[bold blue][*] بدء فحص موقع جوملا: {url}[/bold blue]")
     
-    joomla_scanner = JoomlaScanner(url, timeout=args.timeout, verbose=args.verbose)
+    cancel_token = cancel_token or new_token(args.deadline)
+    url = resolve_target(url, args, cancel_token)
+    joomla_scanner = JoomlaScanner(url, timeout=args.timeout, verbose=args.verbose, cancel_token=cancel_token,
+                                   session=session)
     
     with Progress(
         TextColumn("[bold blue]{task.description}[/bold blue]"),
@@ -603,23 +945,54 @@ def scan_joomla(url, args):
         TimeElapsedColumn(),
     ) as progress:
         # إنشاء مهام التقدم
-        version_task = progress.add_task("[cyan]تحديد إصدار جوملا...[/cyan]", total=100)
-        component_task = progress.add_task("[cyan]فحص المكونات...[/cyan]", total=100)
-        template_task = progress.add_task("[cyan]فحص القوالب...[/cyan]", total=100)
-        vuln_task = progress.add_task("[cyan]فحص الثغرات الأمنية...[/cyan]", total=100)
-        
-        # تنفيذ عمليات الفحص
-        joomla_version = joomla_scanner.detect_version()
-        progress.update(version_task, completed=100)
+        tasks = {
+            'joomla_version': progress.add_task("[cyan]تحديد إصدار جوملا...[/cyan]", total=100),
+            'components': progress.add_task("[cyan]فحص المكونات...[/cyan]", total=100),
+            'templates': progress.add_task("[cyan]فحص القوالب...[/cyan]", total=100),
+            'vulnerabilities': progress.add_task("[cyan]فحص الثغرات الأمنية...[/cyan]", total=100),
+        }
+        if args.joomla_enumerate:
+            tasks['active_extensions'] = progress.add_task("[cyan]التعداد النشط للامتدادات...[/cyan]", total=100)
         
-        components = joomla_scanner.enumerate_components()
-        progress.update(component_task, completed=100)
-        
-        templates = joomla_scanner.enumerate_templates()
-        progress.update(template_task, completed=100)
-        
-        vulnerabilities = joomla_scanner.scan_vulnerabilities()
-        progress.update(vuln_task, completed=100)
+        # المكونات والقوالب مستقلة، أما فحص الثغرات فيحتاج إلى الإصدار المكتشف
+        scheduler = StageScheduler(
+            on_stage_done=lambda name, _: progress.update(tasks[name], completed=100),
+            verbose=args.verbose,
+            cancel_token=cancel_token
+        )
+        scheduler.add_stage('joomla_version', joomla_scanner.detect_version)
+        scheduler.add_stage('components', joomla_scanner.enumerate_components)
+        scheduler.add_stage('templates', joomla_scanner.enumerate_templates)
+        if args.joomla_enumerate:
+            scheduler.add_stage(
+                'active_extensions',
+                lambda: joomla_scanner.enumerate_extensions_active(limit=args.joomla_enumerate, time_budget=args.enum_budget,
+                                                                   rate=args.enum_rate)
+            )
+        scheduler.add_stage(
+            'vulnerabilities',
+            lambda joomla_version, active_extensions=None: joomla_scanner.scan_vulnerabilities(
+                version=(joomla_version or {}).get('version', ''), extensions=active_extensions),
+            depends_on=['joomla_version'] + (['active_extensions'] if args.joomla_enumerate else [])
+        )
+        stage_results = scheduler.run()
+    
+    if scheduler.truncated:
+        console.print("[bold yellow][!] انتهت المهلة الكلية قبل اكتمال الفحص؛ النتائج المعروضة جزئية[/bold yellow]")
+    
+    joomla_version = stage_results.get('joomla_version')
+    components = stage_results.get('components')
+    templates = stage_results.get('templates')
+    vulnerabilities = stage_results.get('vulnerabilities')
+    active_extensions = stage_results.get('active_extensions')
+    
+    # دمج الامتدادات التي وجدها التعداد النشط مع المكونات المكتشفة في الصفحة الرئيسية
+    if active_extensions:
+        components = _merge_active_components(
+            components, [item for kind in ['components', 'modules', 'plugins'] for item in active_extensions.get(kind, [])]
+        )
+        if active_extensions.get('truncated'):
+            console.print("[bold yellow][!] انتهت ميزانية التعداد النشط قبل فحص جميع الامتدادات[/bold yellow]")
     
     # عرض النتائج
     console.print("\n[bold green][+] نتائج فحص موقع جوملا:[/bold green]")
@@ -632,7 +1005,7 @@ def scan_joomla(url, args):
     if joomla_version:
         table.add_row("إصدار جوملا", joomla_version.get('version', 'غير معروف'))
         table.add_row("آخر تحديث", joomla_version.get('last_updated', 'غير معروف'))
-        table.add_row("الحالة", "[bold green]محدث[/bold green]" if joomla_version.get('is_latest', False) else "[bold red]قديم[/bold red]")
+        table.add_row("الحالة", version_status(joomla_version))
     else:
         table.add_row("إصدار جوملا", "غير معروف")
     
@@ -649,7 +1022,7 @@ def scan_joomla(url, args):
             table.add_row(
                 component.get('name', ''),
                 component.get('version', 'غير معروف'),
-                "[bold green]محدث[/bold green]" if component.get('is_latest', False) else "[bold red]قديم[/bold red]"
+                version_status(component)
             )
     else:
         table.add_row("لا توجد مكونات مكتشفة", "", "")
@@ -667,7 +1040,7 @@ def scan_joomla(url, args):
             table.add_row(
                 template.get('name', ''),
                 template.get('version', 'غير معروف'),
-                "[bold green]محدث[/bold green]" if template.get('is_latest', False) else "[bold red]قديم[/bold red]"
+                version_status(template)
             )
     else:
         table.add_row("لا توجد قوالب مكتشفة", "", "")
@@ -705,9 +1078,116 @@ def scan_joomla(url, args):
         'joomla_version': joomla_version,
         'components': components,
         'templates': templates,
-        'vulnerabilities': vulnerabilities
+        'vulnerabilities': vulnerabilities,
+        'truncated': scheduler.truncated
     }
 
+def scan_auto(url, args):
+    """كشف نظام إدارة المحتوى تلقائيًا ثم فحص الموقع بالفاحص المناسب"""
+    console.print(f"\n[bold blue][*] الكشف عن نظام إدارة المحتوى: {url}[/bold blue]")
+    
+    cancel_token = new_token(args.deadline)
+    url = resolve_target(url, args, cancel_token)
+    detector = CMSDetector(url, timeout=args.timeout, verbose=args.verbose, cancel_token=cancel_token)
+    detection = detector.detect()
+    
+    table = Table(title="نتيجة الكشف عن نظام إدارة المحتوى")
+    table.add_column("المعلومة", style="cyan")
+    table.add_column("القيمة", style="green")
+    table.add_row("النظام", detection['cms'] or 'غير معروف')
+    table.add_row("الإصدار", detection['version'] or 'غير معروف')
+    table.add_row("الثقة", f"{detection['confidence']}%")
+    table.add_row("طلبات تحقق إضافية", 'نعم' if detection['probed'] else 'لا')
+    console.print(table)
+    
+    scan_type = enumerator_for(detection['cms'])
+    if scan_type == 'web':
+        results = scan_web(url, args, cancel_token=cancel_token)
+    else:
+        # الفاحص المتخصص يرث جلسة الكاشف فلا تُطلب الصفحة الرئيسية ومسارات التحقق مرة أخرى
+        scan_functions = {
+            'wordpress': scan_wordpress,
+            'joomla': scan_joomla,
+        }
+        # ويكمل على رمز المهلة نفسه فلا تبدأ --deadline من جديد بعد الكشف
+        results = scan_functions[scan_type](url, args, session=detector.session, cancel_token=cancel_token)
+    results['cms_detection'] = detection
+    
+    return scan_type, results
+
+def scan_targets(args):
+    """فحص قائمة من الأهداف في عملية واحدة وكتابة النتائج تدريجيًا"""
+    output_file = default_batch_output(args.output)
+    console.print(f"\n[bold blue][*] بدء الفحص الدفعي ({args.profile or args.scan_type}) من: {args.targets}[/bold blue]")
+    console.print(f"[bold blue][*] سيتم كتابة النتائج إلى: {output_file}[/bold blue]")
+    
+    ports = [int(p.strip()) for p in args.ports.split(',')]
+    targets = iter_targets(args.targets)
+    cms_by_target = {}
+    
+    if args.triage:
+        # المرحلة الأولى: فرز سريع لكل الأهداف ثم ترتيبها حسب الدرجة
+        targets, cms_by_target = triage_targets(args, output_file)
+    
+    if args.profile:
+        # تنفيذ مخطط المراحل: تعمل العقد الجاهزة لكل الأهداف بالتوازي وتُتخطى العقد التي فشلت متطلباتها
+        pipeline = build_pipeline(args.profile, ports=ports, timeout=args.timeout,
+                                  max_workers=args.workers, verbose=args.verbose, deadline=args.deadline)
+        batch_scanner = BatchScanner(None, max_workers=args.workers, output_file=output_file, verbose=args.verbose)
+        stats = batch_scanner.run_pipeline(pipeline, targets)
+    else:
+        scan_functions = {
+            scan_type: make_scan_function(scan_type, ports=ports, timeout=args.timeout,
+                                          verbose=args.verbose, deadline=args.deadline,
+                                          wp_enumerate=args.wp_enumerate, joomla_enumerate=args.joomla_enumerate,
+                                          enum_budget=args.enum_budget, enum_rate=args.enum_rate,
+                                          discover=discovery_options(args))
+            for scan_type in ['web', 'wordpress', 'joomla', 'auto']
+        }
+        # عند الفرز يُختار نوع الفحص العميق حسب نظام إدارة المحتوى المكتشف لكل هدف
+        def scan_func(target):
+            cms = cms_by_target.get(target)
+            return scan_functions[enumerator_for(cms) if cms else args.scan_type](target)
+        
+        batch_scanner = BatchScanner(scan_func, max_workers=args.workers, output_file=output_file, verbose=args.verbose)
+        stats = batch_scanner.run(targets)
+    
+    # جدول ملخص الفحص الدفعي
+    table = Table(title="ملخص الفحص الدفعي")
+    table.add_column("المعلومة", style="cyan")
+    table.add_column("القيمة", style="green")
+    table.add_row("إجمالي الأهداف", str(stats['total']))
+    table.add_row("ناجح", str(stats['succeeded']))
+    table.add_row("فاشل", str(stats['failed']))
+    table.add_row("متخطى", str(stats['skipped']))
+    table.add_row("ملف النتائج", output_file)
+    console.print(table)
+    
+    return stats
+
+def triage_targets(args, output_file):
+    """فرز جميع الأهداف وإرجاع الأهداف المؤهلة للفحص العميق مرتبة حسب الدرجة"""
+    triage_file = output_file[:-len('.jsonl')] + '.triage.jsonl'
+    console.print(f"[bold blue][*] المرحلة الأولى: فرز سريع للأهداف، تُكتب النتائج إلى: {triage_file}[/bold blue]")
+    
+    records = []
+    triage_scanner = BatchScanner(
+        make_triage_function(timeout=args.timeout, verbose=args.verbose, deadline=args.deadline),
+        max_workers=max(args.workers, 50),
+        output_file=triage_file,
+        verbose=args.verbose,
+        on_record=records.append
+    )
+    triage_scanner.run(iter_targets(args.targets))
+    
+    plan = plan_deep_scans(records, threshold=args.triage_threshold)
+    console.print(
+        f"[bold blue][*] المرحلة الثانية: فحص عميق لـ {len(plan)} من {len(records)} هدف "
+        f"(درجة الفرز {args.triage_threshold} أو أعلى)[/bold blue]"
+    )
+    
+    return [target for target, _ in plan], dict(plan)
+
 def generate_report(results, args):
     """إنشاء تقرير بالنتائج"""
     if not args.output:
@@ -742,6 +1222,18 @@ def main():
     if not validate_arguments(args):
         return
     
+    # ضبط ميزانيات التوازي المشتركة بين جميع الفاحصات
+    if args.concurrency:
+        configure_governor(parse_budgets(args.concurrency))
+    
+    # قاعدة بيانات الثغرات المحلية تُحمَّل مرة واحدة وتتشاركها جميع الفحوص
+    if args.wp_vulndb:
+        configure_vulndb('wordpress', args.wp_vulndb)
+    if args.joomla_vulndb:
+        configure_vulndb('joomla', args.joomla_vulndb)
+    if args.joomla_fingerprints:
+        configure_fingerprints(args.joomla_fingerprints)
+    
     start_time = time.time()
     results = {}
     
@@ -754,6 +1246,8 @@ def main():
         
         if args.url:
             results['web'] = scan_web(args.url, args)
+            if args.subdomains:
+                results['subdomains'] = scan_subdomains(args.url, args)
         
         if args.wordpress:
             results['wordpress'] = scan_wordpress(args.wordpress, args)
@@ -761,8 +1255,14 @@ def main():
         if args.joomla:
             results['joomla'] = scan_joomla(args.joomla, args)
         
-        # إنشاء تقرير إذا تم تحديد اسم الملف
-        if args.output:
+        if args.auto:
+            scan_type, results[scan_type] = scan_auto(args.auto, args)
+        
+        if args.targets:
+            results['batch'] = scan_targets(args)
+        
+        # إنشاء تقرير إذا تم تحديد اسم الملف (نتائج الفحص الدفعي تُكتب تدريجيًا في ملف مستقل)
+        if args.output and any(key != 'batch' for key in results):
             generate_report(results, args)
         
         end_time = time.time()
@@ -773,6 +1273,11 @@ def main():
     except KeyboardInterrupt:
         console.print("\n[bold yellow][!] تم إيقاف البرنامج بواسطة المستخدم[/bold yellow]")
         logger.warning("تم إيقاف البرنامج بواسطة المستخدم")
+        # إلغاء جميع الطلبات المعلقة والخروج فورًا دون انتظار الخيوط التي تنتظر مقابسها
+        cancel_all()
+        sys.stdout.flush()
+        logging.shutdown()
+        os._exit(130)
     except Exception as e:
         console.print(f"\n[bold red][!] حدث خطأ: {e}[/bold red]")
         logger.error(f"حدث خطأ: {e}")
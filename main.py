@@ -25,7 +25,11 @@ from modules import (
     WebScanner,
     WordpressScanner,
     JoomlaScanner,
-    ReportGenerator
+    ReportGenerator,
+    BatchScanner,
+    iter_targets,
+    make_scan_function,
+    cancel_all
 )
 
 # تهيئة الألوان
@@ -61,6 +65,11 @@ def parse_arguments():
     scan_group.add_argument('--wordpress', metavar='URL', help='فحص موقع ووردبريس')
     scan_group.add_argument('--joomla', metavar='URL', help='فحص موقع جوملا')
     scan_group.add_argument('--ports', metavar='PORTS', help='تحديد المنافذ للفحص (مثال: 80,443 أو 80-1000)')
+    scan_group.add_argument('--targets', metavar='FILE|-', help='فحص قائمة مواقع من ملف (عنوان في كل سطر) أو من الإدخال القياسي (-)')
+    scan_group.add_argument('--scan-type', choices=['web', 'wordpress', 'joomla', 'auto'], default='web',
+                            help='نوع الفحص المطبق على كل هدف في وضع --targets (الافتراضي: web)')
+    scan_group.add_argument('--workers', type=int, default=10, metavar='N',
+                            help='عدد الأهداف التي تُفحص بالتوازي في وضع --targets (الافتراضي: 10)')
     
     # خيارات الإخراج
     output_group.add_argument('-o', '--output-dir', metavar='DIR', help='مجلد حفظ التقارير')
@@ -86,7 +95,7 @@ def main():
     logger = setup_logging(log_level)
     
     # التحقق من وجود معطيات للفحص
-    if not any([args.phone, args.username, args.web, args.wordpress, args.joomla]):
+    if not any([args.phone, args.username, args.web, args.wordpress, args.joomla, args.targets]):
         print(colored("خطأ: يجب تحديد نوع الفحص (هاتف، اسم مستخدم، موقع ويب)", 'red'))
         print(colored("استخدم -h أو --help للحصول على المساعدة", 'yellow'))
         sys.exit(1)
@@ -133,6 +142,21 @@ def main():
         report_file = report_generator.generate_username_report(args.username, results)
         print(colored(f"تم إنشاء التقرير: {report_file}", 'green'))
     
+    elif args.targets:
+        # فحص دفعي لعدد كبير من المواقع في عملية واحدة
+        output_dir = args.output_dir or os.path.join(os.getcwd(), 'reports')
+        os.makedirs(output_dir, exist_ok=True)
+        output_file = os.path.join(output_dir, f"batch_{args.scan_type}_{os.getpid()}.jsonl")
+        
+        print(colored(f"جاري الفحص الدفعي ({args.scan_type}) من: {args.targets}", 'cyan'))
+        scan_func = make_scan_function(args.scan_type, ports=ports, verbose=args.verbose)
+        batch_scanner = BatchScanner(scan_func, max_workers=args.workers, output_file=output_file, verbose=args.verbose)
+        stats = batch_scanner.run(iter_targets(args.targets))
+        
+        print(colored(f"تم فحص {stats['succeeded']} من {stats['total']} هدف "
+                      f"({stats['failed']} فاشل، {stats['skipped']} متخطى)", 'green'))
+        print(colored(f"تم حفظ النتائج في: {output_file}", 'green'))
+    
     elif args.web or args.wordpress or args.joomla:
         url = args.web or args.wordpress or args.joomla
         
@@ -172,7 +196,11 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print(colored("\nتم إيقاف الفحص بواسطة المستخدم", 'yellow'))
-        sys.exit(0)
+        # إلغاء الطلبات المعلقة والخروج فورًا دون انتظار خيوط الفحص
+        cancel_all()
+        sys.stdout.flush()
+        logging.shutdown()
+        os._exit(0)
     except Exception as e:
         print(colored(f"\nحدث خطأ غير متوقع: {str(e)}", 'red'))
         sys.exit(1)
\ No newline at end of file
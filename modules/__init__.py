@@ -15,6 +15,7 @@ from .utils import (
     generate_random_string,
     get_user_agent,
     safe_request,
+    fetch_partial,
     extract_domain,
     is_ip_address,
     format_timestamp,
@@ -30,6 +31,30 @@ from .web_scanner import WebScanner
 from .wordpress_scanner import WordpressScanner
 from .joomla_scanner import JoomlaScanner
 from .report_generator import ReportGenerator
+from .concurrency import (
+    ConcurrencyGovernor, get_governor, configure_governor,
+    CancellationToken, ScanCancelled, new_token, cancel_all,
+    RateLimiter, get_rate_limiter
+)
+from .stage_scheduler import StageScheduler
+from .batch_scanner import BatchScanner, iter_targets, make_scan_function
+from .scan_pipeline import ScanNode, ScanPipeline, build_pipeline, SCAN_PROFILES
+from .triage import TriageScanner, make_triage_function, plan_deep_scans
+from .cms_detector import CMSDetector
+from .cms_probe import ProbePlan, ProbeSession, run_plans
+from .soft404 import Soft404Detector
+from .canonical import resolve_base_url
+from .content_discovery import ContentDiscovery
+from .wordlist import Wordlist, BloomFilter, iter_wordlist
+from .subdomain_scanner import SubdomainScanner
+from .vulndb import VulnDatabase, get_vulndb, configure_vulndb
+from .enumerator import Enumerator, SlugEnumerator
+from .wp_enumerator import WordpressEnumerator
+from .joomla_enumerator import JoomlaEnumerator
+from .wp_rest import read_rest_namespaces, map_namespaces
+from .wp_users import WordpressUserEnumerator
+from .joomla_manifest import fetch_manifest
+from .joomla_fingerprint import JoomlaFingerprinter, build_database, configure_fingerprints
 
 __all__ = [
     # Utils
@@ -40,6 +65,7 @@ __all__ = [
     'generate_random_string',
     'get_user_agent',
     'safe_request',
+    'fetch_partial',
     'extract_domain',
     'is_ip_address',
     'format_timestamp',
@@ -54,7 +80,56 @@ __all__ = [
     'WebScanner',
     'WordpressScanner',
     'JoomlaScanner',
+    'CMSDetector',
+    'ProbePlan',
+    'ProbeSession',
+    'run_plans',
+    'Soft404Detector',
+    'resolve_base_url',
+    'ContentDiscovery',
+    'Wordlist',
+    'BloomFilter',
+    'iter_wordlist',
+    'SubdomainScanner',
+    'VulnDatabase',
+    'get_vulndb',
+    'configure_vulndb',
+    'Enumerator',
+    'SlugEnumerator',
+    'WordpressEnumerator',
+    'JoomlaEnumerator',
+    'read_rest_namespaces',
+    'map_namespaces',
+    'WordpressUserEnumerator',
+    'fetch_manifest',
+    'JoomlaFingerprinter',
+    'build_database',
+    'configure_fingerprints',
     
     # Report Generator
-    'ReportGenerator'
+    'ReportGenerator',
+    
+    # Scheduling
+    'ConcurrencyGovernor',
+    'get_governor',
+    'configure_governor',
+    'CancellationToken',
+    'ScanCancelled',
+    'RateLimiter',
+    'get_rate_limiter',
+    'new_token',
+    'cancel_all',
+    'StageScheduler',
+    
+    # Batch Scanning
+    'BatchScanner',
+    'iter_targets',
+    'make_scan_function',
+    'ScanNode',
+    'ScanPipeline',
+    'build_pipeline',
+    'SCAN_PROFILES',
+    'TriageScanner',
+    'make_triage_function',
+    'plan_deep_scans'
 ]
\ No newline at end of file
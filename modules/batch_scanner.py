@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة الفحص الدفعي للأهداف المتعددة
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import sys
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from .utils import validate_url
+from .stage_scheduler import StageScheduler
+from .concurrency import new_token, shutdown_executor
+from .web_scanner import WebScanner
+from .wordpress_scanner import WordpressScanner
+from .joomla_scanner import JoomlaScanner
+from .cms_detector import CMSDetector, enumerator_for
+from .canonical import resolve_base_url
+from .enumerator import DEFAULT_RATE
+
+def iter_targets(source):
+    """قراءة الأهداف بشكل كسول من ملف أو من الإدخال القياسي (-)"""
+    if source == '-':
+        stream = sys.stdin
+        should_close = False
+    else:
+        stream = open(source, 'r', encoding='utf-8')
+        should_close = True
+
+    try:
+        for line in stream:
+            target = line.strip()
+
+            # تجاهل الأسطر الفارغة والتعليقات
+            if not target or target.startswith('#'):
+                continue
+
+            yield target
+    finally:
+        if should_close:
+            stream.close()
+
+def make_scan_function(scan_type='web', ports=None, timeout=30, verbose=False, deadline=None,
+                       wp_enumerate=0, joomla_enumerate=0, enum_budget=None, enum_rate=DEFAULT_RATE, discover=None):
+    """إنشاء دالة فحص لهدف واحد بدون واجهة عرض لاستخدامها في الفحص الدفعي
+
+    deadline: المهلة الكلية بالثواني لكل هدف؛ عند انتهائها تُعاد النتائج الجزئية مع truncated=True
+    wp_enumerate: عدد المعرفات الأكثر شعبية للتعداد النشط في ووردبريس (0 يعطله)
+    joomla_enumerate: عدد الامتدادات الأكثر شعبية للتعداد النشط في جوملا (0 يعطله)
+    discover: خيارات اكتشاف المحتوى في فحص الويب (معطيات WebScanner.discover_content؛ None يعطله)
+    """
+    def run_stages(scheduler):
+        results = scheduler.run()
+        if scheduler.truncated:
+            results['truncated'] = True
+        return results
+
+    def scan_web(url, cancel_token=None):
+        token = cancel_token or new_token(deadline)
+        url = resolve_base_url(url, timeout=timeout, cancel_token=token)
+        scanner = WebScanner(url, ports=ports, timeout=timeout, verbose=verbose, cancel_token=token)
+        scheduler = StageScheduler(verbose=verbose, cancel_token=token)
+        scheduler.add_stage('site_info', scanner.get_site_info)
+        scheduler.add_stage('technologies', scanner.detect_technologies)
+        scheduler.add_stage('vulnerabilities', scanner.scan_vulnerabilities)
+        scheduler.add_stage('open_ports', scanner.scan_ports)
+        if discover:
+            scheduler.add_stage('content', lambda: scanner.discover_content(**discover))
+        return run_stages(scheduler)
+
+    def scan_wordpress(url, cancel_token=None, session=None):
+        token = cancel_token or new_token(deadline)
+        # جلسة الكاشف الموروثة مبنية على العنوان الأساسي المحدد مسبقًا
+        url = session.url if session is not None else resolve_base_url(url, timeout=timeout, cancel_token=token)
+        scanner = WordpressScanner(url, timeout=timeout, verbose=verbose, cancel_token=token, session=session)
+        scheduler = StageScheduler(verbose=verbose, cancel_token=token)
+        scheduler.add_stage('wp_version', scanner.detect_version)
+        scheduler.add_stage('themes', scanner.enumerate_themes)
+        scheduler.add_stage('plugins', scanner.enumerate_plugins)
+        scheduler.add_stage('users', scanner.enumerate_users)
+        if wp_enumerate:
+            scheduler.add_stage(
+                'active_components',
+                lambda: scanner.enumerate_components_active(limit=wp_enumerate, time_budget=enum_budget,
+                                                           rate=enum_rate)
+            )
+        scheduler.add_stage(
+            'vulnerabilities',
+            lambda wp_version: scanner.scan_vulnerabilities(version=(wp_version or {}).get('version', '')),
+            depends_on=['wp_version']
+        )
+        return run_stages(scheduler)
+
+    def scan_joomla(url, cancel_token=None, session=None):
+        token = cancel_token or new_token(deadline)
+        url = session.url if session is not None else resolve_base_url(url, timeout=timeout, cancel_token=token)
+        scanner = JoomlaScanner(url, timeout=timeout, verbose=verbose, cancel_token=token, session=session)
+        scheduler = StageScheduler(verbose=verbose, cancel_token=token)
+        scheduler.add_stage('joomla_version', scanner.detect_version)
+        scheduler.add_stage('components', scanner.enumerate_components)
+        scheduler.add_stage('templates', scanner.enumerate_templates)
+        if joomla_enumerate:
+            scheduler.add_stage(
+                'active_extensions',
+                lambda: scanner.enumerate_extensions_active(limit=joomla_enumerate, time_budget=enum_budget,
+                                                            rate=enum_rate)
+            )
+        scheduler.add_stage(
+            'vulnerabilities',
+            lambda joomla_version, active_extensions=None: scanner.scan_vulnerabilities(
+                version=(joomla_version or {}).get('version', ''), extensions=active_extensions),
+            depends_on=['joomla_version'] + (['active_extensions'] if joomla_enumerate else [])
+        )
+        return run_stages(scheduler)
+
+    def scan_auto(url, cancel_token=None):
+        # طلب واحد لتصنيف نظام إدارة المحتوى ثم تسليم الهدف إلى الفاحص المناسب فقط
+        token = cancel_token or new_token(deadline)
+        url = resolve_base_url(url, timeout=timeout, cancel_token=token)
+        detector = CMSDetector(url, timeout=timeout, verbose=verbose, cancel_token=token)
+        detection = detector.detect()
+        scan_type = enumerator_for(detection['cms'])
+        if scan_type == 'web':
+            results = scan_web(url, cancel_token=token)
+        else:
+            # الفاحص المتخصص يرث جلسة الكاشف فلا تُطلب الصفحة الرئيسية ومسارات التحقق مرة أخرى
+            results = scan_functions[scan_type](url, cancel_token=token, session=detector.session)
+        results['cms_detection'] = detection
+        return results
+
+    scan_functions = {
+        'web': scan_web,
+        'wordpress': scan_wordpress,
+        'joomla': scan_joomla,
+        'auto': scan_auto,
+    }
+
+    if scan_type not in scan_functions:
+        raise ValueError(f"نوع الفحص غير معروف: {scan_type}")
+
+    return scan_functions[scan_type]
+
+def default_batch_output(output=None):
+    """تحديد اسم ملف نتائج الفحص الدفعي"""
+    if output:
+        return f"{output}.jsonl"
+    return f"jawal_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+
+class BatchScanner:
+    """فئة لفحص عدد كبير من الأهداف عبر مجموعة عمال محدودة مع ضغط عكسي"""
+
+    def __init__(self, scan_func, max_workers=10, output_file=None, queue_size=None, verbose=False, on_record=None):
+        """تهيئة الفاحص الدفعي؛ on_record تُستدعى مع سجل كل هدف فور كتابته"""
+        self.scan_func = scan_func
+        self.on_record = on_record
+        self.max_workers = max(1, max_workers)
+        # الحد الأقصى للأهداف المعلقة (قيد التنفيذ أو في الانتظار) في الذاكرة
+        self.queue_size = queue_size if queue_size else self.max_workers * 2
+        self.output_file = output_file
+        self.verbose = verbose
+        self.logger = logging.getLogger('jawal')
+
+        self._write_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._output = None
+        self.stats = {'total': 0, 'succeeded': 0, 'failed': 0, 'skipped': 0}
+
+    def run(self, targets):
+        """فحص جميع الأهداف وكتابة النتائج تدريجيًا بصيغة JSON Lines"""
+        self.logger.info(f"بدء الفحص الدفعي باستخدام {self.max_workers} عامل")
+
+        start_time = time.time()
+        slots = threading.BoundedSemaphore(self.queue_size)
+
+        self._open_output()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for target in self._valid_targets(targets):
+                # الضغط العكسي: لا نقرأ هدفًا جديدًا حتى يتوفر مكان في الطابور
+                slots.acquire()
+                try:
+                    future = executor.submit(self._scan_target, target)
+                except Exception:
+                    slots.release()
+                    raise
+                future.add_done_callback(lambda _: slots.release())
+            executor.shutdown(wait=True)
+        except BaseException:
+            # عند المقاطعة (Ctrl-C) لا ننتظر الأهداف الجارية
+            shutdown_executor(executor)
+            raise
+        finally:
+            self._close_output()
+
+        self.stats['duration'] = round(time.time() - start_time, 2)
+        self.logger.info(
+            f"اكتمل الفحص الدفعي: {self.stats['succeeded']} ناجح، "
+            f"{self.stats['failed']} فاشل، {self.stats['skipped']} متخطى"
+        )
+        return self.stats
+
+    def run_pipeline(self, pipeline, targets):
+        """تنفيذ مخطط فحص (ScanPipeline) على جميع الأهداف وكتابة سجل كل هدف فور اكتماله"""
+        self.logger.info(f"بدء الفحص الدفعي باستخدام مخطط من {len(pipeline.nodes)} عقدة")
+
+        start_time = time.time()
+
+        self._open_output()
+        try:
+            for record in pipeline.run(self._valid_targets(targets)):
+                self._increment('succeeded' if record['status'] == 'ok' else 'failed')
+                self._write_record(record)
+        finally:
+            self._close_output()
+
+        self.stats['duration'] = round(time.time() - start_time, 2)
+        self.logger.info(
+            f"اكتمل الفحص الدفعي: {self.stats['succeeded']} ناجح، "
+            f"{self.stats['failed']} فاشل، {self.stats['skipped']} متخطى"
+        )
+        return self.stats
+
+    def _valid_targets(self, targets):
+        """تمرير الأهداف الصالحة فقط وتسجيل الأهداف المتخطاة"""
+        for target in targets:
+            self._increment('total')
+
+            if not validate_url(target):
+                self.logger.warning(f"تم تخطي هدف غير صالح: {target}")
+                self._increment('skipped')
+                self._write_record({'target': target, 'status': 'skipped', 'error': 'عنوان URL غير صالح'})
+                continue
+
+            yield target
+
+    def _scan_target(self, target):
+        """فحص هدف واحد مع عزل الأخطاء حتى لا يتوقف الفحص الدفعي"""
+        start_time = time.time()
+
+        try:
+            if self.verbose:
+                self.logger.debug(f"جاري فحص الهدف: {target}")
+
+            results = self.scan_func(target)
+            truncated = results.pop('truncated', False) if isinstance(results, dict) else False
+            record = {
+                'target': target,
+                'status': 'ok',
+                'duration': round(time.time() - start_time, 2),
+                'truncated': truncated,
+                'results': results
+            }
+            self._increment('succeeded')
+        except Exception as e:
+            self.logger.error(f"خطأ في فحص الهدف {target}: {str(e)}")
+            record = {
+                'target': target,
+                'status': 'error',
+                'duration': round(time.time() - start_time, 2),
+                'error': str(e)
+            }
+            self._increment('failed')
+
+        self._write_record(record)
+        return record
+
+    def _increment(self, key):
+        """تحديث الإحصائيات بشكل آمن بين الخيوط"""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _open_output(self):
+        """فتح ملف الإخراج (أو الإخراج القياسي عند استخدام -)"""
+        if not self.output_file:
+            self._output = None
+        elif self.output_file == '-':
+            self._output = sys.stdout
+        else:
+            self._output = open(self.output_file, 'a', encoding='utf-8')
+
+    def _close_output(self):
+        """إغلاق ملف الإخراج"""
+        if self._output and self._output is not sys.stdout:
+            self._output.close()
+        self._output = None
+
+    def _write_record(self, record):
+        """كتابة نتيجة هدف واحد فور اكتمالها"""
+        with self._write_lock:
+            if self._output:
+                self._output.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+                self._output.flush()
+
+            if self.on_record:
+                try:
+                    self.on_record(record)
+                except Exception as e:
+                    self.logger.error(f"خطأ في معالجة سجل الهدف {record.get('target')}: {str(e)}")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة تحديد العنوان الأساسي النهائي للهدف بعد سلسلة إعادة التوجيه (مرة واحدة لكل هدف)
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import logging
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse, urlunparse
+from .utils import safe_request, get_user_agent
+
+# الحد الأقصى للأهداف المحفوظة في الذاكرة (الأقدم استخدامًا يُحذف أولًا في الفحص الدفعي)
+MAX_CACHED_TARGETS = 4096
+
+# (العنوان الأساسي، سلسلة التوجيه [(من، إلى، الحالة)]) لكل عنوان مُدخل
+_base_urls = OrderedDict()
+_base_urls_lock = threading.Lock()
+
+def canonical_base(url, final_url):
+    """العنوان الأساسي: بروتوكول ومضيف العنوان النهائي مع مسار العنوان المُدخل
+
+    يُعتمد المسار النهائي فقط إذا كان المسار نفسه بإضافة '/' (التوجيه إلى صفحة الدخول مثلًا لا يغير الأساس).
+    """
+    original, final = urlparse(url), urlparse(final_url)
+    path = original.path or '/'
+    if final.path == path + '/':
+        path = final.path
+    return urlunparse((final.scheme, final.netloc.lower(), path, '', original.query, ''))
+
+def resolve_base_url(url, timeout=30, cancel_token=None):
+    """تتبع سلسلة إعادة التوجيه مرة واحدة وإرجاع العنوان الأساسي النهائي (المحفوظ) للهدف
+
+    يُستخدم HEAD أولًا ثم GET إذا لم يدعمه الخادم؛ عند الفشل يُعاد العنوان المُدخل كما هو.
+    """
+    with _base_urls_lock:
+        if url in _base_urls:
+            _base_urls.move_to_end(url)
+            return _base_urls[url][0]
+
+    base, chain = url, []
+    headers = {'User-Agent': get_user_agent()}
+    for method in ('HEAD', 'GET'):
+        response = safe_request(url, method=method, headers=headers, timeout=timeout, max_retries=1,
+                                cancel_token=cancel_token, stream=method == 'GET')
+        if response is None or response.status_code in (405, 501):
+            continue
+
+        response.close()
+        chain = [(hop.url, hop.headers.get('Location', ''), hop.status_code) for hop in response.history]
+        if chain:
+            base = canonical_base(url, response.url)
+        break
+    else:
+        # تعذر الوصول: لا يُحفظ شيء حتى يُعاد المحاولة في الفحص التالي
+        return url
+
+    if chain:
+        logging.getLogger('jawal').info(f"العنوان الأساسي النهائي للهدف {url}: {base} ({len(chain)} إعادة توجيه)")
+
+    with _base_urls_lock:
+        _base_urls[url] = (base, chain)
+        _base_urls[base] = (base, [])
+        while len(_base_urls) > MAX_CACHED_TARGETS:
+            _base_urls.popitem(last=False)
+
+    return base
+
+def redirect_chain(url):
+    """سلسلة إعادة التوجيه المسجلة لعنوان مُدخل ([] إذا لم يُحدد بعد أو لم يُوجَّه)"""
+    with _base_urls_lock:
+        return list(_base_urls.get(url, (url, []))[1])
+
+def clear_base_urls():
+    """مسح العناوين المحفوظة"""
+    with _base_urls_lock:
+        _base_urls.clear()
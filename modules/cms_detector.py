@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة الكشف التلقائي عن نظام إدارة المحتوى
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import re
+import logging
+from .utils import extract_domain
+from .cms_probe import ProbePlan, ProbeSession
+
+# توقيعات أنظمة إدارة المحتوى: (نمط، وزن) لكل مصدر من مصادر الإشارات في الصفحة الرئيسية
+CMS_SIGNATURES = {
+    'wordpress': {
+        'body': [(r'/wp-content/', 30), (r'/wp-includes/', 30), (r'/wp-json/', 20), (r'wp-emoji-release', 20)],
+        'headers': [(r'<[^>]*/wp-json/>;\s*rel="https://api\.w\.org/"', 40), (r'x-pingback:.*xmlrpc\.php', 30)],
+        'cookies': [(r'^wordpress_', 30), (r'^wp-settings-', 30)],
+        'generator': r'wordpress\s*([\d.]+)?',
+    },
+    'joomla': {
+        'body': [(r'/media/jui/', 30), (r'/media/system/js/', 20), (r'option=com_', 20), (r'Joomla!', 20)],
+        'headers': [(r'x-content-encoded-by:\s*joomla', 50)],
+        'cookies': [(r'^[0-9a-f]{32}$', 10)],
+        'generator': r'joomla!?\s*([\d.]+)?',
+    },
+    'drupal': {
+        'body': [(r'/sites/(?:default|all)/(?:files|modules|themes)/', 30), (r'Drupal\.settings', 30),
+                 (r'data-drupal-', 30), (r'/core/misc/drupal\.js', 30)],
+        'headers': [(r'x-drupal-(?:cache|dynamic-cache)', 50), (r'x-generator:\s*drupal', 60)],
+        'cookies': [(r'^S?SESS[0-9a-f]{32}$', 20)],
+        'generator': r'drupal\s*([\d.]+)?',
+    },
+    'magento': {
+        'body': [(r'/static/version\d+/frontend/', 40), (r'Mage\.Cookies', 30), (r'/skin/frontend/', 30),
+                 (r'data-mage-init', 30)],
+        'headers': [(r'x-magento-', 50)],
+        'cookies': [(r'^frontend$', 20), (r'^mage-', 30)],
+        'generator': r'magento\s*([\d.]+)?',
+    },
+    'shopify': {
+        'body': [(r'cdn\.shopify\.com', 40), (r'Shopify\.theme', 30)],
+        'headers': [(r'x-shopid:', 50), (r'x-shopify-stage:', 50)],
+        'cookies': [(r'^_shopify_', 30)],
+        'generator': r'shopify',
+    },
+    'ghost': {
+        'body': [(r'/ghost/api/', 30), (r'content="Ghost', 30)],
+        'headers': [(r'x-ghost-cache-status:', 50)],
+        'cookies': [(r'^ghost-', 30)],
+        'generator': r'ghost\s*([\d.]+)?',
+    },
+}
+
+# مسارات التحقق الإضافية التي لا تُطلب إلا عند غموض الإشارات الأولى
+CMS_PROBES = {
+    'wordpress': [('/wp-includes/js/wp-embed.min.js', 40), ('/wp-login.php', 30)],
+    'joomla': [('/administrator/manifests/files/joomla.xml', 60), ('/media/system/js/core.js', 30)],
+    'drupal': [('/core/misc/drupal.js', 50), ('/misc/drupal.js', 50)],
+    'magento': [('/static/deployed_version.txt', 50), ('/js/mage/cookies.js', 50)],
+    'ghost': [('/ghost/api/admin/site/', 60)],
+}
+
+# الفاحصات المتخصصة المتاحة لكل نظام (الأنظمة الأخرى تُفحص كموقع ويب عام)
+CMS_ENUMERATORS = {
+    'wordpress': 'wordpress',
+    'joomla': 'joomla',
+}
+
+# درجة الثقة التي لا حاجة بعدها لطلبات إضافية
+CONFIDENT_SCORE = 60
+
+# الفارق الأدنى بين المرشحَين الأولين لاعتبار النتيجة غير غامضة
+AMBIGUITY_MARGIN = 20
+
+_META_GENERATOR = re.compile(r'<meta[^>]+name=["\']generator["\'][^>]*content=["\']([^"\']+)', re.I)
+_META_GENERATOR_REVERSED = re.compile(r'<meta[^>]+content=["\']([^"\']+)["\'][^>]*name=["\']generator["\']', re.I)
+
+def _compile_signatures(signatures):
+    """تجميع أنماط التوقيعات مرة واحدة عند تحميل الوحدة"""
+    compiled = {}
+    for cms, signature in signatures.items():
+        compiled[cms] = {
+            source: [(re.compile(pattern, re.I), weight) for pattern, weight in signature[source]]
+            for source in ['body', 'headers', 'cookies']
+        }
+        compiled[cms]['generator'] = re.compile(signature['generator'], re.I)
+    return compiled
+
+_COMPILED_SIGNATURES = _compile_signatures(CMS_SIGNATURES)
+
+class CMSDetector:
+    """فئة لتصنيف نظام إدارة المحتوى من طلب واحد للصفحة الرئيسية مع طلبات إضافية عند الغموض فقط"""
+
+    def __init__(self, url, timeout=30, verbose=False, cancel_token=None, session=None):
+        """تهيئة كاشف نظام إدارة المحتوى؛ جلسة الفحص (session) تُسلَّم لاحقًا للفاحص المتخصص"""
+        self.url = url
+        self.domain = extract_domain(url)
+        self.timeout = timeout
+        self.verbose = verbose
+        self.cancel_token = cancel_token
+        self.session = session or ProbeSession(url, timeout=timeout, cancel_token=cancel_token)
+        self.logger = logging.getLogger('jawal')
+
+    def detect(self, response=None):
+        """تصنيف الموقع وإرجاع النظام الأرجح مع الدرجات والأدلة (يمكن تمرير استجابة الصفحة الرئيسية)"""
+        self.logger.info(f"جاري الكشف عن نظام إدارة المحتوى في الموقع: {self.url}")
+
+        if response is None:
+            response = self.session.homepage()
+        else:
+            # الفاحص المتخصص الذي يرث الجلسة لا يطلب الصفحة الرئيسية مرة أخرى
+            self.session.seed('', response)
+
+        result = {'cms': None, 'version': None, 'confidence': 0, 'scores': {}, 'evidence': {}, 'probed': False}
+        if response is None:
+            return result
+
+        scores, evidence, versions = self.score_response(response)
+
+        # طلبات إضافية فقط عندما لا تكفي إشارات الصفحة الرئيسية للحسم
+        candidates = self._ambiguous_candidates(scores)
+        if candidates:
+            result['probed'] = True
+            self._probe(candidates, scores, evidence)
+
+        if scores:
+            cms = max(scores, key=scores.get)
+            result.update({
+                'cms': cms,
+                'version': versions.get(cms),
+                'confidence': min(scores[cms], 100),
+            })
+
+        result['scores'] = scores
+        result['evidence'] = evidence
+
+        if self.verbose:
+            self.logger.debug(f"درجات أنظمة إدارة المحتوى: {scores}")
+
+        return result
+
+    def score_response(self, response):
+        """حساب درجة كل نظام من محتوى الاستجابة ورؤوسها وملفات تعريف الارتباط ووسم generator"""
+        scores = {}
+        evidence = {}
+        versions = {}
+
+        body = response.text or ''
+        header_lines = '\n'.join(f"{name}: {value}" for name, value in response.headers.items())
+        cookie_names = [cookie.name for cookie in response.cookies]
+        generators = [match.group(1) for match in _META_GENERATOR.finditer(body)]
+        generators += [match.group(1) for match in _META_GENERATOR_REVERSED.finditer(body)]
+        generators += [response.headers.get(name, '') for name in ['X-Generator', 'Generator'] if name in response.headers]
+
+        def add(cms, weight, proof):
+            scores[cms] = scores.get(cms, 0) + weight
+            evidence.setdefault(cms, []).append(proof)
+
+        for cms, signature in _COMPILED_SIGNATURES.items():
+            for pattern, weight in signature['body']:
+                if pattern.search(body):
+                    add(cms, weight, f"body: {pattern.pattern}")
+
+            for pattern, weight in signature['headers']:
+                if pattern.search(header_lines):
+                    add(cms, weight, f"header: {pattern.pattern}")
+
+            for pattern, weight in signature['cookies']:
+                matched = next((name for name in cookie_names if pattern.search(name)), None)
+                if matched:
+                    add(cms, weight, f"cookie: {matched}")
+
+            # وسم generator حاسم عادة ويتضمن الإصدار أحيانًا
+            for generator in generators:
+                match = signature['generator'].search(generator)
+                if match:
+                    add(cms, 100, f"generator: {generator}")
+                    if match.groups() and match.group(1):
+                        versions[cms] = match.group(1)
+                    break
+
+        return scores, evidence, versions
+
+    def _ambiguous_candidates(self, scores):
+        """تحديد المرشحين الذين يحتاجون إلى طلبات إضافية (فارغة إذا كانت النتيجة محسومة)"""
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        if not ranked:
+            return []
+
+        top = scores[ranked[0]]
+        runner_up = scores[ranked[1]] if len(ranked) > 1 else 0
+        if top >= CONFIDENT_SCORE and top - runner_up >= AMBIGUITY_MARGIN:
+            return []
+
+        return [cms for cms in ranked[:2] if cms in CMS_PROBES]
+
+    def _probe(self, candidates, scores, evidence):
+        """فحص مسارات مميزة للمرشحين بالتوازي وإضافة أوزانها إلى الدرجات (تبقى استجاباتها في الجلسة للفاحص)"""
+        plan = ProbePlan('cms-probes', [
+            # استجابة 200 لا تطابق صفحة الخطأ المعايرة فقط
+            {'name': cms, 'path': path, 'weight': weight, 'exists': True, 'status': 200, 'evidence': 'path: {path}'}
+            for cms in candidates
+            for path, weight in CMS_PROBES[cms]
+        ])
+
+        for check, proof in self.session.run(plan):
+            if proof:
+                scores[check['name']] = scores.get(check['name'], 0) + check['weight']
+                evidence.setdefault(check['name'], []).append(proof)
+
+def enumerator_for(cms):
+    """اسم نوع الفحص المتخصص لنظام إدارة المحتوى ('web' إذا لم يوجد فاحص متخصص)"""
+    return CMS_ENUMERATORS.get(cms, 'web')
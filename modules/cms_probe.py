@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - محرك فحص مسارات أنظمة إدارة المحتوى بخطط تصريحية وطلبات غير مكررة لكل هدف
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import re
+import logging
+import threading
+from concurrent.futures import Future, as_completed
+from urllib.parse import urljoin
+from .utils import safe_request, extract_domain
+from .concurrency import get_governor
+from .soft404 import Soft404Detector, path_shape
+
+class ProbePlan:
+    """خطة فحص تصريحية: قائمة فحوص لكل منها مسار وشرط (نمط أو حالة أو دالة مخصصة)
+
+    كل فحص قاموس بالحقول: name، path، وواحد من pattern (تعبير منتظم في المحتوى)،
+    exists (استجابة غير 404 لا تطابق صفحة الخطأ المعايرة، ومع status حالة محددة فقط)
+    أو match (دالة تأخذ الاستجابة وتعيد الدليل أو None)، مع حقول وصفية اختيارية
+    مثل severity و description و evidence (قالب بالحقلين {path} و {status}).
+    """
+
+    def __init__(self, name, checks=None):
+        """تهيئة الخطة باسم (يُستخدم لتمييز نتائجها عند الدمج) وقائمة فحوص"""
+        self.name = name
+        self.checks = [dict(check, plan=name) for check in checks or []]
+
+    def paths(self):
+        """المسارات الفريدة التي تحتاجها الخطة بترتيب ظهورها"""
+        return list(dict.fromkeys(check['path'] for check in self.checks))
+
+    def __add__(self, other):
+        """دمج خطتين؛ المسارات المشتركة تُطلب مرة واحدة عند التنفيذ"""
+        merged = ProbePlan(f"{self.name}+{other.name}")
+        merged.checks = self.checks + other.checks
+        return merged
+
+    def __len__(self):
+        return len(self.checks)
+
+def merge_plans(*plans):
+    """دمج عدة خطط (من وحدات أنظمة إدارة محتوى مختلفة) في خطة واحدة"""
+    merged = plans[0]
+    for plan in plans[1:]:
+        merged = merged + plan
+    return merged
+
+def evaluate(check, response, soft404=None):
+    """تقييم فحص واحد على استجابة وإرجاع الدليل النصي (None إذا لم يتحقق الشرط)
+
+    soft404 كاشف صفحات الخطأ المخصصة للهدف؛ بدونه تُعد أي استجابة غير 404 دليل وجود.
+    """
+    if response is None:
+        return None
+
+    if check.get('match'):
+        return check['match'](response)
+
+    if check.get('pattern'):
+        match = re.search(check['pattern'], response.text)
+        if not match:
+            return None
+        evidence = match.group(1) if match.groups() else check['pattern']
+        return f'تم العثور على "{evidence}" في {check["path"]}'
+
+    if check.get('exists'):
+        if response.status_code == 404 or (check.get('status') and response.status_code != check['status']):
+            return None
+        # المواقع التي تجيب على كل المسارات (200 أو توجيه) لا تثبت وجود المسار
+        if soft404 is not None and soft404.is_soft404(check['path'], response):
+            return None
+        template = check.get('evidence') or 'المسار {path} متاح (رمز الحالة: {status})'
+        return template.format(path=check['path'], status=response.status_code)
+
+    return None
+
+class ProbeSession:
+    """ذاكرة استجابات لهدف واحد: كل مسار يُطلب مرة واحدة مهما تعددت الخطط والفاحصات التي تحتاجه
+
+    الطلبات الجارية مشتركة أيضًا، فطلبان متزامنان للمسار نفسه ينتظران الاستجابة ذاتها.
+    """
+
+    def __init__(self, url, timeout=30, cancel_token=None):
+        """تهيئة الجلسة لعنوان أساسي"""
+        self.url = url
+        self.domain = extract_domain(url)
+        self.timeout = timeout
+        self.cancel_token = cancel_token
+        self.logger = logging.getLogger('jawal')
+
+        self._lock = threading.Lock()
+        # المسار -> Future للاستجابة ('' للصفحة الرئيسية)
+        self._responses = {}
+        # المسار -> وجهة التوجيه للمسارات التي أجابت بإعادة توجيه
+        self.redirects = {}
+
+        # معايرة صفحات الخطأ تحدث عند أول استجابة غير 404 لكل شكل مسار فقط
+        self.soft404 = Soft404Detector(self._calibration_request, submit=self._submit)
+
+    def fetch(self, path):
+        """طلب مسار عبر طابور المضيف (أو إعادة الطلب الجاري أو المكتمل له) وإرجاع Future"""
+        with self._lock:
+            future = self._responses.get(path)
+            if future is None:
+                future = get_governor().submit_for_host(self.domain, 'http', self._request, path)
+                self._responses[path] = future
+            return future
+
+    def get(self, path):
+        """الاستجابة لمسار (None عند الفشل)؛ لا تُستدعى من داخل مهام طابور المضيف نفسه"""
+        future = self.fetch(path)
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"خطأ في طلب {path}: {str(e)}")
+            return None
+
+    def homepage(self):
+        """استجابة الصفحة الرئيسية المشتركة"""
+        return self.get('')
+
+    def seed(self, path, response):
+        """تخزين استجابة جُلبت خارج الجلسة (مثل الصفحة الرئيسية من مرحلة سابقة) حتى لا يُطلب المسار مرة أخرى"""
+        future = Future()
+        future.set_result(response)
+        with self._lock:
+            self._responses.setdefault(path, future)
+
+    def run(self, plan):
+        """تنفيذ خطة دفعة واحدة: إرسال كل المسارات الفريدة معًا وإرجاع (الفحص، الدليل) فور اكتمال كل مسار
+
+        يمكن للمستدعي التوقف مبكرًا؛ الطلبات المتبقية تكتمل في الخلفية وتبقى في الذاكرة لبقية المراحل.
+        """
+        checks_by_path = {}
+        for check in plan.checks:
+            checks_by_path.setdefault(check['path'], []).append(check)
+
+        # معايرة أشكال المسارات المطلوبة تسبق مسارات الخطة في طابور المضيف (مرة واحدة لكل هدف)
+        self.soft404.prefetch({path_shape(check['path']) for check in plan.checks if check.get('exists')})
+
+        futures = {self.fetch(path): path for path in checks_by_path}
+        for future in as_completed(futures):
+            response = None if future.cancelled() else future.result()
+            for check in checks_by_path[futures[future]]:
+                yield check, evaluate(check, response, self.soft404)
+
+    def findings(self, plan):
+        """نتائج الفحوص المتحققة في الخطة بصيغة نتائج الفحص (الاسم والخطورة والوصف والدليل)"""
+        results = []
+        for check, evidence in self.run(plan):
+            if evidence:
+                results.append({
+                    'name': check['name'],
+                    'severity': check.get('severity', 'منخفضة'),
+                    'description': check.get('description', ''),
+                    'evidence': evidence
+                })
+        return results
+
+    @property
+    def requested(self):
+        """عدد المسارات التي طُلبت فعليًا من الهدف"""
+        with self._lock:
+            return len(self._responses)
+
+    def _submit(self, path):
+        """إرسال طلب مسار عشوائي للمعايرة عبر طابور المضيف دون تخزينه"""
+        return get_governor().submit_for_host(self.domain, 'http', self._request, path)
+
+    def _calibration_request(self, path):
+        """طلب مسار عشوائي للمعايرة وانتظار استجابته"""
+        return self._submit(path).result()
+
+    def _request(self, path):
+        """طلب مسار واحد مع احترام رمز الإلغاء؛ توجيه المسارات يُسجل ولا يُتبع (الصفحة الرئيسية فقط تتبعه)"""
+        if not path:
+            return safe_request(self.url, timeout=self.timeout, cancel_token=self.cancel_token)
+
+        response = safe_request(urljoin(self.url, path), timeout=self.timeout, allow_redirects=False,
+                                cancel_token=self.cancel_token)
+        if response is not None and response.is_redirect:
+            with self._lock:
+                self.redirects[path] = response.headers.get('Location', '')
+        return response
+
+def homepage_plan(name, indicators):
+    """خطة بفحص واحد للصفحة الرئيسية يؤكد النظام وحده إذا أعادت دالة العلامات True"""
+    return ProbePlan(name, [{
+        'name': 'الصفحة الرئيسية',
+        'path': '',
+        'match': lambda response: 'علامات في الصفحة الرئيسية' if indicators(response) else None,
+        'confirms': True,
+    }])
+
+def confirm(session, plan, threshold=3, verbose=False):
+    """تنفيذ خطة تحقق والخروج فور تحقق فحص حاسم أو بلوغ {threshold} من الفحوص الأخرى"""
+    logger = logging.getLogger('jawal')
+    found = 0
+
+    for check, evidence in session.run(plan):
+        if not evidence:
+            continue
+        if check.get('confirms'):
+            return True
+
+        found += 1
+        if verbose:
+            logger.debug(f"تم العثور على المسار: {check['path']}")
+        if found >= threshold:
+            return True
+
+    return False
+
+def run_plans(session, plans):
+    """تنفيذ عدة خطط على هدف واحد كدفعة مدمجة وإرجاع نتائج كل خطة باسمها
+
+    التكلفة هي اتحاد المسارات المطلوبة لا مجموعها.
+    """
+    results = {plan.name: [] for plan in plans}
+    for check, evidence in session.run(merge_plans(*plans)):
+        results[check['plan']].append((check, evidence))
+    return results
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة التحكم في التوازي على مستوى العملية
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, CancelledError
+
+# الميزانيات الافتراضية لكل فئة من الموارد
+DEFAULT_BUDGETS = {
+    'http': 32,                       # طلبات HTTP
+    'socket': 64,                     # اتصالات المقابس المباشرة (فحص المنافذ)
+    'cpu': max(2, os.cpu_count() or 2),  # تحليل المحتوى (HTML/XML/JSON)
+}
+
+# الحد الافتراضي للمهام المتزامنة لكل مضيف
+DEFAULT_HOST_LIMIT = 8
+
+# الفاصل الزمني (بالثواني) لفحص رموز الإلغاء أثناء انتظار المهام
+CANCEL_POLL_INTERVAL = 0.2
+
+class ScanCancelled(Exception):
+    """استثناء يشير إلى إلغاء الفحص أو انتهاء المهلة الزمنية المخصصة له"""
+
+class CancellationToken:
+    """رمز إلغاء تعاوني مع مهلة زمنية اختيارية يرث الإلغاء من رمز أب"""
+
+    def __init__(self, deadline=None, parent=None):
+        """تهيئة الرمز؛ deadline هي المهلة بالثواني من لحظة الإنشاء"""
+        self._event = threading.Event()
+        self.parent = parent
+        self.deadline_at = time.monotonic() + deadline if deadline else None
+
+    def cancel(self):
+        """إلغاء جميع الأعمال المرتبطة بهذا الرمز"""
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """هل تم الإلغاء أو انتهت المهلة (لهذا الرمز أو لأحد آبائه)"""
+        if self._event.is_set():
+            return True
+        if self.deadline_at is not None and time.monotonic() >= self.deadline_at:
+            return True
+        return self.parent.cancelled if self.parent is not None else False
+
+    def remaining(self):
+        """الوقت المتبقي بالثواني قبل انتهاء المهلة (None إذا لم تكن هناك مهلة)"""
+        if self.cancelled:
+            return 0
+        remaining = None
+        if self.deadline_at is not None:
+            remaining = max(0, self.deadline_at - time.monotonic())
+        if self.parent is not None:
+            parent_remaining = self.parent.remaining()
+            if parent_remaining is not None:
+                remaining = parent_remaining if remaining is None else min(remaining, parent_remaining)
+        return remaining
+
+    def clamp_timeout(self, timeout):
+        """تقليص مهلة عملية واحدة بحيث لا تتجاوز الوقت المتبقي"""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return min(timeout, remaining) if timeout else remaining
+
+    def raise_if_cancelled(self):
+        """إطلاق ScanCancelled إذا تم الإلغاء"""
+        if self.cancelled:
+            raise ScanCancelled()
+
+# رمز الإلغاء الجذري للعملية (يُلغى عند Ctrl-C)
+_root_token = CancellationToken()
+
+def get_root_token():
+    """الحصول على رمز الإلغاء الجذري للعملية"""
+    return _root_token
+
+def new_token(deadline=None, parent=None):
+    """إنشاء رمز إلغاء فرعي (افتراضيًا تابع للرمز الجذري)"""
+    return CancellationToken(deadline=deadline, parent=parent if parent is not None else _root_token)
+
+def shutdown_executor(executor):
+    """إيقاف منفذ دون انتظار المهام الجارية مع إلغاء المهام المعلقة"""
+    try:
+        executor.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # Python < 3.9 لا يدعم cancel_futures
+        executor.shutdown(wait=False)
+
+# ملاحظة: المهام المرسلة عبر المتحكم يجب ألا تنتظر مهامًا أخرى من نفس الفئة لتجنب
+# الاستنزاف؛ يمكن لمهام http وsocket انتظار مهام cpu فقط لأن مهام cpu لا تنتظر شيئًا.
+class ConcurrencyGovernor:
+    """فئة تدير منفذًا واحدًا طويل العمر مع ميزانيات توازي مسماة لكل فئة موارد"""
+
+    def __init__(self, budgets=None):
+        """تهيئة المتحكم بالميزانيات المحددة"""
+        self.logger = logging.getLogger('jawal')
+        self.budgets = dict(DEFAULT_BUDGETS)
+        self.budgets.update(budgets or {})
+        self.host_limit = int(self.budgets.pop('host', DEFAULT_HOST_LIMIT))
+
+        for resource, limit in self.budgets.items():
+            if int(limit) < 1:
+                raise ValueError(f"ميزانية غير صالحة للمورد {resource}: {limit}")
+
+        self._semaphores = {
+            resource: threading.BoundedSemaphore(int(limit))
+            for resource, limit in self.budgets.items()
+        }
+
+        # عدد الخيوط يساوي مجموع الميزانيات، لذا تحصل كل مهمة مقبولة على خيط فورًا
+        self._executor = ThreadPoolExecutor(
+            max_workers=sum(int(limit) for limit in self.budgets.values()),
+            thread_name_prefix='jawal'
+        )
+
+        # طوابير المهام لكل مضيف وترتيب الخدمة الدوري بينها
+        self._host_lock = threading.Lock()
+        self._host_queues = {}
+        self._host_inflight = {}
+        self._host_order = deque()
+
+    def submit(self, resource, fn, *args, **kwargs):
+        """إرسال مهمة ضمن ميزانية مورد محدد (ينتظر المرسل حتى تتوفر سعة)"""
+        if resource not in self._semaphores:
+            raise ValueError(f"فئة مورد غير معروفة: {resource}")
+
+        semaphore = self._semaphores[resource]
+        semaphore.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            semaphore.release()
+            raise
+
+        future.add_done_callback(lambda _: self._release(semaphore))
+        return future
+
+    def _release(self, semaphore):
+        """تحرير سعة المورد ثم خدمة طوابير المضيفين التي قد تنتظر هذه السعة"""
+        semaphore.release()
+        if self._host_order:
+            self._dispatch()
+
+    def submit_for_host(self, host, resource, fn, *args, **kwargs):
+        """إضافة مهمة إلى طابور المضيف دون انتظار؛ تُخدم الطوابير بالتناوب مع حد لكل مضيف"""
+        if resource not in self._semaphores:
+            raise ValueError(f"فئة مورد غير معروفة: {resource}")
+
+        future = Future()
+        with self._host_lock:
+            if host not in self._host_queues:
+                self._host_queues[host] = deque()
+                self._host_inflight.setdefault(host, 0)
+                self._host_order.append(host)
+            self._host_queues[host].append((resource, fn, args, kwargs, future))
+
+        self._dispatch()
+        return future
+
+    def map(self, resource, fn, items, host=None):
+        """إرسال دالة لكل عنصر وإرجاع قائمة المهام بنفس الترتيب (عبر طابور المضيف إن حُدد)"""
+        if host is not None:
+            return [self.submit_for_host(host, resource, fn, item) for item in items]
+        return [self.submit(resource, fn, item) for item in items]
+
+    def _dispatch(self):
+        """نقل المهام من طوابير المضيفين إلى المنفذ بالتناوب حسب السعة المتاحة"""
+        to_start = []
+
+        with self._host_lock:
+            idle_turns = 0
+            while self._host_order and idle_turns < len(self._host_order):
+                host = self._host_order.popleft()
+                queue = self._host_queues[host]
+
+                dispatched = False
+                if queue and self._host_inflight[host] < self.host_limit:
+                    resource, fn, args, kwargs, future = queue[0]
+                    semaphore = self._semaphores[resource]
+                    if semaphore.acquire(blocking=False):
+                        queue.popleft()
+                        if future.set_running_or_notify_cancel():
+                            self._host_inflight[host] += 1
+                            to_start.append((host, semaphore, fn, args, kwargs, future))
+                        else:
+                            semaphore.release()
+                        dispatched = True
+
+                if queue:
+                    self._host_order.append(host)
+                else:
+                    # لا توجد مهام معلقة: نحذف الطابور ونبقي عداد المهام الجارية فقط
+                    del self._host_queues[host]
+                    if not self._host_inflight[host]:
+                        del self._host_inflight[host]
+
+                idle_turns = 0 if dispatched else idle_turns + 1
+
+        # التشغيل خارج القفل لأن اكتمال المهمة قد يستدعي _dispatch مرة أخرى
+        for task in to_start:
+            self._start_host_task(*task)
+
+    def _finish_host_task(self, host, semaphore):
+        """تحرير سعة المورد والمضيف بعد انتهاء مهمة"""
+        semaphore.release()
+        with self._host_lock:
+            self._host_inflight[host] -= 1
+            if not self._host_inflight[host] and host not in self._host_queues:
+                del self._host_inflight[host]
+
+    def _start_host_task(self, host, semaphore, fn, args, kwargs, future):
+        """تشغيل مهمة مضيف على المنفذ وربط نتيجتها بالمهمة الخارجية"""
+        def on_done(inner):
+            self._finish_host_task(host, semaphore)
+
+            if inner.cancelled():
+                future.set_exception(CancelledError())
+            elif inner.exception() is not None:
+                future.set_exception(inner.exception())
+            else:
+                future.set_result(inner.result())
+
+            self._dispatch()
+
+        try:
+            inner = self._executor.submit(fn, *args, **kwargs)
+        except Exception as e:
+            self._finish_host_task(host, semaphore)
+            future.set_exception(e)
+            return
+
+        inner.add_done_callback(on_done)
+
+    def run(self, resource, fn, *args, **kwargs):
+        """تنفيذ مهمة ضمن ميزانية مورد وانتظار نتيجتها"""
+        return self.submit(resource, fn, *args, **kwargs).result()
+
+    def shutdown(self, wait=True):
+        """إيقاف المنفذ"""
+        self._executor.shutdown(wait=wait)
+
+    def cancel_all(self):
+        """إلغاء جميع المهام المعلقة في طوابير المضيفين وفي المنفذ دون انتظار المهام الجارية"""
+        with self._host_lock:
+            pending = [task for queue in self._host_queues.values() for task in queue]
+            self._host_queues.clear()
+            self._host_order.clear()
+
+        for _, _, _, _, future in pending:
+            future.cancel()
+
+        shutdown_executor(self._executor)
+
+class RateLimiter:
+    """محدد معدل بخوارزمية دلو الرموز (token bucket) آمن بين الخيوط"""
+
+    def __init__(self, rate, burst=None):
+        """تهيئة المحدد؛ rate هو عدد الطلبات في الثانية و burst هو أقصى دفعة فورية"""
+        if rate <= 0:
+            raise ValueError(f"معدل غير صالح: {rate}")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst else max(1, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel_token=None):
+        """انتظار رمز واحد؛ تعيد False إذا تم الإلغاء قبل توفره"""
+        token = cancel_token or _root_token
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait_time = (1 - self._tokens) / self.rate
+
+            if token.cancelled:
+                return False
+            time.sleep(min(wait_time, CANCEL_POLL_INTERVAL))
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(host, rate, burst=None):
+    """الحصول على محدد المعدل المشترك لمضيف بمعدل محدد (يتشاركه كل الفاحصات التي تطلب المعدل نفسه)
+
+    المحدد مفتاحه (المضيف، المعدل)، فلا يستبدل فاحص بمعدل مختلف دلو غيره بدلو ممتلئ جديد.
+    """
+    key = (host, float(rate))
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(rate, burst)
+            _rate_limiters[key] = limiter
+        return limiter
+
+_governor = None
+_governor_lock = threading.Lock()
+
+def get_governor():
+    """الحصول على متحكم التوازي المشترك على مستوى العملية (يُنشأ عند أول استخدام)"""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = ConcurrencyGovernor()
+        return _governor
+
+def configure_governor(budgets=None):
+    """إعادة تهيئة المتحكم المشترك بميزانيات جديدة"""
+    global _governor
+    with _governor_lock:
+        previous = _governor
+        _governor = ConcurrencyGovernor(budgets)
+
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+    return _governor
+
+def parse_budgets(spec):
+    """تحليل مواصفات الميزانيات (مثال: http=64,socket=256,cpu=4,host=8)"""
+    budgets = {}
+    if not spec:
+        return budgets
+
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        if '=' not in part:
+            raise ValueError(f"صيغة ميزانية غير صالحة: {part}")
+
+        resource, limit = part.split('=', 1)
+        resource = resource.strip().lower()
+        if resource not in DEFAULT_BUDGETS and resource != 'host':
+            raise ValueError(f"فئة مورد غير معروفة: {resource}")
+
+        budgets[resource] = int(limit.strip())
+        if budgets[resource] < 1:
+            raise ValueError(f"ميزانية غير صالحة للمورد {resource}: {limit}")
+
+    return budgets
+
+def cancel_all():
+    """إلغاء جميع أعمال الفحص في العملية (يُستدعى عند Ctrl-C)"""
+    _root_token.cancel()
+    with _governor_lock:
+        governor = _governor
+    if governor is not None:
+        governor.cancel_all()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة اكتشاف المحتوى (المجلدات والملفات) من قائمة كلمات مع توسيع الامتدادات
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import time
+from collections import deque
+from urllib.parse import urljoin, urlparse, urlunparse
+from .vulndb import DATA_DIR
+from .soft404 import response_length
+from .enumerator import Enumerator
+from .wordlist import iter_wordlist
+
+# قائمة الكلمات المضمنة (المسارات الأكثر شيوعًا)
+DEFAULT_WORDLIST = os.path.join(DATA_DIR, 'content_paths.txt')
+
+# الإعدادات الافتراضية: الطلبات في الثانية لكل مضيف وعدد الطلبات المعلقة في آن واحد
+DEFAULT_DISCOVERY_RATE = 50
+DEFAULT_DISCOVERY_CONCURRENCY = 32
+
+# الحالات التي تعني وجود المسار (بعد استبعاد صفحات الخطأ المعايرة)
+HIT_STATUSES = (200, 204, 206, 401, 403)
+
+def expand(words, extensions=()):
+    """توليد (الاسم، الامتداد) لكل كلمة: الكلمة كما هي ثم بكل امتداد إن لم يكن لها امتداد"""
+    for word in words:
+        word = word.strip('/')
+        if not word:
+            continue
+        stem, ext = os.path.splitext(word)
+        if ext:
+            yield stem, ext
+            continue
+        yield word, ''
+        for extension in extensions:
+            yield word, f".{extension}"
+
+class ContentDiscovery(Enumerator):
+    """فئة لاكتشاف المسارات بطلبات متوازية على اتصالات دائمة مع معايرة صفحات الخطأ لكل مجلد وامتداد
+
+    النوع هنا هو (المجلد، الامتداد)، فتُعاير صفحة الخطأ مرة واحدة لكل زوج وتُستبعد المطابقة لها.
+    """
+
+    HIT_STATUSES = HIT_STATUSES
+
+    def __init__(self, url, timeout=30, verbose=False, cancel_token=None, rate=DEFAULT_DISCOVERY_RATE,
+                 concurrency=DEFAULT_DISCOVERY_CONCURRENCY, time_budget=None):
+        """تهيئة المكتشف؛ المسارات تُبنى نسبةً إلى مسار العنوان الأساسي"""
+        super().__init__(url, timeout=timeout, verbose=verbose, cancel_token=cancel_token, rate=rate,
+                         concurrency=concurrency, time_budget=time_budget)
+        parsed = urlparse(url)
+        path = parsed.path if parsed.path.endswith('/') else parsed.path + '/'
+        self.base_url = urlunparse((parsed.scheme, parsed.netloc, path, '', '', ''))
+
+        # الأنواع التي تعذرت معايرتها أو تجيب على كل شيء فلا تُفحص
+        self._skipped = set()
+
+    def discover(self, wordlist=None, extensions=(), recursion=0, case=False, suffixes=()):
+        """اكتشاف المسارات وإرجاع كل مسار موجود فور العثور عليه (مولّد)
+
+        الذاكرة محدودة بنافذة الطلبات المعلقة: قائمة الكلمات تُقرأ عبر mmap بلا تكرار والنتائج لا تُخزن هنا.
+        المجلدات المكتشفة (التي توجه إلى المسار نفسه بإضافة '/') تُفحص بدورها حتى عمق recursion،
+        و case و suffixes قواعد تحويل الكلمات (صيغ الحالة واللواحق مثل الأرقام).
+        """
+        self.logger.info(f"جاري اكتشاف المحتوى في الموقع: {self.url}")
+        start_time = time.time()
+        wordlist = wordlist or DEFAULT_WORDLIST
+        extensions = [extension.strip().lstrip('.') for extension in extensions or () if extension.strip()]
+
+        # رمز فرعي بميزانية زمنية؛ إغلاق المولّد مبكرًا يلغي الطلبات المعلقة أيضًا
+        token = self.budget_token()
+        directories = deque([('', 0)])
+
+        try:
+            while directories and not token.cancelled:
+                prefix, depth = directories.popleft()
+                words = iter_wordlist(wordlist, case=case, suffixes=suffixes)
+                candidates = self._candidates(prefix, expand(words, extensions), token)
+                for _, result in self.probe_window(candidates, token):
+                    if self.verbose:
+                        self.logger.debug(f"تم العثور على المسار: {result['path']} ({result['status']})")
+                    result['depth'] = depth
+                    if result['directory'] and depth < recursion:
+                        directories.append((result['path'], depth + 1))
+                    yield result
+
+            self.truncated = self.truncated or bool(directories)
+        finally:
+            token.cancel()
+
+        if self.verbose:
+            self.logger.debug(f"تم فحص {self.probed} مسارًا خلال {time.time() - start_time:.2f} ثانية")
+
+    def run(self, wordlist=None, extensions=(), recursion=0, case=False, suffixes=(), on_found=None):
+        """اكتشاف المحتوى كاملًا وإرجاع {'found': [...], 'probed': N, 'truncated': bool}
+
+        on_found دالة تُستدعى لكل مسار فور العثور عليه (لعرض النتائج أثناء الفحص).
+        """
+        found = []
+        for result in self.discover(wordlist, extensions, recursion, case=case, suffixes=suffixes):
+            found.append(result)
+            if on_found:
+                on_found(result)
+        return {'found': found, 'probed': self.probed, 'truncated': self.truncated}
+
+    def probe_path(self, kind, slug):
+        """مسار المرشح داخل مجلد النوع"""
+        prefix, ext = kind
+        return f"{prefix}/{slug}{ext}"
+
+    def target_url(self, path):
+        """العنوان الكامل لمسار نسبةً إلى مسار العنوان الأساسي (لا إلى جذر الموقع)"""
+        return urljoin(self.base_url, path.lstrip('/'))
+
+    def is_hit(self, kind, response, slug=None):
+        """هل المسار موجود: استجابة لا تطابق صفحة الخطأ المعايرة، أو توجيه إلى المسار نفسه كمجلد"""
+        if response is None or response.status_code >= 500 or self.is_soft404(kind, response, slug):
+            return False
+
+        if response.is_redirect:
+            return self._directory_location(kind, response, slug) is not None
+        return response.status_code in self.HIT_STATUSES
+
+    def make_result(self, kind, slug, path, response):
+        """نتيجة المسار الموجود مع وجهة التوجيه إذا كان مجلدًا"""
+        location = self._directory_location(kind, response, slug) if response.is_redirect else None
+        return {
+            'path': path,
+            'url': self.target_url(path),
+            'status': response.status_code,
+            'length': response_length(response),
+            'directory': location is not None,
+            'location': location,
+        }
+
+    def _directory_location(self, kind, response, slug):
+        """وجهة التوجيه إذا كانت المسار نفسه بإضافة '/' (علامة المجلد في معظم الخوادم)، وإلا None"""
+        location = response.headers.get('Location', '')
+        if urlparse(location).path.endswith(f"/{slug}{kind[1]}/"):
+            return location
+        return None
+
+    def _candidates(self, prefix, words, cancel_token):
+        """مرشحو مجلد واحد (النوع، الاسم)؛ المعايرة تحدث عند أول مرشح من كل امتداد في المجلد"""
+        for slug, ext in words:
+            kind = (prefix, ext)
+            if kind in self._skipped:
+                continue
+            if kind not in self._calibration and not self.calibrate(kind, cancel_token):
+                self._skipped.add(kind)
+                continue
+            yield kind, slug
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة التعداد النشط العامة: معايرة صفحات الخطأ وحد المعدل ونافذة الطلبات المعلقة والميزانية الزمنية
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import time
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import wait, FIRST_COMPLETED
+from urllib.parse import urljoin
+from .utils import safe_request, get_user_agent, extract_domain, pooled_session
+from .concurrency import get_governor, get_rate_limiter, new_token, CANCEL_POLL_INTERVAL
+from .soft404 import Soft404Detector, fingerprint
+
+# عدد البايتات المطلوبة عند استخدام GET مع Range بدل HEAD
+RANGE_BYTES = 1024
+
+# الإعدادات الافتراضية: الطلبات في الثانية لكل مضيف وعدد الطلبات المعلقة في آن واحد
+DEFAULT_RATE = 20
+DEFAULT_CONCURRENCY = 16
+
+def load_slugs(path, limit=None):
+    """قراءة قائمة المعرفات بالترتيب من ملف (سطر لكل معرف مع تجاهل التعليقات والتكرار)"""
+    slugs = []
+    seen = set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            slug = line.strip()
+            if not slug or slug.startswith('#') or slug in seen:
+                continue
+            seen.add(slug)
+            slugs.append(slug)
+            if limit and len(slugs) >= limit:
+                break
+    return slugs
+
+class Enumerator(ABC):
+    """فئة أساسية للتعداد النشط بطلبات صغيرة متوازية محدودة المعدل ومقيدة بميزانية زمنية
+
+    النوع (kind) مجموعة مرشحين تشترك في صفحة خطأ واحدة تُعاير مرة واحدة؛ الفئات الفرعية تحدد
+    مسار كل مرشح (probe_path) وشكل نتيجته (make_result).
+    """
+
+    # الحالات التي تعني وجود المرشح (بعد استبعاد صفحات الخطأ المعايرة)؛ التوجيه لا يثبت الوجود
+    HIT_STATUSES = (200, 206, 401, 403)
+
+    def __init__(self, url, timeout=30, verbose=False, cancel_token=None, rate=DEFAULT_RATE,
+                 concurrency=DEFAULT_CONCURRENCY, time_budget=None):
+        """تهيئة المُعدِّد"""
+        self.url = url
+        self.domain = extract_domain(url)
+        self.timeout = timeout
+        self.verbose = verbose
+        self.cancel_token = cancel_token
+        self.rate = rate
+        self.concurrency = concurrency
+        self.time_budget = time_budget
+        self.logger = logging.getLogger('jawal')
+        # اتصالات دائمة بعدد الطلبات المعلقة بدل فتح اتصال جديد لكل طلب
+        self.http = pooled_session(concurrency)
+
+        # نتيجة المعايرة لكل نوع: الطريقة وبصمة صفحة الخطأ
+        self._calibration = {}
+        self.probed = 0
+        self.truncated = False
+
+    def budget_token(self):
+        """رمز فرعي بالميزانية الزمنية: عند انتهائها تُعاد النتائج التي وُجدت حتى الآن"""
+        return new_token(self.time_budget, parent=self.cancel_token)
+
+    def calibrate(self, kind, cancel_token=None):
+        """معايرة صفحة الخطأ بطلب مرشحين عشوائيين غير موجودين واختيار HEAD أو GET مع Range
+
+        تعيد False إذا تعذرت المعايرة أو كان الموقع يجيب على كل شيء بصفحات متغيرة (لا فائدة من التعداد).
+        """
+        if kind in self._calibration:
+            return True
+
+        template = self.probe_path(kind, '{token}')
+        for method in ('HEAD', 'GET'):
+            detector = Soft404Detector(lambda path, method=method: self._request(path, method, cancel_token))
+            profile = detector.profile(kind, template)
+
+            # بعض الخوادم لا تدعم HEAD، والمواقع التي تجيب على كل شيء تحتاج المحتوى لتمييز صفحة الخطأ
+            # (طول الصفحة التي تعكس المسار المطلوب يتغير بطوله فلا يكفي وحده)
+            if method == 'HEAD' and (profile is None or set(profile.index) & {405, 501} or
+                                     profile.answers_everything):
+                continue
+            break
+
+        if profile is None:
+            self.logger.warning(f"تعذرت معايرة التعداد النشط للموقع: {self.url}")
+            return False
+
+        if profile.indistinguishable:
+            self.logger.warning(f"تم إيقاف التعداد النشط ({kind}): الموقع يجيب على كل المسارات: {self.url}")
+            return False
+
+        self._calibration[kind] = {'method': method, 'profile': profile}
+        if self.verbose:
+            self.logger.debug(f"معايرة التعداد ({kind}): {method} {profile.index}")
+        return True
+
+    def is_soft404(self, kind, response, slug=None):
+        """هل تطابق الاستجابة بصمة صفحة الخطأ المعايرة للنوع"""
+        # صفحات الخطأ التي تعكس المسار المطلوب تُقارن بعد حذف المعرف منها
+        reflected = (self.probe_path(kind, slug), slug) if slug else ()
+        return self._calibration[kind]['profile'].matches(fingerprint(response, reflected=reflected))
+
+    def is_hit(self, kind, response, slug=None):
+        """هل تختلف الاستجابة عن بصمة صفحة الخطأ المعايرة (أي أن المرشح موجود)"""
+        if response is None or response.status_code >= 500:
+            return False
+        if self.is_soft404(kind, response, slug):
+            return False
+        return response.status_code in self.HIT_STATUSES
+
+    @abstractmethod
+    def probe_path(self, kind, slug):
+        """مسار الملف الذي يُطلب للتحقق من وجود مرشح (تحدده الفئات الفرعية)"""
+
+    def make_result(self, kind, slug, path, response):
+        """نتيجة المرشح الموجود"""
+        return {'slug': slug, 'kind': kind, 'url': self.target_url(path), 'status': response.status_code}
+
+    def target_url(self, path):
+        """العنوان الكامل لمسار مطلوب"""
+        return urljoin(self.url, path)
+
+    def _request(self, path, method, cancel_token):
+        """طلب مسار واحد دون إعادة محاولة ودون تتبع التوجيه"""
+        headers = {'User-Agent': get_user_agent()}
+        if method == 'GET':
+            headers['Range'] = f"bytes=0-{RANGE_BYTES - 1}"
+        return safe_request(self.target_url(path), method=method, headers=headers, timeout=self.timeout,
+                            allow_redirects=False, max_retries=1, cancel_token=cancel_token, session=self.http)
+
+    def _probe(self, kind, slug, cancel_token):
+        """فحص مرشح واحد (رمز المعدل يُنتظر قبل إرساله إلى طابور المضيف)"""
+        path = self.probe_path(kind, slug)
+        response = self._request(path, self._calibration[kind]['method'], cancel_token)
+        if not self.is_hit(kind, response, slug):
+            return None
+        return self.make_result(kind, slug, path, response)
+
+    def probe_window(self, candidates, cancel_token):
+        """فحص المرشحين (النوع، المعرف) بنافذة محدودة من الطلبات المعلقة وإرجاع (الترتيب، النتيجة) لكل موجود فور اكتماله
+
+        أنواع المرشحين يجب أن تكون معايرة مسبقًا.
+        """
+        governor = get_governor()
+        limiter = get_rate_limiter(self.domain, self.rate)
+        remaining = enumerate(candidates)
+        pending = {}
+
+        while True:
+            # إبقاء النافذة ممتلئة حتى لا تُحجز آلاف المهام في طابور المضيف دفعة واحدة؛ رمز المعدل يُنتظر
+            # هنا لا داخل المهمة، فلا يحجز المضيف المقيد خانات المتحكم وهو ينتظر
+            while not cancel_token.cancelled and len(pending) < self.concurrency:
+                item = next(remaining, None)
+                if item is None or not limiter.acquire(cancel_token):
+                    break
+                index, (kind, slug) = item
+                future = governor.submit_for_host(self.domain, 'http', self._probe, kind, slug, cancel_token)
+                pending[future] = index
+
+            if not pending:
+                break
+
+            done, _ = wait(list(pending), timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                result = None if future.cancelled() else future.result()
+                # الطلبات التي قُطعت بالإلغاء لا تُحسب ضمن المفحوصة
+                if result is None and cancel_token.cancelled:
+                    continue
+                self.probed += 1
+                if result:
+                    yield index, result
+
+            if cancel_token.cancelled:
+                # التخلي عن المعلقة دون انتظارها؛ طلباتها مقيدة بمهلة الرمز المنتهية
+                for future in pending:
+                    future.cancel()
+                self.truncated = True
+                break
+
+class SlugEnumerator(Enumerator):
+    """مُعدِّد من قوائم معرفات مضمنة مرتبة حسب الشعبية لكل نوع (إضافات، قوالب، امتدادات...)"""
+
+    # الأنواع وملفاتها وقوائمها ووصفها في السجل (تحددها الفئات الفرعية لكل نظام إدارة محتوى)
+    PROBE_FILES = {}
+    SLUG_FILES = {}
+    DESCRIPTION = 'للمعرفات'
+
+    def __init__(self, url, timeout=30, verbose=False, cancel_token=None, rate=DEFAULT_RATE,
+                 concurrency=DEFAULT_CONCURRENCY, time_budget=None, slug_files=None):
+        """تهيئة المُعدِّد؛ slug_files يستبدل القوائم المضمنة لكل نوع ({'plugin': path, ...})"""
+        super().__init__(url, timeout=timeout, verbose=verbose, cancel_token=cancel_token, rate=rate,
+                         concurrency=concurrency, time_budget=time_budget)
+        self.slug_files = dict(self.SLUG_FILES, **(slug_files or {}))
+
+    def enumerate(self, kinds=None, limit=None):
+        """تعداد الأنواع المطلوبة (كلها افتراضيًا) وإرجاع {'<kind>s': [...], 'probed': N, 'truncated': bool}"""
+        self.logger.info(f"جاري التعداد النشط {self.DESCRIPTION} في الموقع: {self.url}")
+        start_time = time.time()
+
+        token = self.budget_token()
+        try:
+            results = self._enumerate_kinds(kinds or tuple(self.PROBE_FILES), limit, token)
+        finally:
+            token.cancel()
+
+        results['probed'] = self.probed
+        results['truncated'] = self.truncated
+        if self.verbose:
+            self.logger.debug(f"تم فحص {self.probed} معرفًا خلال {time.time() - start_time:.2f} ثانية")
+
+        return results
+
+    def probe_path(self, kind, slug):
+        """مسار الملف الذي يُطلب للتحقق من وجود معرف"""
+        return self.PROBE_FILES[kind].format(slug=slug)
+
+    def _enumerate_kinds(self, kinds, limit, token):
+        """تعداد كل نوع بالترتيب تحت رمز الميزانية الزمنية (الفئات الفرعية تضيف مراحلها تحت الرمز نفسه)"""
+        results = {f"{kind}s": [] for kind in kinds}
+
+        for kind in kinds:
+            if token.cancelled:
+                self.truncated = True
+                break
+
+            slugs = load_slugs(self.slug_files[kind], limit)
+            if not self.calibrate(kind, token):
+                continue
+
+            probed = self.probed
+            found = dict(self.probe_window(((kind, slug) for slug in slugs), token))
+            # النتائج بترتيب الشعبية بغض النظر عن ترتيب اكتمال الطلبات
+            results[f"{kind}s"] = [found[index] for index in sorted(found)]
+            if self.probed - probed < len(slugs):
+                self.truncated = True
+
+            if self.verbose:
+                for result in results[f"{kind}s"]:
+                    self.logger.debug(f"تم العثور على {kind}: {result['slug']}")
+
+        return results
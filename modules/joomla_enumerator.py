@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة التعداد النشط لامتدادات جوملا من فهرس مضمن
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+from concurrent.futures import wait, FIRST_COMPLETED
+from .concurrency import get_governor, new_token, CANCEL_POLL_INTERVAL
+from .joomla_manifest import fetch_manifest
+from .enumerator import SlugEnumerator
+from .vulndb import DATA_DIR
+
+# فهارس الامتدادات المضمنة مرتبة حسب الشعبية (الإضافات بصيغة المجموعة/الاسم)
+JOOMLA_SLUG_FILES = {
+    'component': os.path.join(DATA_DIR, 'joomla_components.txt'),
+    'module': os.path.join(DATA_DIR, 'joomla_modules.txt'),
+    'plugin': os.path.join(DATA_DIR, 'joomla_plugins.txt'),
+}
+
+# ملف البيان لكل نوع؛ وجوده يثبت التثبيت ويكشف الإصدار عند قراءته
+JOOMLA_PROBE_FILES = {
+    'component': '/administrator/components/com_{slug}/{slug}.xml',
+    'module': '/modules/mod_{slug}/mod_{slug}.xml',
+    'plugin': '/plugins/{group}/{element}/{element}.xml',
+}
+
+# البادئة المستخدمة في أسماء الامتدادات لكل نوع
+EXTENSION_PREFIXES = {
+    'component': 'com_',
+    'module': 'mod_',
+    'plugin': 'plg_',
+}
+
+class JoomlaEnumerator(SlugEnumerator):
+    """فئة لتعداد مكونات ووحدات وإضافات جوملا بنفس آلية المعايرة وحد المعدل والميزانية الزمنية"""
+
+    PROBE_FILES = JOOMLA_PROBE_FILES
+    SLUG_FILES = JOOMLA_SLUG_FILES
+    DESCRIPTION = 'لامتدادات جوملا'
+
+    def probe_path(self, kind, slug):
+        """مسار ملف البيان لامتداد (الإضافات تحتاج المجموعة والاسم)"""
+        if kind == 'plugin':
+            group, _, element = slug.rpartition('/')
+            return self.PROBE_FILES[kind].format(group=group or 'system', element=element)
+        return self.PROBE_FILES[kind].format(slug=slug)
+
+    def _enumerate_kinds(self, kinds, limit, token):
+        """تعداد الامتدادات ثم قراءة ملفات بيان الموجود منها بالتوازي ضمن الميزانية الزمنية نفسها"""
+        results = super()._enumerate_kinds(kinds, limit, token)
+
+        found = [item for kind in EXTENSION_PREFIXES for item in results.get(f"{kind}s", [])]
+        for item in found:
+            item['name'] = extension_name(item['kind'], item['slug'])
+
+        # رمز فرعي لقراءة البيانات: عند انتهاء الميزانية تُترك القراءات المعلقة وتبقى الامتدادات بلا إصدار
+        manifest_token = new_token(parent=token)
+        pending = {
+            get_governor().submit_for_host(self.domain, 'http', fetch_manifest, item['url'],
+                                           timeout=self.timeout, cancel_token=manifest_token): item
+            for item in found
+        }
+        try:
+            while pending:
+                if manifest_token.cancelled:
+                    for future in pending:
+                        future.cancel()
+                    self.truncated = True
+                    break
+
+                done, _ = wait(list(pending), timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    manifest = None if future.cancelled() else future.result()
+                    # القراءة التي قُطعت بانتهاء الميزانية تعني نتائج ناقصة لا امتدادًا بلا إصدار
+                    if manifest is None and manifest_token.cancelled:
+                        self.truncated = True
+                    if manifest and manifest.get('version'):
+                        item['version'] = manifest['version']
+        finally:
+            manifest_token.cancel()
+
+        return results
+
+def extension_name(kind, slug):
+    """الاسم الكامل للامتداد بالبادئة المعتادة (مثل com_k2 أو plg_system_jch_optimize)"""
+    return EXTENSION_PREFIXES[kind] + slug.replace('/', '_')
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة تحديد إصدار جوملا من بصمات الملفات الثابتة
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import math
+import json
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from urllib.parse import urljoin
+from .utils import safe_request
+
+# الملفات الثابتة التي تُبصم عند بناء القاعدة
+FINGERPRINT_EXTENSIONS = ('.js', '.css')
+
+# الحد الأقصى للطلبات قبل التوقف وإرجاع المرشحين المتبقين
+MAX_PROBES = 5
+
+def file_hash(content):
+    """بصمة SHA-256 لمحتوى ملف"""
+    return hashlib.sha256(content).hexdigest()
+
+def build_database(releases, prefix='media', extensions=FINGERPRINT_EXTENSIONS):
+    """بناء قاعدة بصمات من نسخ جوملا مستخرجة محليًا ({الإصدار: مجلد النسخة})
+
+    تُحفظ فقط الملفات التي تميز بين الإصدارات (أكثر من مجموعة واحدة) لإبقاء القاعدة صغيرة.
+    """
+    files = defaultdict(lambda: defaultdict(list))
+
+    for version, root in sorted(releases.items()):
+        for directory, _, names in os.walk(os.path.join(root, prefix)):
+            for name in names:
+                if not name.endswith(extensions):
+                    continue
+                full_path = os.path.join(directory, name)
+                relative = os.path.relpath(full_path, root).replace(os.sep, '/')
+                with open(full_path, 'rb') as f:
+                    files[relative][file_hash(f.read())].append(version)
+
+    versions = sorted(releases)
+    database = {'hash': 'sha256', 'versions': versions, 'files': {}}
+    for path, hashes in sorted(files.items()):
+        # ملف متطابق في كل الإصدارات لا يضيف معلومات
+        if len(hashes) == 1 and len(next(iter(hashes.values()))) == len(versions):
+            continue
+        database['files'][path] = {digest: sorted(found) for digest, found in hashes.items()}
+
+    return database
+
+def write_database(database, path):
+    """حفظ قاعدة البصمات بصيغة JSON مضغوطة"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(database, f, separators=(',', ':'), sort_keys=True)
+    return path
+
+class FingerprintDatabase:
+    """فهرس البصمات مع اختيار الملف التالي حسب مكسب المعلومات"""
+
+    def __init__(self, data=None):
+        """تهيئة الفهرس من قاموس القاعدة"""
+        data = data or {}
+        self.versions = list(data.get('versions', []))
+        # path -> {version: sha256}؛ غياب الإصدار يعني أن الملف غير موجود فيه
+        self.index = {}
+        for path, hashes in (data.get('files') or {}).items():
+            self.index[path] = {version: digest for digest, found in hashes.items() for version in found}
+
+    def partition(self, path, candidates):
+        """تقسيم المرشحين حسب البصمة المتوقعة للملف (None للإصدارات التي لا تحتوي الملف)"""
+        buckets = defaultdict(list)
+        by_version = self.index[path]
+        for version in candidates:
+            buckets[by_version.get(version)].append(version)
+        return buckets
+
+    def best_probe(self, candidates, exclude=()):
+        """الملف الذي يقلل الإنتروبيا المتوقعة للمرشحين أكثر من غيره (None إذا لم يميز أي ملف بينهم)"""
+        total = len(candidates)
+        if total < 2:
+            return None
+
+        best_path, best_entropy = None, math.log2(total)
+        for path in self.index:
+            if path in exclude:
+                continue
+            # الإنتروبيا المتوقعة بعد معرفة البصمة (أولوية متساوية للإصدارات)
+            expected = sum(len(group) * math.log2(len(group)) for group in self.partition(path, candidates).values()) / total
+            if expected < best_entropy:
+                best_path, best_entropy = path, expected
+
+        return best_path
+
+    def filter(self, path, candidates, digest):
+        """المرشحون المتوافقون مع البصمة المرصودة (None للملف غير الموجود)"""
+        by_version = self.index[path]
+        return [version for version in candidates if by_version.get(version) == digest]
+
+    def __len__(self):
+        return len(self.versions)
+
+def load_fingerprints(path):
+    """تحميل قاعدة البصمات من ملف JSON ({'versions': [...], 'files': {path: {sha256: [versions]}}})"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return FingerprintDatabase(json.load(f))
+
+# لا تُضمَّن قاعدة بصمات مع الأداة (تُبنى من نسخ جوملا الرسمية)؛ بدون ملف مُعدّ تبقى القاعدة فارغة
+_database = None
+_database_path = None
+_database_lock = threading.Lock()
+
+def configure_fingerprints(path):
+    """استخدام ملف بصمات لتحديد إصدار جوملا (يُحمَّل عند أول استخدام)"""
+    global _database, _database_path
+
+    with _database_lock:
+        _database_path = path
+        _database = None
+
+def get_fingerprints():
+    """الحصول على قاعدة البصمات المشتركة على مستوى العملية (فارغة ما لم يُعدّ ملف عبر configure_fingerprints)"""
+    global _database
+
+    with _database_lock:
+        if _database is None:
+            _database = FingerprintDatabase()
+            if _database_path:
+                try:
+                    _database = load_fingerprints(_database_path)
+                except (OSError, ValueError) as e:
+                    logging.getLogger('jawal').error(f"خطأ في تحميل قاعدة بصمات جوملا {_database_path}: {str(e)}")
+        return _database
+
+class JoomlaFingerprinter:
+    """فئة لتحديد إصدار جوملا بأقل عدد من طلبات الملفات الثابتة"""
+
+    def __init__(self, url, timeout=30, verbose=False, cancel_token=None, database=None, max_probes=MAX_PROBES):
+        """تهيئة محدد الإصدار"""
+        self.url = url
+        self.timeout = timeout
+        self.verbose = verbose
+        self.cancel_token = cancel_token
+        self.database = database if database is not None else get_fingerprints()
+        self.max_probes = max_probes
+        self.logger = logging.getLogger('jawal')
+
+    def identify(self):
+        """تضييق المرشحين بطلب الملف الأكثر تمييزًا في كل خطوة
+
+        تعيد {'version': الإصدار أو None، 'candidates': [...]، 'probes': [(المسار، النتيجة)]}.
+        """
+        candidates = list(self.database.versions)
+        probes = []
+        tried = set()
+
+        while len(candidates) > 1 and len(probes) < self.max_probes:
+            path = self.database.best_probe(candidates, exclude=tried)
+            if path is None:
+                break
+            tried.add(path)
+
+            response = safe_request(urljoin(self.url, '/' + path), timeout=self.timeout, max_retries=1,
+                                    cancel_token=self.cancel_token)
+            if response is None:
+                break
+
+            if response.status_code == 404:
+                digest = None
+            elif response.status_code == 200:
+                digest = file_hash(response.content)
+            else:
+                # حالة غير حاسمة (حظر أو خطأ) لا تستبعد أي مرشح
+                probes.append((path, response.status_code))
+                continue
+
+            remaining = self.database.filter(path, candidates, digest)
+            probes.append((path, digest))
+
+            # بصمة غير معروفة (ملف معدل أو صفحة خطأ مخصصة) لا تستبعد أي مرشح
+            if remaining:
+                candidates = remaining
+
+        if self.verbose:
+            self.logger.debug(f"بصمات جوملا: {len(probes)} طلب، المرشحون المتبقون: {candidates}")
+
+        return {
+            'version': candidates[0] if len(candidates) == 1 and probes else None,
+            'candidates': candidates,
+            'probes': probes,
+        }
+
+if __name__ == '__main__':
+    # بناء القاعدة من نسخ مستخرجة: python -m modules.joomla_fingerprint OUTPUT 4.2.7=/path/to/Joomla_4.2.7 ...
+    import sys
+
+    if len(sys.argv) < 3:
+        print('الاستخدام: python -m modules.joomla_fingerprint OUTPUT VERSION=DIR [VERSION=DIR ...]')
+        sys.exit(1)
+
+    releases = dict(argument.split('=', 1) for argument in sys.argv[2:])
+    database = build_database(releases)
+    write_database(database, sys.argv[1])
+    print(f"تم بناء قاعدة البصمات: {len(database['versions'])} إصدار، {len(database['files'])} ملف مميز")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة القراءة التدريجية لملفات بيان (manifest) إضافات وقوالب جوملا
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import logging
+from xml.etree.ElementTree import XMLPullParser, ParseError
+from .utils import safe_request, get_user_agent
+
+# الحقول المستخرجة من ملف البيان؛ تُوقف القراءة بعد <version> لأنها تأتي بعد الاسم والمطور عادة
+MANIFEST_FIELDS = ('name', 'author', 'version')
+
+# الحد الأقصى لما يُقرأ من ملف البيان (الحقول المطلوبة في بدايته)
+MANIFEST_BYTES = 16384
+
+def parse_manifest(chunks, stop_at='version'):
+    """تحليل ملف بيان XML تدريجيًا من أجزاء بايتات والتوقف فور اكتمال العنصر stop_at
+
+    تعيد قاموس الحقول الموجودة أو None إذا لم يكن المحتوى XML صالحًا لملف بيان جوملا.
+    """
+    parser = XMLPullParser(events=('start', 'end'))
+    fields = {}
+    depth = 0
+    is_manifest = False
+
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == 'start':
+                    depth += 1
+                    if depth == 1:
+                        # الجذر في جوملا هو extension (أو install في الإصدارات القديمة)
+                        is_manifest = element.tag in ('extension', 'install', 'metafile')
+                        if not is_manifest:
+                            return None
+                    continue
+
+                depth -= 1
+                # الحقول المطلوبة أبناء مباشرون للجذر فقط
+                if depth == 1 and element.tag in MANIFEST_FIELDS and element.tag not in fields:
+                    fields[element.tag] = (element.text or '').strip()
+                    if element.tag == stop_at:
+                        return fields
+    except ParseError:
+        # ملف مقطوع بحد القراءة بعد الحقول المطلوبة مقبول؛ غير ذلك ليس ملف بيان
+        return fields or None
+
+    return fields if is_manifest else None
+
+def fetch_manifest(url, timeout=30, cancel_token=None, max_bytes=MANIFEST_BYTES):
+    """جلب بداية ملف بيان بطلب Range وقراءة متدفقة تتوقف عند <version> (None إذا لم يوجد)"""
+    headers = {
+        'User-Agent': get_user_agent(),
+        'Range': f'bytes=0-{max_bytes - 1}',
+    }
+    response = safe_request(url, headers=headers, timeout=timeout, max_retries=1,
+                            cancel_token=cancel_token, stream=True)
+    if response is None:
+        return None
+
+    try:
+        if response.status_code not in (200, 206):
+            return None
+        return parse_manifest(_limited_chunks(response, max_bytes))
+    except Exception as e:
+        logging.getLogger('jawal').warning(f"خطأ في قراءة ملف البيان {url}: {str(e)}")
+        return None
+    finally:
+        response.close()
+
+def _limited_chunks(response, max_bytes, chunk_size=2048):
+    """أجزاء جسم الاستجابة حتى max_bytes فقط (إذا تجاهل الخادم Range)"""
+    read = 0
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        yield chunk[:max_bytes - read]
+        read += len(chunk)
+        if read >= max_bytes:
+            break
@@ -10,175 +10,193 @@ JawaL - وحدة فحص مواقع جوملا
 import re
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import as_completed
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
-from .utils import safe_request, get_user_agent, extract_domain
+from .utils import get_user_agent, extract_domain
+from .concurrency import get_governor
+from .joomla_manifest import fetch_manifest
+from .joomla_fingerprint import JoomlaFingerprinter, get_fingerprints
+from .joomla_enumerator import JoomlaEnumerator, extension_name
+from .enumerator import DEFAULT_RATE
+from .vulndb import get_vulndb, known_vulnerabilities
+from .cms_probe import ProbePlan, ProbeSession, homepage_plan, confirm
+
+# المسارات الشائعة في جوملا (وجود {threshold} منها يؤكد النظام)
+JOOMLA_PATHS = ProbePlan('joomla-paths', [
+    {'name': path, 'path': path, 'exists': True}
+    for path in [
+        '/administrator/',
+        '/administrator/index.php',
+        '/administrator/manifests/files/joomla.xml',
+        '/language/en-GB/en-GB.xml',
+        '/robots.txt',
+        '/htaccess.txt',
+        '/README.txt',
+        '/configuration.php',
+        '/components/',
+        '/modules/',
+        '/templates/',
+        '/plugins/',
+        '/images/',
+        '/includes/',
+        '/cache/',
+        '/libraries/',
+        '/installation/',
+    ]
+])
+
+# الثغرات الشائعة في جوملا
+JOOMLA_CHECKS = ProbePlan('joomla-checks', [
+    {
+        'name': 'كشف إصدار جوملا',
+        'path': '/administrator/manifests/files/joomla.xml',
+        'pattern': r'<version>([\d.]+)</version>',
+        'severity': 'منخفضة',
+        'description': 'يمكن معرفة إصدار جوملا من خلال ملف joomla.xml.'
+    },
+    {
+        'name': 'كشف إصدار جوملا (طريقة بديلة)',
+        'path': '/language/en-GB/en-GB.xml',
+        'pattern': r'<version>([\d.]+)</version>',
+        'severity': 'منخفضة',
+        'description': 'يمكن معرفة إصدار جوملا من خلال ملف اللغة.'
+    },
+    {
+        'name': 'وجود مجلد التثبيت',
+        'path': '/installation/',
+        'exists': True,
+        'evidence': 'مجلد التثبيت متاح (رمز الحالة: {status})',
+        'severity': 'عالية',
+        'description': 'مجلد التثبيت لا يزال موجودًا، مما قد يسمح بإعادة تثبيت الموقع.'
+    },
+    {
+        'name': 'كشف قائمة المكونات',
+        'path': '/components/',
+        'pattern': 'Index of',
+        'severity': 'متوسطة',
+        'description': 'يمكن الوصول إلى قائمة المكونات من خلال مجلد components.'
+    },
+    {
+        'name': 'كشف قائمة الموديولات',
+        'path': '/modules/',
+        'pattern': 'Index of',
+        'severity': 'متوسطة',
+        'description': 'يمكن الوصول إلى قائمة الموديولات من خلال مجلد modules.'
+    },
+    {
+        'name': 'كشف قائمة القوالب',
+        'path': '/templates/',
+        'pattern': 'Index of',
+        'severity': 'متوسطة',
+        'description': 'يمكن الوصول إلى قائمة القوالب من خلال مجلد templates.'
+    },
+    {
+        'name': 'كشف ملف التكوين',
+        'path': '/configuration.php-dist',
+        'exists': True,
+        'evidence': 'ملف التكوين النموذجي متاح (رمز الحالة: {status})',
+        'severity': 'عالية',
+        'description': 'ملف التكوين النموذجي متاح، مما قد يكشف عن معلومات حساسة.'
+    },
+    {
+        'name': 'كشف ملف README',
+        'path': '/README.txt',
+        'pattern': 'Joomla',
+        'severity': 'منخفضة',
+        'description': 'ملف README متاح، مما قد يكشف عن معلومات حول الإصدار.'
+    },
+    {
+        'name': 'صفحة تسجيل الدخول الافتراضية',
+        'path': '/administrator/',
+        'match': lambda response: response.url if response.status_code == 200 else None,
+        'severity': 'منخفضة',
+        'description': 'صفحة تسجيل الدخول الافتراضية متاحة، مما قد يسهل هجمات القوة الغاشمة.'
+    },
+])
 
 class JoomlaScanner:
     """فئة لفحص مواقع جوملا وكشف الثغرات الأمنية"""
     
-    def __init__(self, url, timeout=30, verbose=False):
-        """تهيئة فاحص جوملا"""
+    # المسارات الشائعة للتحقق وفحوص الثغرات الشائعة (خطط تصريحية يدمجها محرك الفحص المشترك)
+    PATH_PLAN = JOOMLA_PATHS
+    VULNERABILITY_PLAN = JOOMLA_CHECKS
+    
+    def __init__(self, url, timeout=30, verbose=False, cancel_token=None, session=None):
+        """تهيئة فاحص جوملا؛ session جلسة فحص مشتركة مع فاحصات أخرى للهدف نفسه"""
         self.url = url
         self.domain = extract_domain(url)
         self.timeout = timeout
+        # رمز الإلغاء التعاوني (None يعني رمز العملية الجذري)
+        self.cancel_token = cancel_token
         self.verbose = verbose
         self.logger = logging.getLogger('jawal')
         
-        # قائمة بالمسارات الشائعة في جوملا
-        self.common_paths = [
-            '/administrator/',
-            '/administrator/index.php',
-            '/administrator/manifests/files/joomla.xml',
-            '/language/en-GB/en-GB.xml',
-            '/robots.txt',
-            '/htaccess.txt',
-            '/README.txt',
-            '/configuration.php',
-            '/components/',
-            '/modules/',
-            '/templates/',
-            '/plugins/',
-            '/images/',
-            '/includes/',
-            '/cache/',
-            '/libraries/',
-            '/installation/',
-        ]
+        # كل مسار يُطلب مرة واحدة لكل هدف، وتتشارك الجلسة فاحصات الهدف نفسه (مثل كاشف نظام إدارة المحتوى)
+        self.session = session or ProbeSession(url, timeout=timeout, cancel_token=cancel_token)
         
-        # قائمة بالثغرات الشائعة في جوملا
-        self.common_vulnerabilities = [
-            {
-                'name': 'كشف إصدار جوملا',
-                'path': '/administrator/manifests/files/joomla.xml',
-                'pattern': r'<version>([\d.]+)</version>',
-                'severity': 'منخفضة',
-                'description': 'يمكن معرفة إصدار جوملا من خلال ملف joomla.xml.'
-            },
-            {
-                'name': 'كشف إصدار جوملا (طريقة بديلة)',
-                'path': '/language/en-GB/en-GB.xml',
-                'pattern': r'<version>([\d.]+)</version>',
-                'severity': 'منخفضة',
-                'description': 'يمكن معرفة إصدار جوملا من خلال ملف اللغة.'
-            },
-            {
-                'name': 'وجود مجلد التثبيت',
-                'path': '/installation/',
-                'pattern': None,  # سيتم التحقق من الاستجابة في دالة منفصلة
-                'severity': 'عالية',
-                'description': 'مجلد التثبيت لا يزال موجودًا، مما قد يسمح بإعادة تثبيت الموقع.'
-            },
-            {
-                'name': 'كشف قائمة المكونات',
-                'path': '/components/',
-                'pattern': 'Index of',
-                'severity': 'متوسطة',
-                'description': 'يمكن الوصول إلى قائمة المكونات من خلال مجلد components.'
-            },
-            {
-                'name': 'كشف قائمة الموديولات',
-                'path': '/modules/',
-                'pattern': 'Index of',
-                'severity': 'متوسطة',
-                'description': 'يمكن الوصول إلى قائمة الموديولات من خلال مجلد modules.'
-            },
-            {
-                'name': 'كشف قائمة القوالب',
-                'path': '/templates/',
-                'pattern': 'Index of',
-                'severity': 'متوسطة',
-                'description': 'يمكن الوصول إلى قائمة القوالب من خلال مجلد templates.'
-            },
-            {
-                'name': 'كشف ملف التكوين',
-                'path': '/configuration.php-dist',
-                'pattern': None,  # سيتم التحقق من الاستجابة في دالة منفصلة
-                'severity': 'عالية',
-                'description': 'ملف التكوين النموذجي متاح، مما قد يكشف عن معلومات حساسة.'
-            },
-            {
-                'name': 'كشف ملف README',
-                'path': '/README.txt',
-                'pattern': 'Joomla',
-                'severity': 'منخفضة',
-                'description': 'ملف README متاح، مما قد يكشف عن معلومات حول الإصدار.'
-            },
-        ]
+        # ملفات البيان تُجلب مرة واحدة وتتشاركها المراحل المتوازية
+        self._manifests_lock = threading.Lock()
+        self._manifests = None
     
-    def verify_joomla(self):
-        """التحقق من أن الموقع يستخدم جوملا"""
+    def verify_joomla(self, threshold=3):
+        """التحقق من أن الموقع يستخدم جوملا (المسارات والصفحة الرئيسية تُفحص بالتوازي مع خروج مبكر)"""
         self.logger.info(f"جاري التحقق من استخدام جوملا في الموقع: {self.url}")
         
-        # عدد المسارات التي تم العثور عليها
-        found_paths = 0
-        
+        confirmed = False
         try:
-            # التحقق من المسارات الشائعة في جوملا
-            for path in self.common_paths:
-                full_url = urljoin(self.url, path)
-                response = safe_request(full_url, timeout=self.timeout)
-                
-                if response and response.status_code != 404:
-                    found_paths += 1
-                    
-                    if self.verbose:
-                        self.logger.debug(f"تم العثور على المسار: {path}")
-                    
-                    # إذا تم العثور على 3 مسارات على الأقل، فمن المحتمل أن يكون جوملا
-                    if found_paths >= 3:
-                        self.logger.info(f"تم التأكد من استخدام جوملا في الموقع: {self.url}")
-                        return True
-            
-            # التحقق من وجود علامات جوملا في صفحة الرئيسية
-            response = safe_request(self.url, timeout=self.timeout)
-            if response:
-                # البحث عن علامات جوملا في محتوى الصفحة
-                joomla_indicators = [
-                    'joomla',
-                    'Joomla',
-                    'com_content',
-                    'com_users',
-                    'mod_',
-                    '/templates/',
-                    '/components/',
-                ]
-                
-                for indicator in joomla_indicators:
-                    if indicator in response.text:
-                        self.logger.info(f"تم التأكد من استخدام جوملا في الموقع: {self.url}")
-                        return True
-                
-                # البحث عن علامات جوملا في رؤوس HTTP
-                if 'generator' in response.headers:
-                    if 'joomla' in response.headers['generator'].lower():
-                        self.logger.info(f"تم التأكد من استخدام جوملا في الموقع: {self.url}")
-                        return True
-                
-                # البحث عن وسم generator في HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
-                generator = soup.find('meta', attrs={'name': 'generator'})
-                if generator and 'joomla' in generator.get('content', '').lower():
-                    self.logger.info(f"تم التأكد من استخدام جوملا في الموقع: {self.url}")
-                    return True
-            
-            self.logger.info(f"لم يتم التأكد من استخدام جوملا في الموقع: {self.url}")
-            return False
-        
+            # الصفحة الرئيسية فحص حاسم بحد ذاته؛ المسارات الشائعة تحتاج إلى {threshold} منها على الأقل
+            plan = self.PATH_PLAN + homepage_plan('joomla', self.has_homepage_indicators)
+            confirmed = confirm(self.session, plan, threshold, verbose=self.verbose)
         except Exception as e:
             self.logger.error(f"خطأ في التحقق من استخدام جوملا: {str(e)}")
+        
+        if confirmed:
+            self.logger.info(f"تم التأكد من استخدام جوملا في الموقع: {self.url}")
+        else:
+            self.logger.info(f"لم يتم التأكد من استخدام جوملا في الموقع: {self.url}")
+        
+        return confirmed
+    
+    def has_homepage_indicators(self, response):
+        """التحقق من وجود علامات جوملا في استجابة الصفحة الرئيسية (دون أي طلبات إضافية)"""
+        if not response:
             return False
+        
+        # البحث عن علامات جوملا في محتوى الصفحة
+        joomla_indicators = [
+            'joomla',
+            'Joomla',
+            'com_content',
+            'com_users',
+            'mod_',
+            '/templates/',
+            '/components/',
+        ]
+        
+        if any(indicator in response.text for indicator in joomla_indicators):
+            return True
+        
+        # البحث عن علامات جوملا في رؤوس HTTP
+        if 'joomla' in response.headers.get('generator', '').lower():
+            return True
+        
+        # البحث عن وسم generator في HTML
+        soup = BeautifulSoup(response.text, 'html.parser')
+        generator = soup.find('meta', attrs={'name': 'generator'})
+        return bool(generator and 'joomla' in generator.get('content', '').lower())
     
-    def get_joomla_info(self):
+    def get_joomla_info(self, version=None):
         """الحصول على معلومات جوملا"""
         self.logger.info(f"جاري جمع معلومات جوملا للموقع: {self.url}")
         
         joomla_info = {}
         
         try:
-            # التحقق من إصدار جوملا
-            version = self._get_joomla_version()
+            # التحقق من إصدار جوملا (None تعني أن الإصدار لم يُحدد بعد)
+            if version is None:
+                version = self._get_joomla_version()
             if version:
                 joomla_info['الإصدار'] = version
             
@@ -201,6 +219,48 @@ class JoomlaScanner:
             self.logger.error(f"خطأ في الحصول على معلومات جوملا: {str(e)}")
             return {'خطأ': str(e)}
     
+    def detect_version(self):
+        """تحديد إصدار جوملا وحالة تحديثه"""
+        version = self._get_joomla_version()
+        if not version:
+            return {}
+        
+        try:
+            is_latest = not self._is_outdated_version(version)
+        except ValueError:
+            is_latest = False
+        
+        return {'version': version, 'is_latest': is_latest}
+    
+    def enumerate_components(self):
+        """الحصول على قائمة المكونات المكتشفة"""
+        components = []
+        
+        for component in self._get_joomla_components():
+            component_entry = {'name': component['الاسم']}
+            if 'الإصدار' in component:
+                component_entry['version'] = component['الإصدار']
+            components.append(component_entry)
+        
+        return components
+    
+    def enumerate_templates(self):
+        """الحصول على قائمة القوالب المكتشفة"""
+        template = self._get_joomla_template()
+        if not template or 'الاسم' not in template:
+            return []
+        
+        template_entry = {'name': template['الاسم']}
+        if 'الإصدار' in template:
+            template_entry['version'] = template['الإصدار']
+        return [template_entry]
+    
+    def enumerate_extensions_active(self, limit=None, time_budget=None, rate=DEFAULT_RATE):
+        """التعداد النشط للمكونات والوحدات والإضافات من الفهرس المضمن مع إصداراتها من ملفات البيان"""
+        enumerator = JoomlaEnumerator(self.url, timeout=self.timeout, verbose=self.verbose,
+                                      cancel_token=self.cancel_token, rate=rate, time_budget=time_budget)
+        return enumerator.enumerate(limit=limit)
+    
     def _get_joomla_version(self):
         """الحصول على إصدار جوملا"""
         version = None
@@ -219,8 +279,8 @@ class JoomlaScanner:
         
         for method in methods:
             try:
-                full_url = urljoin(self.url, method['path'])
-                response = safe_request(full_url, timeout=self.timeout)
+                # ملفات الإصدار مشتركة مع فحص الثغرات فلا تُطلب مرتين
+                response = self.get_homepage() if method['path'] == '/' else self.session.get(method['path'])
                 
                 if response and response.status_code == 200:
                     match = re.search(method['pattern'], response.text)
@@ -230,42 +290,76 @@ class JoomlaScanner:
             except Exception as e:
                 self.logger.error(f"خطأ في الحصول على إصدار جوملا من {method['path']}: {str(e)}")
         
+        # بصمات الملفات الثابتة تحت /media/ عندما تكون ملفات البيان محجوبة (فقط مع قاعدة بصمات يوفرها المستخدم)
+        if not version and len(get_fingerprints()):
+            version = JoomlaFingerprinter(self.url, timeout=self.timeout, verbose=self.verbose,
+                                          cancel_token=self.cancel_token).identify()['version']
+        
         return version
     
+    def get_homepage(self):
+        """الصفحة الرئيسية من جلسة الفحص المشتركة (تُجلب مرة واحدة فقط)"""
+        return self.session.homepage()
+    
+    def _homepage_names(self):
+        """أسماء القوالب والمكونات المرجعية في الصفحة الرئيسية بترتيب ظهورها (بدون تكرار)"""
+        response = self.get_homepage()
+        html = response.text if response is not None and response.status_code == 200 else ''
+        
+        templates = list(dict.fromkeys(re.findall(r'/templates/([^/"\'\s]+)', html)))
+        components = list(dict.fromkeys(re.findall(r'com_([a-zA-Z0-9_]+)', html)))
+        return templates, components
+    
+    def manifest_details(self):
+        """جلب ملفات البيان للقالب وجميع المكونات المكتشفة بالتوازي (مرة واحدة)
+
+        تعيد {('template' | 'component'، الاسم): الحقول}؛ الزمن محدود بأبطأ ملف وليس بمجموعها.
+        """
+        with self._manifests_lock:
+            if self._manifests is None:
+                templates, components = self._homepage_names()
+                
+                paths = {('component', name): f'/administrator/components/com_{name}/{name}.xml' for name in components}
+                if templates:
+                    paths[('template', templates[0])] = f'/templates/{templates[0]}/templateDetails.xml'
+                
+                # الطلبات عبر طابور المضيف حتى يبقى عدد الطلبات المتزامنة للموقع ضمن الحد
+                futures = {
+                    get_governor().submit_for_host(self.domain, 'http', fetch_manifest, urljoin(self.url, path),
+                                                   timeout=self.timeout, cancel_token=self.cancel_token): key
+                    for key, path in paths.items()
+                }
+                
+                manifests = {}
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.logger.error(f"خطأ في جلب ملف البيان {futures[future][1]}: {str(e)}")
+                        continue
+                    if result:
+                        manifests[futures[future]] = result
+                self._manifests = manifests
+            return self._manifests
+    
     def _get_joomla_template(self):
         """الحصول على القالب المستخدم في جوملا"""
         template_info = {}
         
         try:
-            # الحصول على محتوى الصفحة الرئيسية
-            response = safe_request(self.url, timeout=self.timeout)
+            # أول قالب يظهر في الصفحة الرئيسية
+            templates, _ = self._homepage_names()
             
-            if response and response.status_code == 200:
-                # البحث عن مسار القالب في محتوى الصفحة
-                template_pattern = r'/templates/([^/]+)'
-                template_matches = re.findall(template_pattern, response.text)
+            if templates:
+                template_name = templates[0]
+                template_info['الاسم'] = template_name
                 
-                if template_matches:
-                    template_name = template_matches[0]
-                    template_info['الاسم'] = template_name
-                    
-                    # التحقق من وجود ملف templateDetails.xml للقالب
-                    template_details_url = urljoin(self.url, f'/templates/{template_name}/templateDetails.xml')
-                    template_details_response = safe_request(template_details_url, timeout=self.timeout)
-                    
-                    if template_details_response and template_details_response.status_code == 200:
-                        # البحث عن معلومات القالب في ملف templateDetails.xml
-                        template_version_pattern = r'<version>([\d.]+)</version>'
-                        template_version_match = re.search(template_version_pattern, template_details_response.text)
-                        
-                        if template_version_match:
-                            template_info['الإصدار'] = template_version_match.group(1)
-                        
-                        template_author_pattern = r'<author>(.+)</author>'
-                        template_author_match = re.search(template_author_pattern, template_details_response.text)
-                        
-                        if template_author_match:
-                            template_info['المطور'] = template_author_match.group(1)
+                # معلومات القالب من ملف templateDetails.xml
+                manifest = self.manifest_details().get(('template', template_name), {})
+                if manifest.get('version'):
+                    template_info['الإصدار'] = manifest['version']
+                if manifest.get('author'):
+                    template_info['المطور'] = manifest['author']
         
         except Exception as e:
             self.logger.error(f"خطأ في الحصول على معلومات القالب: {str(e)}")
@@ -277,57 +371,37 @@ class JoomlaScanner:
         components = []
         
         try:
-            # الحصول على محتوى الصفحة الرئيسية
-            response = safe_request(self.url, timeout=self.timeout)
+            # المكونات المرجعية في الصفحة الرئيسية مع إصداراتها من ملفات البيان
+            _, component_names = self._homepage_names()
+            manifests = self.manifest_details()
             
-            if response and response.status_code == 200:
-                # البحث عن مسارات المكونات في محتوى الصفحة
-                component_pattern = r'com_([a-zA-Z0-9_]+)'
-                component_matches = re.findall(component_pattern, response.text)
+            for component_name in component_names:
+                component_info = {'الاسم': f'com_{component_name}'}
                 
-                # إزالة التكرارات
-                unique_components = set(component_matches)
+                manifest = manifests.get(('component', component_name), {})
+                if manifest.get('version'):
+                    component_info['الإصدار'] = manifest['version']
                 
-                for component_name in unique_components:
-                    components.append({'الاسم': f'com_{component_name}'})
-                    
-                    # محاولة التحقق من وجود ملف XML للمكون
-                    component_xml_url = urljoin(self.url, f'/administrator/components/com_{component_name}/{component_name}.xml')
-                    component_xml_response = safe_request(component_xml_url, timeout=self.timeout)
-                    
-                    if component_xml_response and component_xml_response.status_code == 200:
-                        # البحث عن إصدار المكون في ملف XML
-                        component_version_pattern = r'<version>([\d.]+)</version>'
-                        component_version_match = re.search(component_version_pattern, component_xml_response.text)
-                        
-                        if component_version_match:
-                            components[-1]['الإصدار'] = component_version_match.group(1)
+                components.append(component_info)
         
         except Exception as e:
             self.logger.error(f"خطأ في الحصول على قائمة المكونات: {str(e)}")
         
         return components
     
-    def scan_vulnerabilities(self):
-        """فحص الثغرات الأمنية في جوملا"""
+    def scan_vulnerabilities(self, version=None, extensions=None):
+        """فحص الثغرات الأمنية في جوملا (يمكن تمرير الإصدار المكتشف مسبقًا ونتائج التعداد النشط للامتدادات)"""
         self.logger.info(f"جاري فحص الثغرات الأمنية في جوملا للموقع: {self.url}")
         
         vulnerabilities = []
         
         try:
-            # التحقق من الثغرات الشائعة في جوملا
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                # إنشاء قائمة بالمهام
-                futures = [executor.submit(self._check_vulnerability, vuln) for vuln in self.common_vulnerabilities]
-                
-                # جمع النتائج
-                for future in futures:
-                    result = future.result()
-                    if result:
-                        vulnerabilities.append(result)
+            # الثغرات الشائعة وصفحة تسجيل الدخول دفعة واحدة عبر جلسة الفحص (المسارات المطلوبة مسبقًا لا تُعاد)
+            vulnerabilities.extend(self.session.findings(self.VULNERABILITY_PLAN))
             
-            # التحقق من إصدار جوملا
-            version = self._get_joomla_version()
+            # التحقق من إصدار جوملا (None تعني أن الإصدار لم يُحدد بعد)
+            if version is None:
+                version = self._get_joomla_version()
             if version:
                 # التحقق من الإصدار القديم
                 if self._is_outdated_version(version):
@@ -337,17 +411,28 @@ class JoomlaScanner:
                         'description': f'يستخدم الموقع إصدار قديم من جوملا ({version})، مما قد يعرضه للثغرات الأمنية.',
                         'evidence': f'الإصدار: {version}'
                     })
+                
+                # الثغرات المعروفة لإصدار النواة من قاعدة البيانات المحلية
+                vulnerabilities.extend(known_vulnerabilities('joomla', 'core', 'joomla', version))
+            
+            # الثغرات المعروفة للمكونات والقالب بإصداراتها من ملفات البيان (مجلوبة مرة واحدة لكل فاحص)
+            checked = set()
+            for component in self._get_joomla_components():
+                if 'الإصدار' in component:
+                    checked.add(('component', component['الاسم'], component['الإصدار']))
+                    vulnerabilities.extend(known_vulnerabilities('joomla', 'component', component['الاسم'], component['الإصدار']))
             
-            # التحقق من وجود صفحة تسجيل الدخول الافتراضية
-            admin_url = urljoin(self.url, '/administrator/')
-            admin_response = safe_request(admin_url, timeout=self.timeout)
-            if admin_response and admin_response.status_code == 200:
-                vulnerabilities.append({
-                    'name': 'صفحة تسجيل الدخول الافتراضية',
-                    'severity': 'منخفضة',
-                    'description': 'صفحة تسجيل الدخول الافتراضية متاحة، مما قد يسهل هجمات القوة الغاشمة.',
-                    'evidence': admin_url
-                })
+            # المكونات والوحدات والإضافات المكتشفة بالتعداد النشط بإصداراتها (دون تكرار ما فُحص أعلاه)
+            for kind in ['component', 'module', 'plugin']:
+                for item in (extensions or {}).get(f'{kind}s', []):
+                    name = item.get('name') or extension_name(kind, item['slug'])
+                    if item.get('version') and (kind, name, item['version']) not in checked:
+                        checked.add((kind, name, item['version']))
+                        vulnerabilities.extend(known_vulnerabilities('joomla', kind, name, item['version']))
+            
+            template = self._get_joomla_template()
+            if 'الإصدار' in template:
+                vulnerabilities.extend(known_vulnerabilities('joomla', 'template', template['الاسم'], template['الإصدار']))
             
             if self.verbose:
                 self.logger.debug(f"تم اكتشاف {len(vulnerabilities)} ثغرة أمنية في جوملا")
@@ -358,61 +443,6 @@ class JoomlaScanner:
             self.logger.error(f"خطأ في فحص الثغرات الأمنية في جوملا: {str(e)}")
             return []
     
-    def _check_vulnerability(self, vuln):
-        """التحقق من ثغرة أمنية محددة"""
-        try:
-            full_url = urljoin(self.url, vuln['path'])
-            response = safe_request(full_url, timeout=self.timeout)
-            
-            if response:
-                # إذا كان هناك نمط محدد للبحث
-                if vuln['pattern']:
-                    match = re.search(vuln['pattern'], response.text)
-                    if match:
-                        evidence = match.group(1) if '(' in vuln['pattern'] else vuln['pattern']
-                        return {
-                            'name': vuln['name'],
-                            'severity': vuln['severity'],
-                            'description': vuln['description'],
-                            'evidence': f'تم العثور على "{evidence}" في {vuln["path"]}'
-                        }
-                # حالات خاصة
-                elif vuln['path'] == '/installation/' and response.status_code != 404:
-                    return {
-                        'name': vuln['name'],
-                        'severity': vuln['severity'],
-                        'description': vuln['description'],
-                        'evidence': f'مجلد التثبيت متاح (رمز الحالة: {response.status_code})'
-                    }
-                elif vuln['path'] == '/configuration.php-dist' and response.status_code != 404:
-                    return {
-                        'name': vuln['name'],
-                        'severity': vuln['severity'],
-                        'description': vuln['description'],
-                        'evidence': f'ملف التكوين النموذجي متاح (رمز الحالة: {response.status_code})'
-                    }
-            
-            return None
-        
-        except Exception as e:
-            self.logger.error(f"خطأ في التحقق من الثغرة {vuln['name']}: {str(e)}")
-            return None
-    
     def _is_outdated_version(self, version):
-        """التحقق مما إذا كان إصدار جوملا قديمًا"""
-        # هذه مجرد قيمة افتراضية، يجب تحديثها بانتظام
-        latest_version = '4.3.3'  # آخر إصدار من جوملا وقت كتابة الكود
-        
-        # تحويل الإصدارات إلى قوائم من الأرقام
-        version_parts = list(map(int, version.split('.')))
-        latest_parts = list(map(int, latest_version.split('.')))
-        
-        # مقارنة الإصدارات
-        for i in range(min(len(version_parts), len(latest_parts))):
-            if version_parts[i] < latest_parts[i]:
-                return True
-            elif version_parts[i] > latest_parts[i]:
-                return False
-        
-        # إذا كانت جميع الأجزاء متساوية حتى الآن، فإن الإصدار الأقصر هو الأقدم
-        return len(version_parts) < len(latest_parts)
\ No newline at end of file
+        """التحقق مما إذا كان إصدار جوملا أقدم من آخر إصدار في قاعدة بيانات الثغرات"""
+        return bool(get_vulndb('joomla').is_outdated('core', 'joomla', version))
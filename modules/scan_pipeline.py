@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة مخطط مراحل الفحص القابل للتوصيل
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import time
+import socket
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FutureTimeout
+from .utils import safe_request, extract_domain, is_ip_address
+from .web_scanner import WebScanner
+from .batch_scanner import make_scan_function
+from .cms_detector import CMSDetector, CMS_ENUMERATORS
+from .canonical import canonical_base
+from .concurrency import CANCEL_POLL_INTERVAL, get_governor, new_token, shutdown_executor
+
+# حالات العقد داخل هدف واحد
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+CANCELLED = 'cancelled'
+
+# مدخلات يوفرها المخطط لكل هدف دون عقدة منتجة
+SEED_ARTIFACTS = ('url', 'cancel_token')
+
+class ScanNode:
+    """عقدة في مخطط الفحص بمدخلات ومخرجات صريحة"""
+
+    def __init__(self, name, func, inputs=None, outputs=None, optional_inputs=None):
+        """تهيئة العقدة؛ تستقبل الدالة المدخلات كمعطيات مسماة وتعيد قاموسًا بالمخرجات أو None"""
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs or [])
+        self.outputs = list(outputs or [])
+        # مدخلات اختيارية: ننتظر منتجها إن وجد لكن غيابها لا يمنع تنفيذ العقدة
+        self.optional_inputs = list(optional_inputs or [])
+
+    def __repr__(self):
+        return f"ScanNode({self.name!r}, inputs={self.inputs}, outputs={self.outputs})"
+
+class _TargetState:
+    """حالة تنفيذ المخطط على هدف واحد"""
+
+    def __init__(self, target, nodes, deadline=None):
+        self.target = target
+        self.cancel_token = new_token(deadline)
+        self.artifacts = {'url': target, 'cancel_token': self.cancel_token}
+        self.status = {node.name: PENDING for node in nodes}
+        self.errors = {}
+        self.durations = {}
+        self.truncated = False
+        self.start_time = time.time()
+
+    def finished(self):
+        return all(status in (DONE, FAILED, SKIPPED, CANCELLED) for status in self.status.values())
+
+    def cancel(self):
+        """إيقاف الهدف عند انتهاء مهلته: العقد غير المكتملة تُعلَّم كملغاة"""
+        self.truncated = True
+        for name, status in self.status.items():
+            if status in (PENDING, RUNNING):
+                self.status[name] = CANCELLED
+
+    def to_record(self):
+        """تحويل الحالة إلى سجل قابل للتسلسل؛ المخرجات التي تبدأ بـ _ داخلية ولا تُصدر"""
+        results = {
+            name: value for name, value in self.artifacts.items()
+            if name not in SEED_ARTIFACTS and not name.startswith('_')
+        }
+        return {
+            'target': self.target,
+            'status': 'error' if self.errors else 'ok',
+            'duration': round(time.time() - self.start_time, 2),
+            'truncated': self.truncated,
+            'nodes': dict(self.status),
+            'errors': dict(self.errors),
+            'results': results
+        }
+
+class ScanPipeline:
+    """فئة لتنفيذ مخطط مراحل الفحص (DAG) على عدد كبير من الأهداف"""
+
+    def __init__(self, nodes, max_workers=10, max_targets=None, verbose=False, deadline=None):
+        """تهيئة المخطط والتحقق من صحته؛ deadline هي المهلة الكلية بالثواني لكل هدف"""
+        self.nodes = list(nodes)
+        self.max_workers = max(1, max_workers)
+        # الحد الأقصى للأهداف النشطة في الذاكرة في نفس الوقت
+        self.max_targets = max_targets if max_targets else self.max_workers
+        self.deadline = deadline
+        self.verbose = verbose
+        self.logger = logging.getLogger('jawal')
+
+        self._producers = {}
+        self._validate()
+
+    def _validate(self):
+        """التحقق من تفرد المخرجات ووجود منتج لكل مدخل إلزامي وعدم وجود حلقات"""
+        names = set()
+        for node in self.nodes:
+            if node.name in names:
+                raise ValueError(f"العقدة مكررة: {node.name}")
+            names.add(node.name)
+
+            for output in node.outputs:
+                if output in SEED_ARTIFACTS or output in self._producers:
+                    raise ValueError(f"المخرج {output} تنتجه أكثر من عقدة")
+                self._producers[output] = node.name
+
+        for node in self.nodes:
+            for name in node.inputs:
+                if name not in SEED_ARTIFACTS and name not in self._producers:
+                    raise ValueError(f"العقدة {node.name} تحتاج إلى مدخل لا تنتجه أي عقدة: {name}")
+
+        # ترتيب طوبولوجي للكشف عن الحلقات
+        remaining = {node.name: self._upstream(node) for node in self.nodes}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"توجد اعتماديات دائرية بين العقد: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _upstream(self, node):
+        """أسماء العقد التي تنتج مدخلات العقدة"""
+        return {
+            self._producers[name] for name in node.inputs + node.optional_inputs
+            if name in self._producers
+        }
+
+    def run(self, targets):
+        """تنفيذ المخطط على الأهداف وإرجاع سجل كل هدف فور اكتماله (مولد)"""
+        target_iter = iter(targets)
+        exhausted = False
+        active = []
+        running = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                # سحب أهداف جديدة بشكل كسول حسب السعة المتاحة
+                while not exhausted and len(active) < self.max_targets:
+                    try:
+                        target = next(target_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    active.append(_TargetState(target, self.nodes, deadline=self.deadline))
+
+                for state in active:
+                    if state.cancel_token.cancelled and not state.finished():
+                        # التخلي عن عقد الهدف الجارية وإصدار نتائجه الجزئية
+                        self.logger.warning(f"انتهت مهلة الهدف {state.target}؛ سيتم إصدار نتائج جزئية")
+                        state.cancel()
+                        for future in [future for future, (owner, _) in running.items() if owner is state]:
+                            del running[future]
+                    else:
+                        self._schedule(state, executor, running)
+
+                # إصدار الأهداف المكتملة وتحرير مكانها
+                for state in [state for state in active if state.finished()]:
+                    active.remove(state)
+                    yield state.to_record()
+
+                if not running:
+                    if exhausted and not active:
+                        break
+                    continue
+
+                done, _ = wait(running, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    state, node = running.pop(future)
+                    self._complete(state, node, future.result())
+        finally:
+            # لا ننتظر العقد المتروكة عند المقاطعة أو إغلاق المولد
+            shutdown_executor(executor)
+
+    def _schedule(self, state, executor, running):
+        """إرسال العقد الجاهزة وتخطي العقد التي فشلت متطلباتها"""
+        changed = True
+        while changed:
+            changed = False
+            for node in self.nodes:
+                if state.status[node.name] != PENDING:
+                    continue
+
+                blocked = False
+                for name in node.inputs + node.optional_inputs:
+                    if name in state.artifacts or name not in self._producers:
+                        continue
+                    producer_status = state.status[self._producers[name]]
+                    if producer_status in (PENDING, RUNNING):
+                        blocked = True
+                    elif name in node.inputs:
+                        # المنتج انتهى دون إنتاج المدخل الإلزامي: تخطي العقدة وما بعدها
+                        state.status[node.name] = SKIPPED
+                        changed = True
+                        break
+
+                if state.status[node.name] != PENDING or blocked:
+                    continue
+
+                kwargs = {
+                    name: state.artifacts[name] for name in node.inputs + node.optional_inputs
+                    if name in state.artifacts
+                }
+                state.status[node.name] = RUNNING
+                future = executor.submit(self._run_node, node, kwargs)
+                running[future] = (state, node)
+
+    def _run_node(self, node, kwargs):
+        """تنفيذ عقدة واحدة مع عزل أخطائها"""
+        start_time = time.time()
+        try:
+            if self.verbose:
+                self.logger.debug(f"بدء العقدة {node.name}: {kwargs.get('url', '')}")
+            return (node.func(**kwargs), None, time.time() - start_time)
+        except Exception as e:
+            return (None, str(e), time.time() - start_time)
+
+    def _complete(self, state, node, outcome):
+        """تسجيل نتيجة العقدة ونشر مخرجاتها"""
+        outputs, error, duration = outcome
+        state.durations[node.name] = round(duration, 2)
+
+        if error is not None:
+            self.logger.error(f"خطأ في العقدة {node.name} للهدف {state.target}: {error}")
+            state.status[node.name] = FAILED
+            state.errors[node.name] = error
+            return
+
+        state.status[node.name] = DONE
+        for name, value in (outputs or {}).items():
+            if name in node.outputs:
+                state.artifacts[name] = value
+
+def build_default_nodes(ports=None, timeout=30, verbose=False):
+    """إنشاء عقد الفحص الافتراضية"""
+    def resolve(url, cancel_token):
+        domain = extract_domain(url).split(':')[0]
+        if is_ip_address(domain):
+            return {'ip': domain}
+
+        # التحليل عبر ميزانية socket المشتركة مع تقييد الانتظار بمهلة الهدف؛ الاستعلام العالق لا يحجز العقدة
+        future = get_governor().submit('socket', socket.gethostbyname, domain)
+        try:
+            return {'ip': future.result(timeout=cancel_token.clamp_timeout(timeout))}
+        except FutureTimeout:
+            future.cancel()
+            raise TimeoutError(f"انتهت مهلة تحليل النطاق: {domain}")
+
+    def port_scan(url, ip, cancel_token):
+        scanner = WebScanner(url, ports=ports, timeout=timeout, verbose=verbose, cancel_token=cancel_token)
+        return {'open_ports': scanner.scan_ports(ip=ip)}
+
+    def http_probe(url, ip, cancel_token):
+        response = safe_request(url, timeout=timeout, cancel_token=cancel_token)
+        if response is None:
+            return None
+        scanner = WebScanner(url, ports=ports, timeout=timeout, verbose=verbose, cancel_token=cancel_token)
+        return {'_homepage': response, 'site_info': scanner.get_site_info(response=response)}
+
+    def fingerprint(url, _homepage, cancel_token):
+        scanner = WebScanner(url, ports=ports, timeout=timeout, verbose=verbose, cancel_token=cancel_token)
+        return {
+            'technologies': scanner.detect_technologies(response=_homepage),
+            'vulnerabilities': scanner.scan_vulnerabilities(response=_homepage)
+        }
+
+    def cms_detect(url, _homepage, cancel_token):
+        # العنوان الأساسي من سلسلة توجيه الصفحة الرئيسية المجلوبة دون طلب جديد
+        base_url = canonical_base(url, _homepage.url)
+        detector = CMSDetector(base_url, timeout=timeout, verbose=verbose, cancel_token=cancel_token)
+        detection = detector.detect(response=_homepage)
+        if not detection['cms']:
+            # لا يوجد نظام إدارة محتوى معروف: يتم تخطي مرحلة التعداد
+            return {'cms_detection': detection}
+        return {'cms': detection['cms'], 'cms_detection': detection, '_cms_session': detector.session}
+
+    def cms_enumerate(url, cms, cancel_token, _cms_session):
+        if cms not in CMS_ENUMERATORS:
+            # لا يوجد فاحص متخصص لهذا النظام
+            return None
+        # الفاحص المتخصص يرث جلسة الكاشف (الصفحة الرئيسية ومسارات التحقق) فلا يعيد طلبها
+        scan_func = make_scan_function(CMS_ENUMERATORS[cms], timeout=timeout, verbose=verbose)
+        return {'cms_results': scan_func(_cms_session.url, cancel_token=cancel_token, session=_cms_session)}
+
+    def report(url, **artifacts):
+        summary = {'url': url}
+        summary['open_ports'] = len(artifacts.get('open_ports') or [])
+        summary['technologies'] = [tech.get('name', '') for tech in artifacts.get('technologies') or []]
+        summary['vulnerabilities'] = len(artifacts.get('vulnerabilities') or [])
+        summary['cms'] = artifacts.get('cms')
+        return {'report': summary}
+
+    return {
+        'resolve': ScanNode('resolve', resolve, inputs=['url', 'cancel_token'], outputs=['ip']),
+        'port-scan': ScanNode('port-scan', port_scan, inputs=['url', 'ip', 'cancel_token'], outputs=['open_ports']),
+        'http-probe': ScanNode('http-probe', http_probe, inputs=['url', 'ip', 'cancel_token'],
+                               outputs=['_homepage', 'site_info']),
+        'fingerprint': ScanNode('fingerprint', fingerprint, inputs=['url', '_homepage', 'cancel_token'],
+                                outputs=['technologies', 'vulnerabilities']),
+        'cms-detect': ScanNode('cms-detect', cms_detect, inputs=['url', '_homepage', 'cancel_token'],
+                               outputs=['cms', 'cms_detection', '_cms_session']),
+        'cms-enumerate': ScanNode('cms-enumerate', cms_enumerate,
+                                  inputs=['url', 'cms', 'cancel_token', '_cms_session'], outputs=['cms_results']),
+        'report': ScanNode('report', report, inputs=['url'],
+                           optional_inputs=['open_ports', 'technologies', 'vulnerabilities', 'cms', 'cms_results'],
+                           outputs=['report']),
+    }
+
+# ملفات تعريف الفحص: أسماء العقد المستخدمة في كل ملف
+SCAN_PROFILES = {
+    'web': ['resolve', 'port-scan', 'http-probe', 'fingerprint', 'report'],
+    'cms': ['resolve', 'http-probe', 'fingerprint', 'cms-detect', 'cms-enumerate', 'report'],
+    'full': ['resolve', 'port-scan', 'http-probe', 'fingerprint', 'cms-detect', 'cms-enumerate', 'report'],
+}
+
+def build_pipeline(profile='web', ports=None, timeout=30, max_workers=10, verbose=False, extra_nodes=None, deadline=None):
+    """إنشاء مخطط فحص لملف تعريف محدد مع إمكانية إضافة عقد مخصصة"""
+    if profile not in SCAN_PROFILES:
+        raise ValueError(f"ملف تعريف الفحص غير معروف: {profile}")
+
+    available = build_default_nodes(ports=ports, timeout=timeout, verbose=verbose)
+    nodes = [available[name] for name in SCAN_PROFILES[profile]]
+    nodes.extend(extra_nodes or [])
+
+    return ScanPipeline(nodes, max_workers=max_workers, verbose=verbose, deadline=deadline)
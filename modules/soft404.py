@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة معايرة صفحات الخطأ المخصصة (soft-404) والمواقع التي تجيب على كل المسارات
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import re
+import math
+import uuid
+import hashlib
+import logging
+import threading
+from collections import namedtuple
+from concurrent.futures import Future
+
+# عدد البتات في بصمة المحتوى والمسافة القصوى لاعتبار صفحتين متشابهتين
+SIMHASH_BITS = 64
+SIMHASH_DISTANCE = 6
+
+# أساس سلم أطوال الاستجابات (كل درجة أكبر بنحو 10% من سابقتها)
+LENGTH_BUCKET_BASE = 1.1
+
+# عدد المسارات العشوائية المطلوبة لمعايرة كل شكل من أشكال المسارات
+CALIBRATION_SAMPLES = 2
+
+# الحالات التي تعني عدم الوجود مباشرة دون حاجة إلى معايرة
+NOT_FOUND_STATUSES = (404, 410)
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+# بصمة استجابة: الحالة ودرجة الطول وبصمة المحتوى (None بدون جسم) ووجهة التوجيه
+Fingerprint = namedtuple('Fingerprint', ['status', 'bucket', 'simhash', 'location'])
+
+def response_length(response):
+    """طول الاستجابة من Content-Length أو من المحتوى (None إذا تعذر تحديده)"""
+    length = response.headers.get('Content-Length')
+    if length and length.isdigit():
+        return int(length)
+    if response.request is not None and response.request.method == 'HEAD':
+        return None
+    return len(response.content or b'')
+
+def length_bucket(length):
+    """درجة الطول على سلم لوغاريتمي حتى تقع الأطوال المتقاربة في الدرجة نفسها أو المجاورة"""
+    if length is None:
+        return None
+    return int(math.log(length + 1) / math.log(LENGTH_BUCKET_BASE))
+
+def simhash(text, bits=SIMHASH_BITS):
+    """بصمة SimHash لكلمات النص؛ النصوص المتشابهة تختلف في عدد قليل من البتات"""
+    weights = [0] * bits
+    counts = {}
+    for token in _TOKEN.findall(text.lower()):
+        counts[token] = counts.get(token, 0) + 1
+
+    for token, count in counts.items():
+        value = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=bits // 8).digest(), 'big')
+        for bit in range(bits):
+            weights[bit] += count if value >> bit & 1 else -count
+
+    return sum(1 << bit for bit in range(bits) if weights[bit] > 0)
+
+def hamming(first, second):
+    """عدد البتات المختلفة بين بصمتين"""
+    return bin(first ^ second).count('1')
+
+def fingerprint(response, reflected=()):
+    """بصمة استجابة بعد حذف النصوص المنعكسة من المسار المطلوب (مثل المعرف العشوائي)"""
+    location = response.headers.get('Location', '')
+    body = None
+    if response.request is None or response.request.method != 'HEAD':
+        body = response.text or ''
+
+    for text in reflected:
+        if text:
+            location = location.replace(text, '')
+            if body is not None:
+                body = body.replace(text, '')
+
+    return Fingerprint(
+        response.status_code,
+        length_bucket(response_length(response)),
+        simhash(body) if body is not None else None,
+        location if 300 <= response.status_code < 400 else None,
+    )
+
+def similar(first, second):
+    """هل تمثل البصمتان الصفحة نفسها (الحالة نفسها مع محتوى متشابه أو طول متقارب عند غياب المحتوى)"""
+    if first.status != second.status:
+        return False
+    if first.location is not None or second.location is not None:
+        return first.location == second.location
+    if first.simhash is not None and second.simhash is not None:
+        return hamming(first.simhash, second.simhash) <= SIMHASH_DISTANCE
+    if first.bucket is None or second.bucket is None:
+        # لا جسم ولا طول: الحالة وحدها لا تميز بين صفحتين
+        return True
+    return abs(first.bucket - second.bucket) <= 1
+
+class Soft404Profile:
+    """بصمات صفحة الخطأ لشكل واحد من المسارات مع تصنيف في زمن ثابت"""
+
+    def __init__(self, fingerprints):
+        """تهيئة الملف من بصمات المسارات العشوائية"""
+        # الحالة -> بصمات صفحات الخطأ بهذه الحالة (عدد صغير ثابت)
+        self.index = {}
+        for sample in fingerprints:
+            self.index.setdefault(sample.status, []).append(sample)
+
+        # الموقع يجيب بغير 404 على مسارات غير موجودة
+        self.answers_everything = any(sample.status not in NOT_FOUND_STATUSES for sample in fingerprints)
+        # المسارات العشوائية متشابهة فيما بينها؛ وإلا فلا يمكن تمييز الموجود من غيره
+        self.stable = all(similar(fingerprints[0], sample) for sample in fingerprints[1:])
+
+    @property
+    def indistinguishable(self):
+        """موقع يجيب على كل شيء بصفحات متغيرة لا يمكن معايرتها (يجب إيقاف التعداد عليه)"""
+        return self.answers_everything and not self.stable
+
+    def matches(self, sample):
+        """هل تطابق البصمة صفحة الخطأ المعايرة"""
+        if sample.status in NOT_FOUND_STATUSES or self.indistinguishable:
+            return True
+        return any(similar(sample, baseline) for baseline in self.index.get(sample.status, ()))
+
+def path_shape(path):
+    """شكل المسار الذي تُعاير صفحة خطئه: مجلد أو ملف PHP أو ملف ثابت أو مسار بلا امتداد"""
+    if path.endswith('/'):
+        return 'dir'
+    name = path.rsplit('/', 1)[-1]
+    if '.' not in name:
+        return 'bare'
+    return 'php' if name.lower().endswith('.php') else 'file'
+
+# مسار عشوائي لكل شكل ({token} هو المعرف العشوائي)
+SHAPE_PATHS = {
+    'dir': '/{token}/',
+    'php': '/{token}.php',
+    'file': '/{token}.txt',
+    'bare': '/{token}',
+}
+
+class Soft404Detector:
+    """معايرة صفحات الخطأ لهدف واحد مرة واحدة لكل شكل مسار؛ الاستجابات 404 لا تحتاج إلى تصنيف
+
+    request دالة تأخذ المسار وتعيد الاستجابة بنفس طريقة طلب المسارات المفحوصة، و submit (اختيارية)
+    تأخذ المسار وتعيد Future لإرسال طلبات معايرة عدة أشكال معًا عبر prefetch.
+    """
+
+    def __init__(self, request, samples=CALIBRATION_SAMPLES, submit=None):
+        """تهيئة الكاشف"""
+        self.request = request
+        self.submit = submit
+        self.samples = samples
+        self.logger = logging.getLogger('jawal')
+        # المفتاح -> Future بملف صفحة الخطأ؛ القفل يحمي القاموسين فقط ولا يُمسك أثناء الطلبات
+        self._profiles = {}
+        # المفتاح -> [(المعرف العشوائي، Future)] لطلبات المعايرة المرسلة مسبقًا
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, keys):
+        """إرسال طلبات معايرة الأشكال المطلوبة دفعة واحدة (بالتوازي) قبل الحاجة إليها"""
+        if self.submit is None:
+            return
+        with self._lock:
+            for key in keys:
+                if key in self._profiles or key in self._pending:
+                    continue
+                tokens = [f"jawal{uuid.uuid4().hex[:12]}" for _ in range(self.samples)]
+                self._pending[key] = [(token, self.submit(SHAPE_PATHS[key].format(token=token))) for token in tokens]
+
+    def profile(self, key, template=None):
+        """ملف صفحة الخطأ لمفتاح (يُعاير مرة واحدة بطلب مسارات عشوائية من القالب)؛ None عند تعذر المعايرة"""
+        with self._lock:
+            result = self._profiles.get(key)
+            owner = result is None
+            if owner:
+                # أول من يطلب المفتاح يعايره؛ البقية ينتظرون هذا المفتاح وحده
+                result = self._profiles[key] = Future()
+                pending = self._pending.pop(key, None)
+
+        if owner:
+            try:
+                result.set_result(self._calibrate(key, template or SHAPE_PATHS[key], pending))
+            except Exception as e:
+                # لا تُحفظ المعايرة الفاشلة حتى يُعاد المحاولة في الطلب التالي
+                with self._lock:
+                    del self._profiles[key]
+                result.set_exception(e)
+        return result.result()
+
+    def _calibrate(self, key, template, pending):
+        """طلب المسارات العشوائية (أو انتظار المرسلة مسبقًا) وبناء ملف صفحة الخطأ منها"""
+        fingerprints = []
+        for index in range(self.samples):
+            if pending:
+                token, future = pending[index]
+                path = SHAPE_PATHS[key].format(token=token)
+                response = future.result()
+            else:
+                token = f"jawal{uuid.uuid4().hex[:12]}"
+                path = template.format(token=token)
+                response = self.request(path)
+            if response is None:
+                return None
+            # المسار كاملًا أولًا ثم المعرف وحده، حتى لا يبقى من المسار المنعكس ما يختلف بين الصفحات
+            fingerprints.append(fingerprint(response, reflected=(path, token)))
+
+        profile = Soft404Profile(fingerprints)
+        if profile.indistinguishable:
+            self.logger.warning(f"الموقع يجيب على كل المسارات بصفحات متغيرة ({key})؛ لا يمكن تمييز المسارات الموجودة")
+        return profile
+
+    def is_soft404(self, path, response):
+        """هل الاستجابة لمسار صفحة خطأ (404 حقيقية أو مخصصة)؛ المعايرة لا تحدث إلا لاستجابات غير 404"""
+        if response is None or response.status_code in NOT_FOUND_STATUSES:
+            return True
+
+        profile = self.profile(path_shape(path))
+        if profile is None:
+            # تعذرت المعايرة: السلوك السابق (أي استجابة غير 404 تعني الوجود)
+            return False
+
+        stem = path.rstrip('/').rsplit('/', 1)[-1].rsplit('.', 1)[0]
+        return profile.matches(fingerprint(response, reflected=(path, stem)))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة جدولة مراحل الفحص المتوازية
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .concurrency import CANCEL_POLL_INTERVAL, get_root_token, shutdown_executor
+
+class StageScheduler:
+    """فئة لتنفيذ مراحل الفحص المستقلة بالتوازي مع احترام الاعتماديات بينها"""
+
+    def __init__(self, max_workers=None, on_stage_done=None, verbose=False, cancel_token=None):
+        """تهيئة مجدول المراحل"""
+        self.max_workers = max_workers
+        self.on_stage_done = on_stage_done
+        self.cancel_token = cancel_token or get_root_token()
+        self.verbose = verbose
+        self.logger = logging.getLogger('jawal')
+
+        # المراحل بترتيب الإضافة: الاسم -> {'func': ..., 'depends_on': [...]}
+        self.stages = {}
+        self.results = {}
+        self.errors = {}
+        self.durations = {}
+        # True إذا توقف التنفيذ بسبب الإلغاء أو انتهاء المهلة قبل اكتمال جميع المراحل
+        self.truncated = False
+
+    def add_stage(self, name, func, depends_on=None):
+        """إضافة مرحلة؛ تستقبل الدالة نتائج المراحل التي تعتمد عليها كمعطيات مسماة"""
+        if name in self.stages:
+            raise ValueError(f"المرحلة مكررة: {name}")
+
+        self.stages[name] = {
+            'func': func,
+            'depends_on': list(depends_on or []),
+        }
+        return self
+
+    def _validate(self):
+        """التحقق من وجود الاعتماديات وعدم وجود حلقات بينها"""
+        for name, stage in self.stages.items():
+            for dependency in stage['depends_on']:
+                if dependency not in self.stages:
+                    raise ValueError(f"المرحلة {name} تعتمد على مرحلة غير معروفة: {dependency}")
+
+        # ترتيب طوبولوجي للكشف عن الحلقات
+        remaining = {name: set(stage['depends_on']) for name, stage in self.stages.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"توجد اعتماديات دائرية بين المراحل: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def run(self):
+        """تنفيذ جميع المراحل وإرجاع قاموس بنتائجها (جزئية عند الإلغاء أو انتهاء المهلة)"""
+        self._validate()
+
+        pending = dict(self.stages)
+        running = {}
+        max_workers = self.max_workers or max(1, len(self.stages))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while pending or running:
+                # عند الإلغاء نتوقف عن الجدولة ونتخلى عن المراحل الجارية
+                if self.cancel_token.cancelled:
+                    self.truncated = True
+                    self.logger.warning(f"تم إيقاف المراحل بسبب الإلغاء أو انتهاء المهلة: {', '.join(list(pending) + list(running.values()))}")
+                    break
+
+                # إرسال جميع المراحل التي اكتملت اعتمادياتها
+                for name in list(pending):
+                    stage = pending[name]
+                    if all(dep in self.results for dep in stage['depends_on']):
+                        kwargs = {dep: self.results[dep] for dep in stage['depends_on']}
+                        future = executor.submit(self._run_stage, name, stage['func'], kwargs)
+                        running[future] = name
+                        del pending[name]
+
+                if not running:
+                    break
+
+                # معالجة المراحل فور اكتمالها بدلًا من انتظارها بالترتيب (مع فحص الإلغاء دوريًا)
+                done, _ = wait(running, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    self.results[name] = future.result()
+
+                    if self.on_stage_done:
+                        try:
+                            self.on_stage_done(name, self.results[name])
+                        except Exception as e:
+                            self.logger.error(f"خطأ في معالجة اكتمال المرحلة {name}: {str(e)}")
+        finally:
+            # لا ننتظر المراحل المتروكة؛ طلباتها مقيدة بمهلة رمز الإلغاء
+            shutdown_executor(executor)
+
+        return self.results
+
+    def _run_stage(self, name, func, kwargs):
+        """تنفيذ مرحلة واحدة مع عزل أخطائها عن بقية المراحل"""
+        start_time = time.time()
+
+        try:
+            if self.verbose:
+                self.logger.debug(f"بدء المرحلة: {name}")
+            return func(**kwargs)
+        except Exception as e:
+            self.logger.error(f"خطأ في تنفيذ المرحلة {name}: {str(e)}")
+            self.errors[name] = str(e)
+            return None
+        finally:
+            self.durations[name] = round(time.time() - start_time, 2)
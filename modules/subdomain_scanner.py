@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة اكتشاف النطاقات الفرعية بالقوة الغاشمة عبر استعلامات DNS غير متزامنة
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import time
+import uuid
+import random
+import asyncio
+import logging
+import itertools
+import dns.exception
+import dns.resolver
+import dns.asyncresolver
+from .concurrency import new_token, CANCEL_POLL_INTERVAL
+from .vulndb import DATA_DIR
+from .wordlist import iter_wordlist
+
+# قائمة الأسماء المضمنة (الأكثر شيوعًا)
+DEFAULT_WORDLIST = os.path.join(DATA_DIR, 'subdomains.txt')
+
+# خوادم DNS العامة عند تعذر قراءة إعدادات النظام
+PUBLIC_RESOLVERS = ['1.1.1.1', '8.8.8.8', '9.9.9.9', '208.67.222.222']
+
+# الإعدادات الافتراضية: الاستعلامات المعلقة في آن واحد ومهلة الاستعلام الواحد ومحاولاته
+DEFAULT_DNS_CONCURRENCY = 1000
+DEFAULT_DNS_TIMEOUT = 2.0
+DEFAULT_DNS_RETRIES = 3
+
+# أساس الانتظار المتزايد بين المحاولات بالثواني (يتضاعف مع كل محاولة)
+BACKOFF_BASE = 0.25
+
+# عدد الأسماء العشوائية المستخدمة لكشف DNS الشامل (wildcard)
+WILDCARD_SAMPLES = 3
+
+# واصفات الملفات المحجوزة لغير مقابس DNS عند تقييد التوازي بحد النظام
+FD_RESERVE = 64
+
+def system_resolvers():
+    """خوادم DNS من إعدادات النظام (أو الخوادم العامة إذا تعذرت قراءتها)"""
+    try:
+        return list(dns.resolver.Resolver().nameservers) or list(PUBLIC_RESOLVERS)
+    except dns.exception.DNSException:
+        return list(PUBLIC_RESOLVERS)
+
+def parse_resolvers(spec):
+    """تحليل قائمة الخوادم (مفصولة بفواصل أو ملف بخادم في كل سطر) إلى [(العنوان، المنفذ)]"""
+    if not spec:
+        return []
+
+    if os.path.isfile(spec):
+        with open(spec, 'r', encoding='utf-8') as f:
+            entries = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    else:
+        entries = [entry.strip() for entry in spec.split(',') if entry.strip()]
+
+    resolvers = []
+    for entry in entries:
+        # IPv6 بمنفذ يُكتب بين قوسين: [::1]:5353
+        if entry.startswith('['):
+            address, _, port = entry[1:].partition(']')
+            port = port.lstrip(':')
+        elif entry.count(':') == 1:
+            address, _, port = entry.partition(':')
+        else:
+            address, port = entry, ''
+        if port and not port.isdigit():
+            raise ValueError(f"منفذ غير صالح لخادم DNS: {entry}")
+        resolvers.append((address, int(port) if port else 53))
+    return resolvers
+
+def _label(word):
+    """اسم النطاق الفرعي بصيغته القياسية (DNS لا يميز حالة الأحرف)"""
+    return word.strip('.').lower()
+
+def max_in_flight(concurrency):
+    """تقييد الاستعلامات المعلقة بحد واصفات الملفات في النظام (لكل استعلام مقبس مستقل)"""
+    try:
+        import resource
+    except ImportError:
+        return concurrency
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return concurrency
+    return max(1, min(concurrency, soft - FD_RESERVE))
+
+class SubdomainScanner:
+    """فئة لحل أسماء النطاقات الفرعية من قائمة كلمات بآلاف الاستعلامات المعلقة عبر مجموعة خوادم
+
+    الاستعلامات توزع على الخوادم بالتناوب، والمحاولة الفاشلة تُعاد على الخادم التالي بعد انتظار متزايد،
+    والأسماء التي لا تُحل إلا إلى عناوين DNS الشامل تُستبعد.
+    """
+
+    def __init__(self, domain, resolvers=None, concurrency=DEFAULT_DNS_CONCURRENCY, timeout=DEFAULT_DNS_TIMEOUT,
+                 retries=DEFAULT_DNS_RETRIES, verbose=False, cancel_token=None, time_budget=None):
+        """تهيئة الفاحص؛ resolvers قائمة [(العنوان، المنفذ)] أو عناوين فقط (خوادم النظام افتراضيًا)"""
+        self.domain = domain.lower().strip('.')
+        self.resolvers = [resolver if isinstance(resolver, tuple) else (resolver, 53)
+                          for resolver in resolvers or system_resolvers()]
+        self.concurrency = max_in_flight(concurrency)
+        self.timeout = timeout
+        self.retries = retries
+        self.verbose = verbose
+        self.cancel_token = cancel_token
+        self.time_budget = time_budget
+        self.logger = logging.getLogger('jawal')
+
+        # عناوين DNS الشامل للنطاق (فارغة إذا لم يكن شاملًا)
+        self.wildcard = set()
+        # الاستعلامات المكتملة، والأسماء التي أُجيب عليها بعناوين (بما فيها أسماء DNS الشامل المستبعدة)
+        self.queried = 0
+        self.resolved = 0
+        self.failed = 0
+        self.truncated = False
+        self._pool = None
+
+    def run(self, wordlist=None, on_found=None):
+        """حل كل أسماء القائمة وإرجاع {'domain', 'subdomains': [...], 'wildcard': [...], 'queried', 'resolved', 'failed', 'truncated'}
+
+        on_found دالة تُستدعى لكل نطاق فرعي فور حله (من خيط الفحص نفسه، فيجب أن تكون سريعة)
+        لتمرير النتائج إلى مراحل الفحص التالية دون انتظار نهاية القائمة.
+        """
+        self.logger.info(f"جاري اكتشاف النطاقات الفرعية للنطاق: {self.domain}")
+        start_time = time.time()
+        found = []
+
+        def collect(result):
+            found.append(result)
+            if on_found:
+                on_found(result)
+
+        # رمز فرعي بميزانية زمنية: عند انتهائها تُعاد النطاقات التي حُلت حتى الآن
+        token = new_token(self.time_budget, parent=self.cancel_token)
+        try:
+            asyncio.run(self._run(wordlist or DEFAULT_WORDLIST, collect, token))
+        finally:
+            token.cancel()
+
+        if self.verbose:
+            self.logger.debug(f"تم حل {self.resolved} من {self.queried} اسمًا خلال {time.time() - start_time:.2f} ثانية")
+
+        return {
+            'domain': self.domain,
+            'subdomains': found,
+            'wildcard': sorted(self.wildcard),
+            'queried': self.queried,
+            'resolved': self.resolved,
+            'failed': self.failed,
+            'truncated': self.truncated,
+        }
+
+    async def _run(self, wordlist, on_found, cancel_token):
+        """كشف DNS الشامل ثم حل الأسماء بنافذة محدودة من الاستعلامات المعلقة"""
+        self._pool = itertools.cycle([self._make_resolver(address, port) for address, port in self.resolvers])
+        self.wildcard = await self.detect_wildcard()
+        if self.wildcard:
+            self.logger.warning(f"النطاق {self.domain} يستخدم DNS شاملًا ({', '.join(sorted(self.wildcard))})؛ "
+                                f"ستُستبعد الأسماء التي تُحل إلى هذه العناوين فقط")
+
+        names = (f"{word}.{self.domain}" for word in iter_wordlist(wordlist, normalize=_label))
+        pending = set()
+
+        while True:
+            while not cancel_token.cancelled and len(pending) < self.concurrency:
+                name = next(names, None)
+                if name is None:
+                    break
+                pending.add(asyncio.ensure_future(self._lookup(name)))
+
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(pending, timeout=CANCEL_POLL_INTERVAL,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                self.queried += 1
+                result = task.result()
+                if not result:
+                    continue
+                self.resolved += 1
+                if not self.is_wildcard(result):
+                    if self.verbose:
+                        self.logger.debug(f"تم العثور على النطاق الفرعي: {result['host']}")
+                    on_found(result)
+
+            if cancel_token.cancelled:
+                for task in pending:
+                    task.cancel()
+                self.truncated = True
+                break
+
+    async def detect_wildcard(self):
+        """عناوين الأسماء العشوائية غير الموجودة (DNS الشامل يجيب عليها جميعًا)"""
+        names = [f"jawal{uuid.uuid4().hex[:12]}.{self.domain}" for _ in range(WILDCARD_SAMPLES)]
+        results = await asyncio.gather(*(self._lookup(name) for name in names))
+        return {address for result in results if result for address in result['addresses']}
+
+    def is_wildcard(self, result):
+        """هل يُحل الاسم إلى عناوين DNS الشامل فقط"""
+        return bool(self.wildcard) and set(result['addresses']) <= self.wildcard
+
+    def _make_resolver(self, address, port):
+        """محلل غير متزامن لخادم واحد دون إعادة محاولة داخلية (إعادة المحاولة تنتقل إلى الخادم التالي)"""
+        resolver = dns.asyncresolver.Resolver(configure=False)
+        resolver.nameservers = [address]
+        resolver.port = port
+        resolver.timeout = self.timeout
+        resolver.lifetime = self.timeout
+        resolver.retry_servfail = False
+        return resolver
+
+    async def _lookup(self, name):
+        """حل سجل A لاسم واحد؛ None إذا لم يكن موجودًا أو فشلت كل المحاولات"""
+        for attempt in range(self.retries):
+            resolver = next(self._pool)
+            try:
+                answer = await resolver.resolve(name, 'A')
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                return None
+            except (dns.exception.Timeout, dns.resolver.NoNameservers, OSError):
+                # خادم بطيء أو رافض أو مُثقل: المحاولة التالية على خادم آخر بعد انتظار متزايد
+                await asyncio.sleep(BACKOFF_BASE * 2 ** attempt * random.uniform(0.5, 1.5))
+                continue
+            except dns.exception.DNSException:
+                # اسم غير صالح (مثل تسمية أطول من 63 حرفًا)
+                return None
+
+            canonical = str(answer.canonical_name).rstrip('.').lower()
+            return {
+                'host': name,
+                'addresses': sorted({record.address for record in answer}),
+                'cname': canonical if canonical != name else None,
+            }
+
+        self.failed += 1
+        return None
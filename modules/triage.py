@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة الفرز السريع للأهداف قبل الفحص العميق
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import time
+import logging
+from .utils import safe_request
+from .stage_scheduler import StageScheduler
+from .concurrency import new_token
+from .web_scanner import WebScanner
+from .cms_detector import CMSDetector
+
+# عينة صغيرة من المنافذ الأكثر دلالة لمرحلة الفرز
+TRIAGE_PORTS = [21, 22, 80, 443, 3306, 3389, 8080, 8443]
+
+# منافذ خدمات لا يُتوقع كشفها للعامة (قواعد بيانات، إدارة عن بعد، FTP)
+RISKY_PORTS = {21, 23, 3306, 3389, 5432, 6379, 27017}
+
+# أوزان خطورة الثغرات في حساب الدرجة
+SEVERITY_WEIGHTS = {
+    'عالية': 15,
+    'متوسطة': 8,
+    'منخفضة': 3,
+}
+
+# المهلة القصوى لطلبات الفرز بالثواني (الفرز يفضل السرعة على الاكتمال)
+TRIAGE_TIMEOUT = 5
+
+def triage_score(findings):
+    """حساب درجة أولوية الهدف (0-100) من نتائج الفرز"""
+    if not findings.get('reachable') and not findings.get('open_ports'):
+        return 0
+
+    score = 10 if findings.get('reachable') else 0
+
+    for port in findings.get('open_ports') or []:
+        score += 10 if port.get('port') in RISKY_PORTS else 5
+
+    # وجود نظام إدارة محتوى يعني أن التعداد العميق سيكشف أكثر
+    if findings.get('cms'):
+        score += 25
+
+    for vuln in findings.get('vulnerabilities') or []:
+        score += SEVERITY_WEIGHTS.get(vuln.get('severity'), 0)
+
+    score += 2 * len(findings.get('missing_headers') or [])
+
+    return min(score, 100)
+
+class TriageScanner:
+    """فئة لفرز هدف واحد بطلب واحد للصفحة الرئيسية وعينة صغيرة من المنافذ"""
+
+    def __init__(self, url, ports=None, timeout=TRIAGE_TIMEOUT, verbose=False, cancel_token=None):
+        """تهيئة فاحص الفرز"""
+        self.url = url
+        self.ports = ports if ports else TRIAGE_PORTS
+        self.timeout = min(timeout, TRIAGE_TIMEOUT)
+        self.verbose = verbose
+        self.cancel_token = cancel_token
+        self.logger = logging.getLogger('jawal')
+
+        self.web_scanner = WebScanner(url, ports=self.ports, timeout=self.timeout,
+                                      verbose=verbose, cancel_token=cancel_token)
+
+    def triage(self):
+        """تنفيذ الفرز وإرجاع النتائج مع درجة الأولوية"""
+        start_time = time.time()
+
+        # جلب الصفحة الرئيسية وفحص عينة المنافذ بالتوازي
+        scheduler = StageScheduler(verbose=self.verbose, cancel_token=self.cancel_token)
+        scheduler.add_stage('homepage', self._fetch_homepage)
+        scheduler.add_stage('open_ports', self.web_scanner.scan_ports)
+        stages = scheduler.run()
+
+        response = stages.get('homepage')
+        findings = {
+            'reachable': response is not None,
+            'open_ports': stages.get('open_ports') or [],
+            'cms': None,
+            'technologies': [],
+            'vulnerabilities': [],
+            'missing_headers': [],
+        }
+
+        if response is not None:
+            # جميع الفحوص التالية تعمل على نفس الاستجابة دون طلبات إضافية
+            findings['cms'] = self._detect_cms(response)
+            findings['technologies'] = [
+                tech.get('name', '') for tech in self.web_scanner.detect_technologies(response=response)
+            ]
+            findings['vulnerabilities'] = self.web_scanner.scan_vulnerabilities(response=response)
+            findings['missing_headers'] = self.web_scanner._check_missing_security_headers(response.headers)
+
+        findings['score'] = triage_score(findings)
+        findings['truncated'] = scheduler.truncated
+        findings['duration'] = round(time.time() - start_time, 2)
+
+        if self.verbose:
+            self.logger.debug(f"درجة الفرز للهدف {self.url}: {findings['score']}")
+
+        return findings
+
+    def _fetch_homepage(self):
+        """جلب الصفحة الرئيسية مرة واحدة دون إعادة محاولة"""
+        return safe_request(self.url, timeout=self.timeout, max_retries=1, cancel_token=self.cancel_token)
+
+    def _detect_cms(self, response):
+        """تحديد نظام إدارة المحتوى من إشارات الصفحة الرئيسية فقط (دون طلبات تحقق إضافية)"""
+        scores, _, _ = CMSDetector(self.url, timeout=self.timeout).score_response(response)
+        return max(scores, key=scores.get) if scores else None
+
+def make_triage_function(ports=None, timeout=TRIAGE_TIMEOUT, verbose=False, deadline=None):
+    """إنشاء دالة فرز لهدف واحد لاستخدامها مع BatchScanner"""
+    def triage(url):
+        scanner = TriageScanner(url, ports=ports, timeout=timeout, verbose=verbose,
+                                cancel_token=new_token(deadline))
+        return scanner.triage()
+
+    return triage
+
+def plan_deep_scans(records, threshold=1):
+    """ترتيب الأهداف للفحص العميق حسب درجة الفرز مع استبعاد ما دون العتبة
+
+    تعيد قائمة من (الهدف، نظام إدارة المحتوى) مرتبة تنازليًا حسب الدرجة؛ العتبة الافتراضية
+    تستبعد الأهداف غير القابلة للوصول فقط.
+    """
+    ranked = []
+    for record in records:
+        if record.get('status') != 'ok':
+            continue
+
+        results = record.get('results') or {}
+        score = results.get('score', 0)
+        if score >= threshold:
+            ranked.append((score, record['target'], results.get('cms')))
+
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    return [(target, cms) for _, target, cms in ranked]
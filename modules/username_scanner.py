@@ -12,17 +12,21 @@ import json
 import time
 import logging
 import requests
-from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from concurrent.futures import as_completed
 from bs4 import BeautifulSoup
 from .utils import safe_request, get_user_agent
+from .concurrency import get_governor
 
 class UsernameScanner:
     """فئة لفحص أسماء المستخدمين وجمع المعلومات المرتبطة بها"""
     
-    def __init__(self, username, timeout=30, verbose=False):
+    def __init__(self, username, timeout=30, verbose=False, cancel_token=None):
         """تهيئة فاحص اسم المستخدم"""
         self.username = username
         self.timeout = timeout
+        # رمز الإلغاء التعاوني (None يعني رمز العملية الجذري)
+        self.cancel_token = cancel_token
         self.verbose = verbose
         self.logger = logging.getLogger('jawal')
         
@@ -111,16 +115,18 @@ class UsernameScanner:
         
         social_accounts = []
         
-        # استخدام ThreadPoolExecutor للبحث بشكل متوازي
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # إنشاء قائمة بالمهام
-            futures = [executor.submit(self._check_social_site, site) for site in self.social_sites]
-            
-            # جمع النتائج
-            for future in futures:
-                result = future.result()
-                if result:
-                    social_accounts.append(result)
+        # البحث بشكل متوازي عبر متحكم التوازي المشترك (ميزانية http وطابور لكل مضيف)
+        governor = get_governor()
+        futures = [
+            governor.submit_for_host(urlparse(site['url']).netloc, 'http', self._check_social_site, site)
+            for site in self.social_sites
+        ]
+        
+        # جمع النتائج فور اكتمالها حتى لا يؤخر موقع بطيء بقية النتائج
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                social_accounts.append(result)
         
         if self.verbose:
             self.logger.debug(f"تم العثور على {len(social_accounts)} حساب تواصل اجتماعي")
@@ -134,7 +140,7 @@ class UsernameScanner:
                 self.logger.debug(f"جاري التحقق من {site['name']}: {site['url']}")
             
             # إجراء طلب HTTP للتحقق من وجود الصفحة
-            response = safe_request(site['url'], timeout=self.timeout)
+            response = safe_request(site['url'], timeout=self.timeout, cancel_token=self.cancel_token)
             
             # التحقق من وجود الحساب
             exists = False
@@ -154,11 +160,9 @@ class UsernameScanner:
             
             # إضافة معلومات إضافية إذا كان الحساب موجودًا
             if exists and response:
-                # محاولة استخراج العنوان
+                # محاولة استخراج العنوان (التحليل ضمن ميزانية cpu)
                 try:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    title = soup.title.string if soup.title else ''
-                    account_info['title'] = title
+                    account_info['title'] = get_governor().run('cpu', self._extract_title, response.text)
                 except:
                     pass
             
@@ -168,6 +172,11 @@ class UsernameScanner:
             self.logger.error(f"خطأ في التحقق من {site['name']}: {str(e)}")
             return None
     
+    def _extract_title(self, html):
+        """استخراج عنوان الصفحة من محتوى HTML"""
+        soup = BeautifulSoup(html, 'html.parser')
+        return soup.title.string if soup.title else ''
+    
     def find_email_accounts(self):
         """البحث عن حسابات البريد الإلكتروني المرتبطة باسم المستخدم"""
         self.logger.info(f"جاري البحث عن حسابات البريد الإلكتروني المرتبطة باسم المستخدم: {self.username}")
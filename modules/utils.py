@@ -121,8 +121,9 @@ def get_user_agent():
     ]
     return random.choice(user_agents)
 
-def safe_request(url, method='GET', headers=None, params=None, data=None, timeout=30, verify=True, allow_redirects=True, max_retries=3):
-    """إجراء طلب HTTP آمن مع معالجة الأخطاء"""
+def safe_request(url, method='GET', headers=None, params=None, data=None, timeout=30, verify=True, allow_redirects=True, max_retries=3, cancel_token=None, stream=False, session=None):
+    """إجراء طلب HTTP آمن مع معالجة الأخطاء (يحترم رمز الإلغاء ومهلته إن وُجد؛ stream يؤجل قراءة الجسم
+    و session جلسة requests يُعاد فيها استخدام الاتصالات المفتوحة)"""
     if headers is None:
         headers = {
             'User-Agent': get_user_agent(),
@@ -139,18 +140,29 @@ def safe_request(url, method='GET', headers=None, params=None, data=None, timeou
         logger.error(f"عنوان URL غير صالح: {url}")
         return None
     
+    # رمز الإلغاء الافتراضي هو رمز العملية الجذري حتى يوقف Ctrl-C جميع الطلبات
+    if cancel_token is None:
+        from .concurrency import get_root_token
+        cancel_token = get_root_token()
+    
     # محاولة إجراء الطلب مع إعادة المحاولة
     for attempt in range(max_retries):
+        # التخلي عن الطلب إذا تم الإلغاء أو انتهت المهلة الكلية
+        request_timeout = cancel_token.clamp_timeout(timeout)
+        if cancel_token.cancelled or (request_timeout is not None and request_timeout <= 0):
+            return None
+        
         try:
-            response = requests.request(
+            response = (session or requests).request(
                 method=method,
                 url=url,
                 headers=headers,
                 params=params,
                 data=data,
-                timeout=timeout,
+                timeout=request_timeout,
                 verify=verify,
-                allow_redirects=allow_redirects
+                allow_redirects=allow_redirects,
+                stream=stream
             )
             return response
         except requests.exceptions.Timeout:
@@ -170,6 +182,64 @@ def safe_request(url, method='GET', headers=None, params=None, data=None, timeou
             logger.error(f"خطأ في الطلب: {url} - {str(e)}")
             return None
 
+def pooled_session(pool_size=10):
+    """جلسة requests بمجمع اتصالات دائمة يتسع لـ pool_size اتصالًا متزامنًا لكل مضيف"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# التداخل بين الأجزاء عند البحث عن نمط التوقف في fetch_partial
+PARTIAL_OVERLAP = 16384
+
+def fetch_partial(url, max_bytes=8192, timeout=30, verify=True, allow_redirects=True, cancel_token=None, until=None):
+    """جلب أول max_bytes من ملف فقط (Range مع قراءة متدفقة محدودة إذا تجاهل الخادم Range)
+
+    until: تعبير نمطي على البايتات يوقف القراءة فور ظهوره. تعيد (الاستجابة، النص) أو None عند
+    الفشل؛ جسم الاستجابة مغلق ولا يُقرأ منه.
+    """
+    if not url or not validate_url(url):
+        logging.getLogger('jawal').error(f"عنوان URL غير صالح: {url}")
+        return None
+    
+    if cancel_token is None:
+        from .concurrency import get_root_token
+        cancel_token = get_root_token()
+    
+    request_timeout = cancel_token.clamp_timeout(timeout)
+    if cancel_token.cancelled or (request_timeout is not None and request_timeout <= 0):
+        return None
+    
+    headers = {
+        'User-Agent': get_user_agent(),
+        'Range': f'bytes=0-{max_bytes - 1}',
+    }
+    
+    try:
+        response = requests.get(url, headers=headers, timeout=request_timeout, verify=verify,
+                                allow_redirects=allow_redirects, stream=True)
+    except requests.exceptions.RequestException as e:
+        logging.getLogger('jawal').warning(f"خطأ في الجلب الجزئي: {url} - {str(e)}")
+        return None
+    
+    content = b''
+    try:
+        for chunk in response.iter_content(chunk_size=1024):
+            # البحث عن نمط التوقف في الجزء الجديد مع تداخل كافٍ لمطابقة تعبر حدود الأجزاء
+            search_from = max(0, len(content) - PARTIAL_OVERLAP)
+            content += chunk
+            if len(content) >= max_bytes or cancel_token.cancelled:
+                break
+            if until is not None and until.search(content, search_from):
+                break
+    except requests.exceptions.RequestException as e:
+        logging.getLogger('jawal').warning(f"خطأ في قراءة الجلب الجزئي: {url} - {str(e)}")
+    finally:
+        response.close()
+    
+    return response, content[:max_bytes].decode(response.encoding or 'utf-8', errors='replace')
+
 def extract_domain(url):
     """استخراج اسم النطاق من عنوان URL"""
     try:
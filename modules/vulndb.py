@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة قاعدة بيانات الثغرات المحلية مع فهرس نطاقات الإصدارات
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import re
+import json
+import sqlite3
+import logging
+import threading
+from bisect import bisect_right
+
+# مجلد قواعد البيانات المضمنة مع الأداة
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+_VERSION_PART = re.compile(r'\d+')
+_CONSTRAINT = re.compile(r'^\s*(<=|>=|<|>|==|=)?\s*(\d[\w.\-]*)\s*$')
+
+def parse_version(version):
+    """تحويل سلسلة الإصدار إلى صف أرقام قابل للمقارنة (مثال: '5.3.2-beta' -> (5, 3, 2))"""
+    if version is None:
+        return None
+
+    parts = []
+    for part in str(version).split('.'):
+        match = _VERSION_PART.match(part.strip())
+        if not match:
+            break
+        parts.append(int(match.group(0)))
+
+    # إزالة الأصفار الزائدة حتى تتساوى 5.3 و 5.3.0
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+
+    return tuple(parts) if parts else None
+
+def parse_range(spec):
+    """تحليل نطاق إصدارات مثل '>=6.0,<6.9' أو '<5.3.2' أو '>=5.8,<5.8.3||>=5.7,<5.7.5'
+
+    تعيد قائمة فترات (البداية، تضمين البداية، النهاية، تضمين النهاية)؛ None تعني بلا حد.
+    """
+    intervals = []
+    for alternative in spec.split('||'):
+        start, start_inclusive, end, end_inclusive = None, True, None, True
+
+        for constraint in alternative.split(','):
+            if not constraint.strip():
+                continue
+
+            match = _CONSTRAINT.match(constraint)
+            if not match:
+                raise ValueError(f"قيد إصدار غير صالح: {constraint}")
+
+            operator, version = match.group(1) or '==', parse_version(match.group(2))
+            if operator in ('>', '>='):
+                start, start_inclusive = version, operator == '>='
+            elif operator in ('<', '<='):
+                end, end_inclusive = version, operator == '<='
+            else:
+                start, end = version, version
+                start_inclusive = end_inclusive = True
+
+        intervals.append((start, start_inclusive, end, end_inclusive))
+
+    return intervals
+
+class VulnDatabase:
+    """فهرس ثغرات مفتاحه (النوع، المعرف) مع فترات إصدارات مرتبة للبحث الثنائي"""
+
+    def __init__(self, records=None, latest=None):
+        """تهيئة القاعدة من قائمة سجلات (kind, slug, affected, ...)"""
+        self.logger = logging.getLogger('jawal')
+        # (kind, slug) -> {'starts': [...], 'intervals': [...]} مرتبة حسب بداية الفترة
+        self._index = {}
+        self.latest = dict(latest or {})
+        self.size = 0
+
+        for record in records or []:
+            self.add(record)
+
+    def add(self, record):
+        """إضافة سجل ثغرة إلى الفهرس"""
+        key = (record['kind'], record['slug'].lower())
+        entry = self._index.setdefault(key, {'starts': [], 'intervals': []})
+
+        for start, start_inclusive, end, end_inclusive in parse_range(record['affected']):
+            # البداية غير المحددة تُرتب أولًا
+            sort_key = start if start is not None else ()
+            position = bisect_right(entry['starts'], sort_key)
+            entry['starts'].insert(position, sort_key)
+            entry['intervals'].insert(position, (start, start_inclusive, end, end_inclusive, record))
+
+        self.size += 1
+
+    def lookup(self, kind, slug, version):
+        """إرجاع الثغرات التي يقع الإصدار ضمن نطاقها"""
+        entry = self._index.get((kind, slug.lower()))
+        parsed = parse_version(version)
+        if not entry or parsed is None:
+            return []
+
+        matches = []
+        seen = set()
+        # الفترات التي تبدأ بعد الإصدار مستبعدة مباشرة عبر البحث الثنائي
+        for start, start_inclusive, end, end_inclusive, record in entry['intervals'][:bisect_right(entry['starts'], parsed)]:
+            if start is not None and (parsed < start or (parsed == start and not start_inclusive)):
+                continue
+            if end is not None and (parsed > end or (parsed == end and not end_inclusive)):
+                continue
+            if id(record) not in seen:
+                seen.add(id(record))
+                matches.append(record)
+
+        return matches
+
+    def latest_version(self, kind, slug):
+        """آخر إصدار معروف لعنصر (None إذا لم يكن معروفًا)"""
+        return self.latest.get(f"{kind}:{slug.lower()}")
+
+    def is_outdated(self, kind, slug, version):
+        """هل الإصدار أقدم من آخر إصدار معروف (None إذا لم يكن آخر إصدار معروفًا)"""
+        latest = parse_version(self.latest_version(kind, slug))
+        parsed = parse_version(version)
+        if latest is None or parsed is None:
+            return None
+        return parsed < latest
+
+    def __len__(self):
+        return self.size
+
+def load_database(path):
+    """تحميل قاعدة بيانات من ملف JSON أو SQLite"""
+    if path.endswith(('.db', '.sqlite', '.sqlite3')):
+        return _load_sqlite(path)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    return VulnDatabase(data.get('vulnerabilities', []), latest=data.get('latest'))
+
+def _load_sqlite(path):
+    """تحميل قاعدة بيانات SQLite (جدولا vulnerabilities و latest)"""
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    connection.row_factory = sqlite3.Row
+    try:
+        records = [dict(row) for row in connection.execute(
+            'SELECT kind, slug, id, title, severity, affected, fixed_in FROM vulnerabilities'
+        )]
+        latest = {row['key']: row['version'] for row in connection.execute('SELECT key, version FROM latest')}
+    finally:
+        connection.close()
+
+    return VulnDatabase(records, latest=latest)
+
+def export_sqlite(json_path, db_path):
+    """تحويل قاعدة بيانات JSON إلى SQLite لمشاركتها أو تحديثها بأدوات خارجية"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.executescript('''
+            DROP TABLE IF EXISTS vulnerabilities;
+            DROP TABLE IF EXISTS latest;
+            CREATE TABLE vulnerabilities (kind TEXT, slug TEXT, id TEXT, title TEXT,
+                                          severity TEXT, affected TEXT, fixed_in TEXT);
+            CREATE INDEX idx_vulnerabilities_slug ON vulnerabilities (kind, slug);
+            CREATE TABLE latest (key TEXT PRIMARY KEY, version TEXT);
+        ''')
+        connection.executemany(
+            'INSERT INTO vulnerabilities VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(record['kind'], record['slug'], record.get('id'), record.get('title'), record.get('severity'),
+              record['affected'], record.get('fixed_in')) for record in data.get('vulnerabilities', [])]
+        )
+        connection.executemany('INSERT INTO latest VALUES (?, ?)', list((data.get('latest') or {}).items()))
+        connection.commit()
+    finally:
+        connection.close()
+
+    return db_path
+
+_databases = {}
+_database_paths = {}
+_databases_lock = threading.Lock()
+
+def configure_vulndb(name, path):
+    """استخدام ملف قاعدة بيانات مخصص بدلًا من الملف المضمن (يُحمَّل عند أول استخدام)"""
+    with _databases_lock:
+        _database_paths[name] = path
+        _databases.pop(name, None)
+
+def get_vulndb(name):
+    """الحصول على قاعدة بيانات الثغرات المشتركة على مستوى العملية (wordpress، joomla...)"""
+    with _databases_lock:
+        if name not in _databases:
+            path = _database_paths.get(name) or os.path.join(DATA_DIR, f"{name}_vulns.json")
+            try:
+                _databases[name] = load_database(path)
+            except (OSError, ValueError, KeyError, sqlite3.Error) as e:
+                logging.getLogger('jawal').error(f"خطأ في تحميل قاعدة بيانات الثغرات {path}: {str(e)}")
+                _databases[name] = VulnDatabase()
+        return _databases[name]
+
+def known_vulnerabilities(name, kind, slug, version):
+    """تحويل الثغرات المعروفة لإصدار محدد من قاعدة البيانات name إلى صيغة نتائج الفحص"""
+    vulnerabilities = []
+
+    for record in get_vulndb(name).lookup(kind, slug, version):
+        fixed_in = f"، تم الإصلاح في {record['fixed_in']}" if record.get('fixed_in') else ''
+        vulnerabilities.append({
+            'name': f"{record.get('id', '')}: {record.get('title', '')}",
+            'severity': record.get('severity', 'متوسطة'),
+            'description': f"{slug} {version} ضمن النطاق المتأثر ({record['affected']}){fixed_in}.",
+            'evidence': f"{kind}: {slug}، الإصدار: {version}"
+        })
+
+    return vulnerabilities
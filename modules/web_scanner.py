@@ -13,21 +13,27 @@ import socket
 import logging
 import requests
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from bs4 import BeautifulSoup
 from .utils import safe_request, get_user_agent, extract_domain, is_ip_address
+from .concurrency import get_governor, get_root_token
+from .content_discovery import ContentDiscovery, DEFAULT_DISCOVERY_RATE
 
 class WebScanner:
     """فئة لفحص مواقع الويب وجمع المعلومات المرتبطة بها"""
     
-    def __init__(self, url, ports=None, timeout=30, verbose=False):
+    def __init__(self, url, ports=None, timeout=30, verbose=False, cancel_token=None):
         """تهيئة فاحص موقع الويب"""
         self.url = url
         self.domain = extract_domain(url)
         self.timeout = timeout
+        # رمز الإلغاء التعاوني (None يعني رمز العملية الجذري)
+        self.cancel_token = cancel_token
         self.verbose = verbose
         self.logger = logging.getLogger('jawal')
         self.ports = ports if ports else [80, 443]
+        # المسار -> وجهة التوجيه للملفات المفحوصة التي أجابت بإعادة توجيه
+        self.redirects = {}
         
         # قائمة بالتقنيات الشائعة للكشف
         self.common_technologies = [
@@ -108,15 +114,16 @@ class WebScanner:
             },
         ]
     
-    def get_site_info(self):
-        """الحصول على معلومات الموقع"""
+    def get_site_info(self, response=None):
+        """الحصول على معلومات الموقع (يمكن تمرير استجابة الصفحة الرئيسية إذا تم جلبها مسبقًا)"""
         self.logger.info(f"جاري جمع معلومات الموقع: {self.url}")
         
         site_info = {}
         
         try:
             # إجراء طلب HTTP للحصول على معلومات الموقع
-            response = safe_request(self.url, timeout=self.timeout)
+            if response is None:
+                response = safe_request(self.url, timeout=self.timeout, cancel_token=self.cancel_token)
             
             if response:
                 # استخراج معلومات الموقع من الاستجابة
@@ -143,21 +150,9 @@ class WebScanner:
                 except Exception as e:
                     self.logger.error(f"خطأ في استخراج معلومات HTML: {str(e)}")
                 
-                # التحقق من وجود ملف robots.txt
-                robots_url = f"{self.url.rstrip('/')}/robots.txt"
-                robots_response = safe_request(robots_url, timeout=self.timeout)
-                if robots_response and robots_response.status_code == 200:
-                    site_info['robots.txt'] = 'موجود'
-                else:
-                    site_info['robots.txt'] = 'غير موجود'
-                
-                # التحقق من وجود ملف sitemap.xml
-                sitemap_url = f"{self.url.rstrip('/')}/sitemap.xml"
-                sitemap_response = safe_request(sitemap_url, timeout=self.timeout)
-                if sitemap_response and sitemap_response.status_code == 200:
-                    site_info['sitemap.xml'] = 'موجود'
-                else:
-                    site_info['sitemap.xml'] = 'غير موجود'
+                # التحقق من وجود ملفي robots.txt وsitemap.xml
+                site_info['robots.txt'] = self._check_file('/robots.txt')
+                site_info['sitemap.xml'] = self._check_file('/sitemap.xml')
                 
                 # التحقق من وجود HTTPS
                 if self.url.startswith('https'):
@@ -179,6 +174,17 @@ class WebScanner:
             self.logger.error(f"خطأ في الحصول على معلومات الموقع: {str(e)}")
             return {'عنوان URL': self.url, 'النطاق': self.domain, 'خطأ': str(e)}
     
+    def _check_file(self, path):
+        """التحقق من وجود ملف في جذر الموقع؛ التوجيه يُسجل ولا يُتبع حتى لا تُعد صفحة الوجهة هي الملف"""
+        response = safe_request(f"{self.url.rstrip('/')}{path}", timeout=self.timeout, allow_redirects=False,
+                                cancel_token=self.cancel_token)
+        if response is not None and response.is_redirect:
+            self.redirects[path] = response.headers.get('Location', '')
+            return f"توجيه إلى {self.redirects[path]}"
+        if response is not None and response.status_code == 200:
+            return 'موجود'
+        return 'غير موجود'
+    
     def _check_security_headers(self, headers):
         """التحقق من رؤوس HTTP الأمنية"""
         security_headers = {}
@@ -203,15 +209,16 @@ class WebScanner:
         
         return security_headers
     
-    def detect_technologies(self):
-        """تحديد التقنيات المستخدمة في الموقع"""
+    def detect_technologies(self, response=None):
+        """تحديد التقنيات المستخدمة في الموقع (يمكن تمرير استجابة الصفحة الرئيسية إذا تم جلبها مسبقًا)"""
         self.logger.info(f"جاري تحديد التقنيات المستخدمة في الموقع: {self.url}")
         
         technologies = []
         
         try:
             # إجراء طلب HTTP للحصول على محتوى الصفحة
-            response = safe_request(self.url, timeout=self.timeout)
+            if response is None:
+                response = safe_request(self.url, timeout=self.timeout, cancel_token=self.cancel_token)
             
             if response:
                 # البحث عن التقنيات في محتوى الصفحة والرؤوس
@@ -296,15 +303,16 @@ class WebScanner:
         
         return version
     
-    def scan_vulnerabilities(self):
-        """فحص الثغرات الأمنية في الموقع"""
+    def scan_vulnerabilities(self, response=None):
+        """فحص الثغرات الأمنية في الموقع (يمكن تمرير استجابة الصفحة الرئيسية إذا تم جلبها مسبقًا)"""
         self.logger.info(f"جاري فحص الثغرات الأمنية في الموقع: {self.url}")
         
         vulnerabilities = []
         
         try:
             # إجراء طلب HTTP للحصول على محتوى الصفحة
-            response = safe_request(self.url, timeout=self.timeout)
+            if response is None:
+                response = safe_request(self.url, timeout=self.timeout, cancel_token=self.cancel_token)
             
             if response:
                 # البحث عن الثغرات في محتوى الصفحة والرؤوس
@@ -403,30 +411,31 @@ class WebScanner:
         
         return insecure_cookies
     
-    def scan_ports(self):
-        """فحص المنافذ المفتوحة"""
+    def scan_ports(self, ip=None):
+        """فحص المنافذ المفتوحة (يمكن تمرير عنوان IP إذا تم تحليله مسبقًا)"""
         self.logger.info(f"جاري فحص المنافذ المفتوحة للنطاق: {self.domain}")
         
         open_ports = []
         
         try:
-            # التحقق مما إذا كان النطاق عبارة عن عنوان IP
-            if is_ip_address(self.domain):
-                ip = self.domain
-            else:
-                # الحصول على عنوان IP للنطاق
-                ip = socket.gethostbyname(self.domain)
+            if not ip:
+                # التحقق مما إذا كان النطاق عبارة عن عنوان IP
+                if is_ip_address(self.domain):
+                    ip = self.domain
+                else:
+                    # الحصول على عنوان IP للنطاق
+                    ip = socket.gethostbyname(self.domain)
             
-            # فحص المنافذ باستخدام ThreadPoolExecutor
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # إنشاء قائمة بالمهام
-                futures = [executor.submit(self._check_port, ip, port) for port in self.ports]
-                
-                # جمع النتائج
-                for future in futures:
-                    result = future.result()
-                    if result:
-                        open_ports.append(result)
+            # فحص المنافذ عبر متحكم التوازي المشترك (ميزانية socket دون حد المضيف لأن الهدف واحد)
+            governor = get_governor()
+            futures = [governor.submit('socket', self._check_port, ip, port) for port in self.ports]
+            
+            # جمع النتائج فور اكتمالها ثم ترتيبها حسب رقم المنفذ
+            for future in as_completed(futures):
+                result = future.result()
+                if result:
+                    open_ports.append(result)
+            open_ports.sort(key=lambda port: port['port'])
             
             if self.verbose:
                 self.logger.debug(f"تم اكتشاف {len(open_ports)} منفذ مفتوح")
@@ -437,12 +446,26 @@ class WebScanner:
             self.logger.error(f"خطأ في فحص المنافذ: {str(e)}")
             return []
     
+    def discover_content(self, wordlist=None, extensions=None, recursion=0, case=False, suffixes=(),
+                         rate=DEFAULT_DISCOVERY_RATE, time_budget=None, on_found=None):
+        """اكتشاف المجلدات والملفات من قائمة كلمات (المضمنة افتراضيًا) مع توسيع الامتدادات والتعمق في المجلدات"""
+        discovery = ContentDiscovery(self.url, timeout=self.timeout, verbose=self.verbose,
+                                     cancel_token=self.cancel_token, rate=rate, time_budget=time_budget)
+        return discovery.run(wordlist=wordlist, extensions=extensions, recursion=recursion, case=case,
+                             suffixes=suffixes, on_found=on_found)
+    
     def _check_port(self, ip, port):
         """التحقق من حالة منفذ محدد"""
         try:
+            # التخلي عن الفحص إذا تم الإلغاء أو انتهت المهلة الكلية
+            token = self.cancel_token or get_root_token()
+            timeout = token.clamp_timeout(self.timeout)
+            if token.cancelled or not timeout:
+                return None
+            
             # إنشاء مقبس TCP
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
+            sock.settimeout(timeout)
             
             # محاولة الاتصال بالمنفذ
             result = sock.connect_ex((ip, port))
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة قوائم الكلمات الكبيرة: قراءة كسولة عبر mmap وإزالة التكرار بمرشح Bloom وقواعد التحويل
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import math
+import mmap
+import hashlib
+
+# متوسط طول السطر التقديري بالبايت لتقدير عدد الكلمات من حجم الملف (التقدير الأقل أكثر أمانًا)
+AVERAGE_LINE_BYTES = 8
+
+# نسبة الإيجابيات الكاذبة المقبولة في مرشح Bloom (كلمة فريدة تُحذف ظنًا أنها مكررة)
+DEFAULT_ERROR_RATE = 0.001
+
+# الحد الأدنى لسعة المرشح حتى لا تمتلئ مرشحات القوائم الصغيرة
+MIN_CAPACITY = 1024
+
+class Wordlist:
+    """قائمة كلمات مربوطة بالذاكرة تُقرأ سطرًا بسطر بين إزاحتين بالبايت دون تحميلها أو فك ترميزها كاملة
+
+    السطر ينتمي إلى المقطع الذي تقع بدايته فيه، فمقاطع shards تغطي كل الأسطر مرة واحدة.
+    """
+
+    def __init__(self, path, start=0, end=None, encoding='utf-8'):
+        """تهيئة القائمة لملف ومقطع اختياري [start, end)"""
+        self.path = path
+        self.start = start
+        self.end = end
+        self.encoding = encoding
+
+    @property
+    def size(self):
+        """حجم الملف بالبايت"""
+        return os.path.getsize(self.path)
+
+    def __iter__(self):
+        """الكلمات بالترتيب مع تجاهل الأسطر الفارغة والتعليقات"""
+        size = self.size
+        end = size if self.end is None else min(self.end, size)
+        if self.start >= end:
+            return
+
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # الأسطر قبل start تخص المقطع السابق
+            position = self.start
+            if position and mapped[position - 1:position] != b'\n':
+                position = _next_line(mapped, position, size)
+
+            while position < end:
+                newline = mapped.find(b'\n', position)
+                if newline == -1:
+                    newline = size
+                line = mapped[position:newline].strip()
+                position = newline + 1
+                if line and not line.startswith(b'#'):
+                    yield line.decode(self.encoding, errors='replace')
+
+    def shards(self, count):
+        """تقسيم القائمة إلى count مقطعًا متقاربة الحجم على حدود الأسطر (لتوزيعها على عدة عمال)"""
+        size = self.size
+        start = self.start
+        end = size if self.end is None else min(self.end, size)
+        if start >= end or count <= 1:
+            return [Wordlist(self.path, start, end, self.encoding)]
+
+        offsets = [start]
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for index in range(1, count):
+                # أول بداية سطر عند الإزاحة التقريبية أو بعدها
+                target = start + (end - start) * index // count
+                if mapped[target - 1:target] != b'\n':
+                    target = _next_line(mapped, target, size)
+                offsets.append(min(end, max(offsets[-1], target)))
+        offsets.append(end)
+
+        return [Wordlist(self.path, first, last, self.encoding) for first, last in zip(offsets, offsets[1:])]
+
+def _next_line(mapped, position, size):
+    """بداية السطر التالي بعد الإزاحة (أو نهاية الملف)"""
+    newline = mapped.find(b'\n', position)
+    return size if newline == -1 else newline + 1
+
+class BloomFilter:
+    """مرشح Bloom بسعة ونسبة خطأ محددتين؛ نحو 1.8 بايت لكل عنصر بدل عشرات البايتات في set"""
+
+    def __init__(self, capacity, error_rate=DEFAULT_ERROR_RATE):
+        """تهيئة المرشح؛ الحجم وعدد دوال التجزئة يُحسبان من السعة ونسبة الخطأ"""
+        capacity = max(MIN_CAPACITY, int(capacity))
+        self.size = int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        """مواقع البتات للعنصر بالتجزئة المزدوجة من بصمة واحدة"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item):
+        """إضافة عنصر؛ تعيد True إذا كان جديدًا (False إذا وُجد سابقًا أو كان إيجابيًا كاذبًا)"""
+        bits = self._bits
+        added = False
+        for position in self._positions(item):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+        return added
+
+    def __contains__(self, item):
+        return all(self._bits[position >> 3] & 1 << (position & 7) for position in self._positions(item))
+
+def dedupe(words, capacity, error_rate=DEFAULT_ERROR_RATE):
+    """تمرير الكلمات غير المكررة فقط بذاكرة ثابتة تحددها السعة"""
+    seen = BloomFilter(capacity, error_rate)
+    for word in words:
+        if seen.add(word):
+            yield word
+
+def mutate(words, case=False, suffixes=(), extensions=()):
+    """توليد الصيغ لكل كلمة: الكلمة ثم صيغ الحالة (صغيرة، كبيرة، أول حرف كبير) ثم اللواحق ثم الامتدادات"""
+    for word in words:
+        bases = [word]
+        if case:
+            for variant in (word.lower(), word.upper(), word.capitalize()):
+                if variant not in bases:
+                    bases.append(variant)
+
+        for base in bases:
+            for suffix in ('',) + tuple(suffixes):
+                candidate = base + suffix
+                yield candidate
+                for extension in extensions:
+                    yield f"{candidate}.{extension}"
+
+def parse_suffixes(spec):
+    """تحليل مواصفات اللواحق (مثال: 1-3,2024,_old) إلى قائمة مرتبة"""
+    suffixes = []
+    for part in (spec or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, separator, last = part.partition('-')
+        if separator and first.isdigit() and last.isdigit():
+            suffixes.extend(str(number) for number in range(int(first), int(last) + 1))
+        else:
+            suffixes.append(part)
+    return list(dict.fromkeys(suffixes))
+
+def iter_wordlist(path, start=0, end=None, unique=True, case=False, suffixes=(), extensions=(), normalize=None):
+    """الكلمات من ملف (أو مقطع منه) بعد إزالة التكرار وتطبيق قواعد التحويل، بذاكرة شبه ثابتة
+
+    التكرار يُزال من الكلمات الأصلية بعد normalize (مثل str.lower لأسماء DNS)؛ سعة المرشح تُقدر من
+    حجم المقطع بالبايت.
+    """
+    wordlist = Wordlist(path, start, end)
+    words = iter(wordlist)
+    if normalize:
+        words = (normalize(word) for word in words)
+    if unique:
+        length = min(end if end is not None else wordlist.size, wordlist.size) - start
+        words = dedupe(words, length // AVERAGE_LINE_BYTES)
+    return mutate(words, case=case, suffixes=suffixes, extensions=extensions)
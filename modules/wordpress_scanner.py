@@ -10,138 +10,192 @@ JawaL - وحدة فحص مواقع ووردبريس
 import re
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import as_completed
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
-from .utils import safe_request, get_user_agent, extract_domain
+from .utils import fetch_partial, get_user_agent, extract_domain
+from .concurrency import get_governor
+from .wp_analyzer import analyze_homepage, parse_readme, parse_style_header, merge_version
+from .vulndb import get_vulndb, known_vulnerabilities
+from .cms_probe import ProbePlan, ProbeSession, homepage_plan, confirm
+from .enumerator import DEFAULT_RATE
+from .wp_enumerator import WordpressEnumerator
+from .wp_rest import read_rest_namespaces, map_namespaces
+from .wp_users import WordpressUserEnumerator
+
+# ملفات الترويسة التي تُقرأ لإثراء الإصدارات ودالة تحليل كل منها
+HEADER_FILES = {
+    'plugin': ('/wp-content/plugins/{slug}/readme.txt', parse_readme),
+    'theme': ('/wp-content/themes/{slug}/style.css', parse_style_header),
+}
+
+# الترويسة تقع في بداية الملف، فلا حاجة لقراءة أكثر من ذلك
+HEADER_BYTES = 8192
+
+def _json_list(response):
+    """مصفوفة JSON غير فارغة من استجابة 200 (None لغير ذلك)"""
+    if response.status_code != 200:
+        return None
+    try:
+        data = response.json()
+    except ValueError:
+        return None
+    return data if isinstance(data, list) and data else None
+
+def _users_evidence(response):
+    """أسماء المستخدمين المكشوفة عبر REST"""
+    users = _json_list(response)
+    if not users:
+        return None
+    user_names = [user.get('name', '') for user in users if isinstance(user, dict) and 'name' in user]
+    return f'تم العثور على {len(user_names)} مستخدم: {", ".join(user_names)}'
+
+def _posts_evidence(response):
+    """عدد المقالات المكشوفة عبر REST"""
+    posts = _json_list(response)
+    return f'تم العثور على {len(posts)} مقالة' if posts else None
+
+# المسارات الشائعة في ووردبريس (وجود {threshold} منها يؤكد النظام)
+WORDPRESS_PATHS = ProbePlan('wordpress-paths', [
+    {'name': path, 'path': path, 'exists': True}
+    for path in [
+        '/wp-login.php',
+        '/wp-admin/',
+        '/wp-content/',
+        '/wp-includes/',
+        '/wp-json/',
+        '/xmlrpc.php',
+        '/wp-config.php',
+        '/wp-cron.php',
+        '/readme.html',
+        '/license.txt',
+    ]
+])
+
+# الثغرات الشائعة في ووردبريس
+WORDPRESS_CHECKS = ProbePlan('wordpress-checks', [
+    {
+        'name': 'كشف إصدار ووردبريس',
+        'path': '/readme.html',
+        'pattern': r'Version ([\d.]+)',
+        'severity': 'منخفضة',
+        'description': 'يمكن معرفة إصدار ووردبريس من خلال ملف readme.html.'
+    },
+    {
+        'name': 'كشف المستخدمين',
+        'path': '/wp-json/wp/v2/users',
+        'match': _users_evidence,
+        'severity': 'متوسطة',
+        'description': 'يمكن كشف أسماء المستخدمين من خلال واجهة برمجة التطبيقات REST.'
+    },
+    {
+        'name': 'تمكين xmlrpc.php',
+        'path': '/xmlrpc.php',
+        'exists': True,
+        'evidence': 'ملف xmlrpc.php متاح (رمز الحالة: {status})',
+        'severity': 'متوسطة',
+        'description': 'ملف xmlrpc.php مفعل، مما قد يسمح بهجمات القوة الغاشمة.'
+    },
+    {
+        'name': 'كشف قائمة المقالات',
+        'path': '/wp-json/wp/v2/posts',
+        'match': _posts_evidence,
+        'severity': 'منخفضة',
+        'description': 'يمكن الوصول إلى قائمة المقالات من خلال واجهة برمجة التطبيقات REST.'
+    },
+    {
+        'name': 'كشف قائمة القوالب',
+        'path': '/wp-content/themes/',
+        'pattern': 'Index of',
+        'severity': 'متوسطة',
+        'description': 'يمكن الوصول إلى قائمة القوالب من خلال مجلد themes.'
+    },
+    {
+        'name': 'كشف قائمة الإضافات',
+        'path': '/wp-content/plugins/',
+        'pattern': 'Index of',
+        'severity': 'متوسطة',
+        'description': 'يمكن الوصول إلى قائمة الإضافات من خلال مجلد plugins.'
+    },
+])
 
 class WordpressScanner:
     """فئة لفحص مواقع ووردبريس وكشف الثغرات الأمنية"""
     
-    def __init__(self, url, timeout=30, verbose=False):
-        """تهيئة فاحص ووردبريس"""
+    # المسارات الشائعة للتحقق وفحوص الثغرات الشائعة (خطط تصريحية يدمجها محرك الفحص المشترك)
+    PATH_PLAN = WORDPRESS_PATHS
+    VULNERABILITY_PLAN = WORDPRESS_CHECKS
+    
+    def __init__(self, url, timeout=30, verbose=False, cancel_token=None, session=None):
+        """تهيئة فاحص ووردبريس؛ session جلسة فحص مشتركة مع فاحصات أخرى للهدف نفسه"""
         self.url = url
         self.domain = extract_domain(url)
         self.timeout = timeout
+        # رمز الإلغاء التعاوني (None يعني رمز العملية الجذري)
+        self.cancel_token = cancel_token
         self.verbose = verbose
         self.logger = logging.getLogger('jawal')
         
-        # قائمة بالمسارات الشائعة في ووردبريس
-        self.common_paths = [
-            '/wp-login.php',
-            '/wp-admin/',
-            '/wp-content/',
-            '/wp-includes/',
-            '/wp-json/',
-            '/xmlrpc.php',
-            '/wp-config.php',
-            '/wp-cron.php',
-            '/readme.html',
-            '/license.txt',
-        ]
+        # كل مسار يُطلب مرة واحدة لكل هدف، وتتشارك الجلسة فاحصات الهدف نفسه (مثل كاشف نظام إدارة المحتوى)
+        self.session = session or ProbeSession(url, timeout=timeout, cancel_token=cancel_token)
         
-        # قائمة بالثغرات الشائعة في ووردبريس
-        self.common_vulnerabilities = [
-            {
-                'name': 'كشف إصدار ووردبريس',
-                'path': '/readme.html',
-                'pattern': r'Version ([\d.]+)',
-                'severity': 'منخفضة',
-                'description': 'يمكن معرفة إصدار ووردبريس من خلال ملف readme.html.'
-            },
-            {
-                'name': 'كشف المستخدمين',
-                'path': '/wp-json/wp/v2/users',
-                'pattern': None,  # سيتم التحقق من الاستجابة في دالة منفصلة
-                'severity': 'متوسطة',
-                'description': 'يمكن كشف أسماء المستخدمين من خلال واجهة برمجة التطبيقات REST.'
-            },
-            {
-                'name': 'تمكين xmlrpc.php',
-                'path': '/xmlrpc.php',
-                'pattern': None,  # سيتم التحقق من الاستجابة في دالة منفصلة
-                'severity': 'متوسطة',
-                'description': 'ملف xmlrpc.php مفعل، مما قد يسمح بهجمات القوة الغاشمة.'
-            },
-            {
-                'name': 'كشف قائمة المقالات',
-                'path': '/wp-json/wp/v2/posts',
-                'pattern': None,  # سيتم التحقق من الاستجابة في دالة منفصلة
-                'severity': 'منخفضة',
-                'description': 'يمكن الوصول إلى قائمة المقالات من خلال واجهة برمجة التطبيقات REST.'
-            },
-            {
-                'name': 'كشف قائمة القوالب',
-                'path': '/wp-content/themes/',
-                'pattern': 'Index of',
-                'severity': 'متوسطة',
-                'description': 'يمكن الوصول إلى قائمة القوالب من خلال مجلد themes.'
-            },
-            {
-                'name': 'كشف قائمة الإضافات',
-                'path': '/wp-content/plugins/',
-                'pattern': 'Index of',
-                'severity': 'متوسطة',
-                'description': 'يمكن الوصول إلى قائمة الإضافات من خلال مجلد plugins.'
-            },
-        ]
+        # تحليل الصفحة الرئيسية يُحسب مرة واحدة وتتشاركه المراحل المتوازية
+        self._homepage_lock = threading.Lock()
+        self._analysis = None
+        
+        # تفاصيل ملفات الترويسة للقوالب والإضافات تُجلب مرة واحدة بالتوازي
+        self._details_lock = threading.Lock()
+        self._details = None
+        
+        # الإضافات المكتشفة من فهرس /wp-json/ (طلب واحد مشترك)
+        self._rest_lock = threading.Lock()
+        self._rest_index = None
     
-    def verify_wordpress(self):
-        """التحقق من أن الموقع يستخدم ووردبريس"""
+    def verify_wordpress(self, threshold=3):
+        """التحقق من أن الموقع يستخدم ووردبريس (المسارات والصفحة الرئيسية تُفحص بالتوازي مع خروج مبكر)"""
         self.logger.info(f"جاري التحقق من استخدام ووردبريس في الموقع: {self.url}")
         
-        # عدد المسارات التي تم العثور عليها
-        found_paths = 0
-        
+        confirmed = False
         try:
-            # التحقق من المسارات الشائعة في ووردبريس
-            for path in self.common_paths:
-                full_url = urljoin(self.url, path)
-                response = safe_request(full_url, timeout=self.timeout)
-                
-                if response and response.status_code != 404:
-                    found_paths += 1
-                    
-                    if self.verbose:
-                        self.logger.debug(f"تم العثور على المسار: {path}")
-                    
-                    # إذا تم العثور على 3 مسارات على الأقل، فمن المحتمل أن يكون ووردبريس
-                    if found_paths >= 3:
-                        self.logger.info(f"تم التأكد من استخدام ووردبريس في الموقع: {self.url}")
-                        return True
-            
-            # التحقق من وجود علامات ووردبريس في صفحة الرئيسية
-            response = safe_request(self.url, timeout=self.timeout)
-            if response:
-                # البحث عن علامات ووردبريس في محتوى الصفحة
-                wp_indicators = [
-                    'wp-content',
-                    'wp-includes',
-                    'WordPress',
-                    'wp-json',
-                ]
-                
-                for indicator in wp_indicators:
-                    if indicator in response.text:
-                        self.logger.info(f"تم التأكد من استخدام ووردبريس في الموقع: {self.url}")
-                        return True
-            
-            self.logger.info(f"لم يتم التأكد من استخدام ووردبريس في الموقع: {self.url}")
-            return False
-        
+            # الصفحة الرئيسية فحص حاسم بحد ذاته؛ المسارات الشائعة تحتاج إلى {threshold} منها على الأقل
+            plan = self.PATH_PLAN + homepage_plan('wordpress', self.has_homepage_indicators)
+            confirmed = confirm(self.session, plan, threshold, verbose=self.verbose)
         except Exception as e:
             self.logger.error(f"خطأ في التحقق من استخدام ووردبريس: {str(e)}")
+        
+        if confirmed:
+            self.logger.info(f"تم التأكد من استخدام ووردبريس في الموقع: {self.url}")
+        else:
+            self.logger.info(f"لم يتم التأكد من استخدام ووردبريس في الموقع: {self.url}")
+        
+        return confirmed
+    
+    def has_homepage_indicators(self, response):
+        """التحقق من وجود علامات ووردبريس في استجابة الصفحة الرئيسية (دون أي طلبات إضافية)"""
+        if not response:
             return False
+        
+        # البحث عن علامات ووردبريس في محتوى الصفحة
+        wp_indicators = [
+            'wp-content',
+            'wp-includes',
+            'WordPress',
+            'wp-json',
+        ]
+        
+        return any(indicator in response.text for indicator in wp_indicators)
     
-    def get_wordpress_info(self):
+    def get_wordpress_info(self, version=None):
         """الحصول على معلومات ووردبريس"""
         self.logger.info(f"جاري جمع معلومات ووردبريس للموقع: {self.url}")
         
         wordpress_info = {}
         
         try:
-            # التحقق من إصدار ووردبريس
-            version = self._get_wordpress_version()
+            # التحقق من إصدار ووردبريس (None تعني أن الإصدار لم يُحدد بعد)
+            if version is None:
+                version = self._get_wordpress_version()
             if version:
                 wordpress_info['الإصدار'] = version
             
@@ -164,24 +218,96 @@ class WordpressScanner:
             self.logger.error(f"خطأ في الحصول على معلومات ووردبريس: {str(e)}")
             return {'خطأ': str(e)}
     
+    def get_homepage(self):
+        """الصفحة الرئيسية من جلسة الفحص المشتركة (تُجلب مرة واحدة فقط)"""
+        return self.session.homepage()
+    
+    def analyze_homepage(self):
+        """تحليل الصفحة الرئيسية في مرور واحد (النواة والقوالب والإضافات مع أدلتها)"""
+        response = self.get_homepage()
+        with self._homepage_lock:
+            if self._analysis is None:
+                html = response.text if response is not None and response.status_code == 200 else ''
+                self._analysis = analyze_homepage(html)
+            return self._analysis
+    
+    def detect_version(self):
+        """تحديد إصدار ووردبريس وحالة تحديثه"""
+        version = self._get_wordpress_version()
+        if not version:
+            return {}
+        
+        try:
+            is_latest = not self._is_outdated_version(version)
+        except ValueError:
+            is_latest = False
+        
+        return {'version': version, 'is_latest': is_latest}
+    
+    def enumerate_themes(self):
+        """الحصول على قائمة القوالب المكتشفة"""
+        theme = self._get_wordpress_theme()
+        if not theme or 'الاسم' not in theme:
+            return []
+        
+        theme_entry = {'name': theme['الاسم'], 'evidence': theme.get('الأدلة', [])}
+        if 'الإصدار' in theme:
+            theme_entry['version'] = theme['الإصدار']
+            theme_entry['confidence'] = theme['الثقة']
+        return [theme_entry]
+    
+    def enumerate_plugins(self):
+        """الحصول على قائمة الإضافات المكتشفة وحالة تحديثها"""
+        plugins = []
+        
+        for plugin in self._get_wordpress_plugins():
+            plugin_entry = {'name': plugin['الاسم'], 'evidence': plugin.get('الأدلة', [])}
+            if 'الإصدار' in plugin:
+                plugin_entry['version'] = plugin['الإصدار']
+                plugin_entry['confidence'] = plugin['الثقة']
+                # None: آخر إصدار للإضافة غير معروف في قاعدة البيانات (لا يعني أنها محدثة)
+                outdated = self._is_outdated_plugin(plugin['الاسم'], plugin['الإصدار'])
+                plugin_entry['is_latest'] = None if outdated is None else not outdated
+                plugin_entry['vulnerabilities'] = [
+                    record.get('id') for record in get_vulndb('wordpress').lookup('plugin', plugin['الاسم'], plugin['الإصدار'])
+                ]
+            plugins.append(plugin_entry)
+        
+        return plugins
+    
+    def enumerate_users(self):
+        """تعداد المستخدمين من صفحات REST المتوازية أو من ?author=N عند تعطيل REST"""
+        enumerator = WordpressUserEnumerator(self.url, timeout=self.timeout, verbose=self.verbose,
+                                             cancel_token=self.cancel_token)
+        return enumerator.enumerate()
+    
+    def enumerate_components_active(self, limit=None, time_budget=None, rate=DEFAULT_RATE):
+        """التعداد النشط للإضافات والقوالب من القوائم المضمنة (الإضافات غير الظاهرة في الصفحة الرئيسية)"""
+        enumerator = WordpressEnumerator(self.url, timeout=self.timeout, verbose=self.verbose,
+                                         cancel_token=self.cancel_token, rate=rate, time_budget=time_budget)
+        return enumerator.enumerate(limit=limit)
+    
     def _get_wordpress_version(self):
         """الحصول على إصدار ووردبريس"""
         version = None
         
+        # من الصفحة الرئيسية المحللة مسبقًا (وسم generator أو ملفات wp-includes) دون طلبات إضافية
+        core_versions = self.analyze_homepage()['core']
+        if core_versions and core_versions[0]['confidence'] == 'عالية':
+            return core_versions[0]['version']
+        
         # طرق مختلفة للحصول على إصدار ووردبريس
         methods = [
             # من ملف readme.html
             {'path': '/readme.html', 'pattern': r'Version ([\d.]+)'},
-            # من رأس الصفحة
-            {'path': '/', 'pattern': r'<meta name="generator" content="WordPress ([\d.]+)">'},
             # من ملف feed
             {'path': '/feed/', 'pattern': r'<generator>https://wordpress.org/\?v=([\d.]+)</generator>'},
         ]
         
         for method in methods:
             try:
-                full_url = urljoin(self.url, method['path'])
-                response = safe_request(full_url, timeout=self.timeout)
+                # readme.html مشترك مع فحص الثغرات فلا يُطلب مرتين
+                response = self.session.get(method['path'])
                 
                 if response and response.status_code == 200:
                     match = re.search(method['pattern'], response.text)
@@ -191,102 +317,142 @@ class WordpressScanner:
             except Exception as e:
                 self.logger.error(f"خطأ في الحصول على إصدار ووردبريس من {method['path']}: {str(e)}")
         
+        # الإصدار الأكثر تكرارًا في ملفات wp-includes كحل أخير
+        if not version and core_versions:
+            version = core_versions[0]['version']
+        
         return version
     
+    def component_details(self):
+        """جلب ترويسات readme.txt للإضافات و style.css للقوالب المكتشفة بالتوازي (مرة واحدة)
+
+        تعيد {(النوع، المعرف): {'version': ..., 'author': ...}}؛ الزمن محدود بأبطأ ملف وليس بمجموعها.
+        """
+        with self._details_lock:
+            if self._details is None:
+                # فهرس REST يُجلب بالتوازي مع الصفحة الرئيسية لأن كليهما مصدر للإضافات
+                get_governor().submit_for_host(self.domain, 'http', self.rest_index)
+                components = [('theme', theme['slug']) for theme in self.analyze_homepage()['themes']]
+                components += [('plugin', plugin['slug']) for plugin in self._discovered_plugins()]
+                
+                futures = {
+                    get_governor().submit_for_host(self.domain, 'http', self._fetch_component_header, kind, slug): (kind, slug)
+                    for kind, slug in components
+                }
+                
+                details = {}
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.logger.error(f"خطأ في جلب ترويسة {futures[future][1]}: {str(e)}")
+                        continue
+                    if result:
+                        details[futures[future]] = result
+                self._details = details
+            return self._details
+    
+    def _fetch_component_header(self, kind, slug):
+        """قراءة بداية ملف الترويسة لقالب أو إضافة وتحليلها (None إذا لم يوجد الملف)"""
+        path, parser = HEADER_FILES[kind]
+        result = fetch_partial(urljoin(self.url, path.format(slug=slug)), max_bytes=HEADER_BYTES,
+                               timeout=self.timeout, cancel_token=self.cancel_token)
+        if result is None or result[0].status_code not in (200, 206):
+            return None
+        return parser(result[1])
+    
     def _get_wordpress_theme(self):
         """الحصول على القالب المستخدم في ووردبريس"""
         theme_info = {}
         
         try:
-            # الحصول على محتوى الصفحة الرئيسية
-            response = safe_request(self.url, timeout=self.timeout)
+            # أول قالب يظهر في الصفحة الرئيسية المحللة
+            themes = self.analyze_homepage()['themes']
             
-            if response and response.status_code == 200:
-                # البحث عن مسار القالب في محتوى الصفحة
-                theme_pattern = r'wp-content/themes/([^/]+)'
-                theme_matches = re.findall(theme_pattern, response.text)
+            if themes:
+                theme = themes[0]
+                theme_name = theme['slug']
+                theme_info['الاسم'] = theme_name
+                theme_info['الأدلة'] = theme['evidence']
                 
-                if theme_matches:
-                    theme_name = theme_matches[0]
-                    theme_info['الاسم'] = theme_name
-                    
-                    # محاولة الحصول على إصدار القالب
-                    theme_version_pattern = r'wp-content/themes/' + theme_name + r'[^>]+ver=([\d.]+)'
-                    theme_version_match = re.search(theme_version_pattern, response.text)
-                    
-                    if theme_version_match:
-                        theme_info['الإصدار'] = theme_version_match.group(1)
-                    
-                    # التحقق من وجود ملف style.css للقالب
-                    theme_style_url = urljoin(self.url, f'/wp-content/themes/{theme_name}/style.css')
-                    theme_style_response = safe_request(theme_style_url, timeout=self.timeout)
-                    
-                    if theme_style_response and theme_style_response.status_code == 200:
-                        # البحث عن معلومات القالب في ملف style.css
-                        theme_author_pattern = r'Author: (.+)'
-                        theme_author_match = re.search(theme_author_pattern, theme_style_response.text)
-                        
-                        if theme_author_match:
-                            theme_info['المطور'] = theme_author_match.group(1)
+                # دمج إصدار الصفحة الرئيسية مع ترويسة style.css
+                details = self.component_details().get(('theme', theme_name), {})
+                version, confidence = merge_version(theme['version'], theme['confidence'], details.get('version'))
+                if version:
+                    theme_info['الإصدار'] = version
+                    theme_info['الثقة'] = confidence
+                
+                if details.get('author'):
+                    theme_info['المطور'] = details['author']
         
         except Exception as e:
             self.logger.error(f"خطأ في الحصول على معلومات القالب: {str(e)}")
         
         return theme_info
     
+    def rest_index(self):
+        """اكتشاف الإضافات من مساحات أسماء فهرس /wp-json/ بطلب واحد متدفق (مرة واحدة)"""
+        with self._rest_lock:
+            if self._rest_index is None:
+                namespaces = read_rest_namespaces(self.url, timeout=self.timeout, cancel_token=self.cancel_token)
+                self._rest_index = map_namespaces(namespaces)
+                
+                if self.verbose and namespaces:
+                    self.logger.debug(f"مساحات أسماء REST: {namespaces}")
+            return self._rest_index
+    
+    def _discovered_plugins(self):
+        """الإضافات المرجعية في الصفحة الرئيسية ثم الإضافات التي لا يكشفها إلا فهرس REST"""
+        plugins = [dict(plugin) for plugin in self.analyze_homepage()['plugins']]
+        known = {plugin['slug'] for plugin in plugins}
+        
+        for plugin in self.rest_index()['plugins']:
+            if plugin['slug'] not in known:
+                plugins.append({
+                    'slug': plugin['slug'],
+                    'version': None,
+                    'confidence': None,
+                    'evidence': [f"wp-json: {namespace}" for namespace in plugin['namespaces']],
+                })
+        
+        return plugins
+    
     def _get_wordpress_plugins(self):
         """الحصول على قائمة الإضافات المستخدمة في ووردبريس"""
         plugins = []
         
         try:
-            # الحصول على محتوى الصفحة الرئيسية
-            response = safe_request(self.url, timeout=self.timeout)
-            
-            if response and response.status_code == 200:
-                # البحث عن مسارات الإضافات في محتوى الصفحة
-                plugin_pattern = r'wp-content/plugins/([^/]+)'
-                plugin_matches = re.findall(plugin_pattern, response.text)
+            # الإضافات المكتشفة (الصفحة الرئيسية وفهرس REST، بدون تكرار) مع إصدارات readme.txt
+            details = self.component_details()
+            for plugin in self._discovered_plugins():
+                plugin_info = {'الاسم': plugin['slug'], 'الأدلة': plugin['evidence']}
                 
-                # إزالة التكرارات
-                unique_plugins = set(plugin_matches)
+                file_version = details.get(('plugin', plugin['slug']), {}).get('version')
+                version, confidence = merge_version(plugin['version'], plugin['confidence'], file_version)
+                if version:
+                    plugin_info['الإصدار'] = version
+                    plugin_info['الثقة'] = confidence
                 
-                for plugin_name in unique_plugins:
-                    plugin_info = {'الاسم': plugin_name}
-                    
-                    # محاولة الحصول على إصدار الإضافة
-                    plugin_version_pattern = r'wp-content/plugins/' + plugin_name + r'[^>]+ver=([\d.]+)'
-                    plugin_version_match = re.search(plugin_version_pattern, response.text)
-                    
-                    if plugin_version_match:
-                        plugin_info['الإصدار'] = plugin_version_match.group(1)
-                    
-                    plugins.append(plugin_info)
+                plugins.append(plugin_info)
         
         except Exception as e:
             self.logger.error(f"خطأ في الحصول على قائمة الإضافات: {str(e)}")
         
         return plugins
     
-    def scan_vulnerabilities(self):
-        """فحص الثغرات الأمنية في ووردبريس"""
+    def scan_vulnerabilities(self, version=None):
+        """فحص الثغرات الأمنية في ووردبريس (يمكن تمرير الإصدار المكتشف مسبقًا لتجنب إعادة تحديده)"""
         self.logger.info(f"جاري فحص الثغرات الأمنية في ووردبريس للموقع: {self.url}")
         
         vulnerabilities = []
         
         try:
-            # التحقق من الثغرات الشائعة في ووردبريس
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                # إنشاء قائمة بالمهام
-                futures = [executor.submit(self._check_vulnerability, vuln) for vuln in self.common_vulnerabilities]
-                
-                # جمع النتائج
-                for future in futures:
-                    result = future.result()
-                    if result:
-                        vulnerabilities.append(result)
+            # الثغرات الشائعة دفعة واحدة عبر جلسة الفحص (المسارات المطلوبة مسبقًا لا تُعاد)
+            vulnerabilities.extend(self.session.findings(self.VULNERABILITY_PLAN))
             
-            # التحقق من إصدار ووردبريس
-            version = self._get_wordpress_version()
+            # التحقق من إصدار ووردبريس (None تعني أن الإصدار لم يُحدد بعد)
+            if version is None:
+                version = self._get_wordpress_version()
             if version:
                 # التحقق من الإصدار القديم
                 if self._is_outdated_version(version):
@@ -296,10 +462,16 @@ class WordpressScanner:
                         'description': f'يستخدم الموقع إصدار قديم من ووردبريس ({version})، مما قد يعرضه للثغرات الأمنية.',
                         'evidence': f'الإصدار: {version}'
                     })
+                
+                # الثغرات المعروفة لإصدار النواة من قاعدة البيانات المحلية
+                vulnerabilities.extend(known_vulnerabilities('wordpress', 'core', 'wordpress', version))
             
-            # التحقق من الإضافات القديمة
+            # التحقق من الإضافات القديمة والثغرات المعروفة لإصداراتها
             plugins = self._get_wordpress_plugins()
             for plugin in plugins:
+                if 'الإصدار' in plugin:
+                    vulnerabilities.extend(known_vulnerabilities('wordpress', 'plugin', plugin['الاسم'], plugin['الإصدار']))
+                
                 if 'الإصدار' in plugin and self._is_outdated_plugin(plugin['الاسم'], plugin['الإصدار']):
                     vulnerabilities.append({
                         'name': f'إضافة قديمة: {plugin["الاسم"]}',
@@ -317,88 +489,10 @@ class WordpressScanner:
             self.logger.error(f"خطأ في فحص الثغرات الأمنية في ووردبريس: {str(e)}")
             return []
     
-    def _check_vulnerability(self, vuln):
-        """التحقق من ثغرة أمنية محددة"""
-        try:
-            full_url = urljoin(self.url, vuln['path'])
-            response = safe_request(full_url, timeout=self.timeout)
-            
-            if response:
-                # إذا كان هناك نمط محدد للبحث
-                if vuln['pattern']:
-                    if vuln['pattern'] in response.text:
-                        return {
-                            'name': vuln['name'],
-                            'severity': vuln['severity'],
-                            'description': vuln['description'],
-                            'evidence': f'تم العثور على النمط "{vuln["pattern"]}" في {vuln["path"]}'
-                        }
-                # حالات خاصة
-                elif vuln['path'] == '/wp-json/wp/v2/users' and response.status_code == 200:
-                    try:
-                        users_data = response.json()
-                        if isinstance(users_data, list) and len(users_data) > 0:
-                            user_names = [user.get('name', '') for user in users_data if 'name' in user]
-                            return {
-                                'name': vuln['name'],
-                                'severity': vuln['severity'],
-                                'description': vuln['description'],
-                                'evidence': f'تم العثور على {len(user_names)} مستخدم: {", ".join(user_names)}'
-                            }
-                    except json.JSONDecodeError:
-                        pass
-                elif vuln['path'] == '/xmlrpc.php' and response.status_code != 404:
-                    return {
-                        'name': vuln['name'],
-                        'severity': vuln['severity'],
-                        'description': vuln['description'],
-                        'evidence': f'ملف xmlrpc.php متاح (رمز الحالة: {response.status_code})'
-                    }
-                elif vuln['path'] == '/wp-json/wp/v2/posts' and response.status_code == 200:
-                    try:
-                        posts_data = response.json()
-                        if isinstance(posts_data, list) and len(posts_data) > 0:
-                            return {
-                                'name': vuln['name'],
-                                'severity': vuln['severity'],
-                                'description': vuln['description'],
-                                'evidence': f'تم العثور على {len(posts_data)} مقالة'
-                            }
-                    except json.JSONDecodeError:
-                        pass
-            
-            return None
-        
-        except Exception as e:
-            self.logger.error(f"خطأ في التحقق من الثغرة {vuln['name']}: {str(e)}")
-            return None
-    
     def _is_outdated_version(self, version):
-        """التحقق مما إذا كان إصدار ووردبريس قديمًا"""
-        # هذه مجرد قيمة افتراضية، يجب تحديثها بانتظام
-        latest_version = '6.4.2'  # آخر إصدار من ووردبريس وقت كتابة الكود
-        
-        # تحويل الإصدارات إلى قوائم من الأرقام
-        version_parts = list(map(int, version.split('.')))
-        latest_parts = list(map(int, latest_version.split('.')))
-        
-        # مقارنة الإصدارات
-        for i in range(min(len(version_parts), len(latest_parts))):
-            if version_parts[i] < latest_parts[i]:
-                return True
-            elif version_parts[i] > latest_parts[i]:
-                return False
-        
-        # إذا كانت جميع الأجزاء متساوية حتى الآن، فإن الإصدار الأقصر هو الأقدم
-        return len(version_parts) < len(latest_parts)
+        """التحقق مما إذا كان إصدار ووردبريس أقدم من آخر إصدار في قاعدة بيانات الثغرات"""
+        return bool(get_vulndb('wordpress').is_outdated('core', 'wordpress', version))
     
     def _is_outdated_plugin(self, plugin_name, plugin_version):
-        """التحقق مما إذا كانت إضافة ووردبريس قديمة"""
-        # هذه مجرد قيمة افتراضية، يجب تحديثها بانتظام أو استخدام API للتحقق
-        # في تطبيق حقيقي، يمكن استخدام API ووردبريس للتحقق من أحدث إصدار
-        
-        # افتراضيًا، نعتبر أن الإصدارات التي تبدأ بـ 1. أو 2. قديمة
-        if plugin_version.startswith('1.') or plugin_version.startswith('2.'):
-            return True
-        
-        return False
\ No newline at end of file
+        """التحقق مما إذا كانت إضافة ووردبريس أقدم من آخر إصدار معروف (None إذا لم يكن معروفًا؛ الثغرات المعروفة تُبلغ منفصلة)"""
+        return get_vulndb('wordpress').is_outdated('plugin', plugin_name, plugin_version)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة تحليل الصفحة الرئيسية لمواقع ووردبريس في مرور واحد
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import re
+from collections import Counter
+
+# تعبير واحد مجمع يلتقط جميع مراجع الإضافات والقوالب ووسم generator وملفات wp-includes
+# (يقبل أيضًا المسارات المهربة داخل JSON مثل wp-content\/plugins\/)
+_WP_REFERENCE = re.compile(r'''
+    wp-content\\?/(?P<kind>plugins|themes)\\?/(?P<slug>[A-Za-z0-9_.-]+)\\?/
+        (?P<path>[^"'\s<>?#]*)(?:\?(?P<query>[^"'\s<>#]*))?
+  | <meta[^>]+name=["']generator["'][^>]*content=["']WordPress\s*(?P<generator>\d[\d.]*)
+  | wp-includes\\?/(?P<core_path>[^"'\s<>?#]*)\?(?P<core_query>[^"'\s<>#]*)
+''', re.I | re.X)
+
+# مكتبات مضمنة في wp-includes تحمل إصدارها الخاص وليس إصدار النواة
+_BUNDLED_LIBRARIES = re.compile(r'js\\?/(?:jquery|tinymce|mediaelement|underscore|backbone|imagesloaded|masonry)', re.I)
+
+# معامل ver داخل سلسلة الاستعلام
+_VER_PARAM = re.compile(r'(?:^|&(?:amp;)?|&#038;)ver=(\d[0-9A-Za-z.\-]*)')
+
+# الحد الأقصى للأدلة المحفوظة لكل عنصر
+MAX_EVIDENCE = 3
+
+def _query_version(query):
+    """استخراج قيمة ver من سلسلة الاستعلام"""
+    if not query:
+        return None
+    match = _VER_PARAM.search(query)
+    return match.group(1) if match else None
+
+def analyze_homepage(html):
+    """تحليل الصفحة الرئيسية في مرور واحد وإرجاع مرشحي إصدار النواة والقوالب والإضافات مع أدلتها
+
+    ترتيب القوالب والإضافات يتبع أول ظهور لها في الصفحة.
+    """
+    core_candidates = Counter()
+    core_evidence = {}
+    generator_version = None
+    generator_evidence = None
+    components = {'themes': {}, 'plugins': {}}
+
+    for match in _WP_REFERENCE.finditer(html or ''):
+        if match.group('kind'):
+            kind = match.group('kind').lower()
+            slug = match.group('slug')
+            entry = components[kind].setdefault(slug, {'versions': Counter(), 'evidence': []})
+
+            version = _query_version(match.group('query'))
+            if version:
+                entry['versions'][version] += 1
+            if len(entry['evidence']) < MAX_EVIDENCE:
+                entry['evidence'].append(match.group(0))
+
+        elif match.group('generator'):
+            generator_version = match.group('generator')
+            generator_evidence = match.group(0)
+
+        elif not _BUNDLED_LIBRARIES.match(match.group('core_path')):
+            version = _query_version(match.group('core_query'))
+            if version:
+                core_candidates[version] += 1
+                core_evidence.setdefault(version, match.group(0))
+
+    return {
+        'core': _core_versions(generator_version, generator_evidence, core_candidates, core_evidence),
+        'themes': _component_list(components['themes'], generator_version),
+        'plugins': _component_list(components['plugins'], generator_version),
+    }
+
+def _core_versions(generator_version, generator_evidence, candidates, evidence):
+    """ترتيب مرشحي إصدار النواة: وسم generator أولًا ثم الأكثر تكرارًا في wp-includes"""
+    versions = []
+    if generator_version:
+        versions.append({'version': generator_version, 'confidence': 'عالية', 'evidence': generator_evidence})
+
+    for version, _ in candidates.most_common():
+        if version != generator_version:
+            versions.append({'version': version, 'confidence': 'متوسطة', 'evidence': evidence[version]})
+
+    return versions
+
+def _component_list(components, core_version):
+    """تحويل القوالب أو الإضافات إلى قائمة مع الإصدار الأرجح
+
+    ووردبريس يضيف إصدار النواة إلى ver عندما لا تحدد الإضافة إصدارها، لذا يُفضَّل
+    أي إصدار مختلف عن إصدار النواة.
+    """
+    results = []
+    for slug, entry in components.items():
+        ranked = [version for version, _ in entry['versions'].most_common()]
+        own_versions = [version for version in ranked if version != core_version]
+
+        item = {'slug': slug, 'version': None, 'confidence': None, 'evidence': entry['evidence']}
+        if own_versions:
+            item['version'] = own_versions[0]
+            item['confidence'] = 'متوسطة'
+        elif ranked:
+            item['version'] = ranked[0]
+            item['confidence'] = 'منخفضة'
+        results.append(item)
+
+    return results
+
+# حقول الترويسة في readme.txt للإضافات و style.css للقوالب
+_STABLE_TAG = re.compile(r'^\s*Stable tag:\s*([0-9][0-9A-Za-z.\-]*)', re.I | re.M)
+_HEADER_FIELD = re.compile(r'^[\s*#@]*(Version|Author|Theme Name):\s*(.+?)\s*$', re.I | re.M)
+
+def parse_readme(text):
+    """استخراج الإصدار من سطر Stable tag في readme.txt (None إذا كان trunk أو غير موجود)"""
+    match = _STABLE_TAG.search(text or '')
+    return {'version': match.group(1) if match else None}
+
+def parse_style_header(text):
+    """استخراج الإصدار والمطور من ترويسة style.css للقالب"""
+    fields = {}
+    for match in _HEADER_FIELD.finditer(text or ''):
+        fields.setdefault(match.group(1).lower(), match.group(2))
+    return {'version': fields.get('version'), 'author': fields.get('author')}
+
+def merge_version(homepage_version, homepage_confidence, file_version):
+    """دمج إصدار الصفحة الرئيسية مع إصدار ملف الترويسة وإرجاع (الإصدار، الثقة)
+
+    الملف أوثق من معامل ver لأنه يحدده المطور نفسه؛ اتفاق المصدرين يرفع الثقة إلى عالية.
+    """
+    if file_version and file_version == homepage_version:
+        return file_version, 'عالية'
+    if file_version:
+        return file_version, 'متوسطة'
+    return homepage_version, homepage_confidence
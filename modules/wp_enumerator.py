@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة التعداد النشط لإضافات وقوالب ووردبريس من قائمة معرفات مضمنة
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+from .enumerator import SlugEnumerator
+from .vulndb import DATA_DIR
+
+# قوائم المعرفات المضمنة مرتبة حسب الشعبية (الأكثر تثبيتًا أولًا)
+DEFAULT_SLUG_FILES = {
+    'plugin': os.path.join(DATA_DIR, 'wp_plugins.txt'),
+    'theme': os.path.join(DATA_DIR, 'wp_themes.txt'),
+}
+
+# الملف الذي يُطلب لكل نوع؛ ملفات نصية صغيرة موجودة في كل إضافة أو قالب تقريبًا
+PROBE_FILES = {
+    'plugin': '/wp-content/plugins/{slug}/readme.txt',
+    'theme': '/wp-content/themes/{slug}/style.css',
+}
+
+class WordpressEnumerator(SlugEnumerator):
+    """فئة لتعداد إضافات وقوالب ووردبريس بطلبات صغيرة متوازية محدودة المعدل ومقيدة بميزانية زمنية"""
+
+    PROBE_FILES = PROBE_FILES
+    SLUG_FILES = DEFAULT_SLUG_FILES
+    DESCRIPTION = 'للإضافات والقوالب'
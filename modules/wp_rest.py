@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة اكتشاف إضافات ووردبريس من فهرس واجهة REST
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import re
+import json
+import logging
+import threading
+from urllib.parse import urljoin
+from .utils import fetch_partial
+from .vulndb import DATA_DIR
+
+# جدول مساحات الأسماء المعروفة (namespace -> معرف الإضافة) ومساحات أسماء النواة
+NAMESPACE_TABLE = os.path.join(DATA_DIR, 'wp_rest_namespaces.json')
+
+# الحد الأقصى لما يُقرأ من فهرس /wp-json/ (قد يبلغ عدة ميغابايتات بسبب قائمة المسارات)
+MAX_INDEX_BYTES = 2 * 1024 * 1024
+
+# مصفوفة namespaces تأتي قبل routes في فهرس ووردبريس، فتتوقف القراءة فور اكتمالها
+_NAMESPACES = re.compile(rb'"namespaces"\s*:\s*(\[[^\]]*\])')
+
+# بديل عند غياب المصفوفة: مساحات الأسماء من مفاتيح المسارات (مع الشرطات المهربة في JSON)
+_ROUTE_NAMESPACE = re.compile(r'"\\?/([a-z0-9_.-]+(?:\\?/[a-z0-9_.-]+)?\\?/v\d+[a-z0-9.]*)\\?/', re.I)
+
+class NamespaceTable:
+    """جدول مفهرس لتحويل مساحات أسماء REST إلى معرفات الإضافات"""
+
+    def __init__(self, namespaces=None, core=None):
+        """تهيئة الجدول من قاموس namespace -> slug وقائمة مساحات أسماء النواة"""
+        self.exact = {namespace.lower(): slug for namespace, slug in (namespaces or {}).items()}
+        self.core = {namespace.lower() for namespace in core or []}
+
+        # فهرس الجزء الأول لمطابقة الإصدارات غير المدرجة (مثل wc/v4)؛ يُستبعد الجزء المشترك بين إضافتين
+        self.prefixes = {}
+        ambiguous = set()
+        for namespace, slug in self.exact.items():
+            prefix = namespace.split('/', 1)[0]
+            if self.prefixes.get(prefix, slug) != slug:
+                ambiguous.add(prefix)
+            self.prefixes[prefix] = slug
+        for prefix in ambiguous:
+            del self.prefixes[prefix]
+
+    def resolve(self, namespace):
+        """معرف الإضافة لمساحة الأسماء (None للنواة أو غير المعروفة)، مع نوع المطابقة"""
+        namespace = namespace.strip('/').lower()
+        if namespace in self.core:
+            return None, 'core'
+        if namespace in self.exact:
+            return self.exact[namespace], 'exact'
+
+        prefix = namespace.split('/', 1)[0]
+        if prefix in self.prefixes:
+            return self.prefixes[prefix], 'prefix'
+        return None, 'unknown'
+
+_table = None
+_table_lock = threading.Lock()
+
+def get_namespace_table():
+    """الحصول على جدول مساحات الأسماء المضمن (يُحمَّل مرة واحدة)"""
+    global _table
+
+    with _table_lock:
+        if _table is None:
+            try:
+                with open(NAMESPACE_TABLE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                _table = NamespaceTable(data.get('namespaces'), data.get('core'))
+            except (OSError, ValueError) as e:
+                logging.getLogger('jawal').error(f"خطأ في تحميل جدول مساحات الأسماء: {str(e)}")
+                _table = NamespaceTable()
+        return _table
+
+def read_rest_namespaces(url, timeout=30, cancel_token=None):
+    """قراءة مساحات الأسماء من فهرس /wp-json/ بقراءة متدفقة تتوقف فور اكتمال المصفوفة
+
+    تعيد قائمة مساحات الأسماء أو None إذا كان الفهرس غير متاح.
+    """
+    result = fetch_partial(urljoin(url, '/wp-json/'), max_bytes=MAX_INDEX_BYTES, timeout=timeout,
+                           cancel_token=cancel_token, until=_NAMESPACES)
+    if result is None or result[0].status_code not in (200, 206):
+        return None
+
+    text = result[1]
+    match = _NAMESPACES.search(text.encode('utf-8'))
+    if match:
+        try:
+            return [str(namespace) for namespace in json.loads(match.group(1))]
+        except ValueError:
+            pass
+
+    # الفهرس مقطوع أو بصيغة غير معتادة: استخراج مساحات الأسماء من مفاتيح المسارات
+    namespaces = []
+    for match in _ROUTE_NAMESPACE.finditer(text):
+        namespace = match.group(1).replace('\\/', '/')
+        if namespace not in namespaces:
+            namespaces.append(namespace)
+    return namespaces or None
+
+def map_namespaces(namespaces, table=None):
+    """تحويل مساحات الأسماء إلى إضافات مع أدلتها، وإرجاع غير المعروفة على حدة"""
+    table = table or get_namespace_table()
+    plugins = {}
+    unknown = []
+
+    for namespace in namespaces or []:
+        slug, match_type = table.resolve(namespace)
+        if slug:
+            entry = plugins.setdefault(slug, {'slug': slug, 'namespaces': [], 'confidence': 'متوسطة'})
+            entry['namespaces'].append(namespace)
+            if match_type == 'exact':
+                entry['confidence'] = 'عالية'
+        elif match_type == 'unknown':
+            unknown.append(namespace)
+
+    return {'plugins': list(plugins.values()), 'unknown': unknown}
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - وحدة تعداد مستخدمي ووردبريس عبر واجهة REST وأرشيف الكتّاب
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import re
+import json
+import codecs
+import logging
+from concurrent.futures import as_completed, wait, FIRST_COMPLETED
+from urllib.parse import urljoin, unquote
+from .utils import safe_request, get_user_agent, extract_domain
+from .concurrency import get_governor, new_token, CANCEL_POLL_INTERVAL
+
+# أقصى عدد للمستخدمين في صفحة REST واحدة (حد ووردبريس)
+PER_PAGE = 100
+
+# الحد الأقصى للصفحات المطلوبة (10,000 مستخدم)
+MAX_PAGES = 100
+
+# عدد المعرفات المتتالية غير الموجودة التي يتوقف بعدها فحص ?author=N
+MISS_LIMIT = 10
+
+# الحد الأقصى للمعرفات في فحص ?author=N وعدد الطلبات المعلقة في آن واحد
+MAX_AUTHOR_ID = 1000
+AUTHOR_WINDOW = 8
+
+# الحقول المحفوظة لكل مستخدم (تُهمل بقية الحقول فور تحليل كل كائن)
+USER_FIELDS = ('id', 'name', 'slug')
+
+# اسم الكاتب في رابط إعادة التوجيه أو في صنف body لصفحة الأرشيف
+_AUTHOR_LINK = re.compile(r'/author/([^/?#"\']+)')
+_AUTHOR_CLASS = re.compile(r'<body[^>]*class=["\'][^"\']*\bauthor-(?!\d+\b)([^\s"\']+)')
+
+_JSON_DECODER = json.JSONDecoder()
+
+def iter_json_array(chunks):
+    """تحليل مصفوفة JSON تدريجيًا من أجزاء نصية وإرجاع عناصرها واحدًا تلو الآخر
+
+    لا يُحتفظ في الذاكرة إلا بالعنصر الجاري تحليله، فتبقى الذاكرة محدودة مهما كبرت الاستجابة.
+    """
+    buffer = ''
+    position = 0
+    started = False
+
+    for chunk in chunks:
+        buffer = buffer[position:] + chunk
+        position = 0
+
+        while True:
+            # تخطي المسافات والفواصل وبداية المصفوفة
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position >= len(buffer):
+                break
+
+            if not started:
+                if buffer[position] != '[':
+                    raise ValueError('الاستجابة ليست مصفوفة JSON')
+                started = True
+                position += 1
+                continue
+
+            if buffer[position] == ']':
+                return
+
+            try:
+                item, end = _JSON_DECODER.raw_decode(buffer, position)
+            except ValueError:
+                # العنصر لم يكتمل بعد؛ انتظار الجزء التالي
+                break
+
+            position = end
+            yield item
+
+    if not started:
+        raise ValueError('استجابة JSON فارغة')
+
+def _decoded_chunks(response, chunk_size=8192):
+    """فك ترميز جسم الاستجابة تدريجيًا إلى أجزاء نصية"""
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+class WordpressUserEnumerator:
+    """فئة لتعداد المستخدمين من صفحات REST المتوازية، مع الرجوع إلى ?author=N عند تعطيل REST"""
+
+    def __init__(self, url, timeout=30, verbose=False, cancel_token=None, miss_limit=MISS_LIMIT,
+                 max_author_id=MAX_AUTHOR_ID):
+        """تهيئة مُعدِّد المستخدمين"""
+        self.url = url
+        self.domain = extract_domain(url)
+        self.timeout = timeout
+        self.verbose = verbose
+        self.cancel_token = cancel_token
+        self.miss_limit = miss_limit
+        self.max_author_id = max_author_id
+        self.logger = logging.getLogger('jawal')
+
+    def enumerate(self):
+        """تعداد المستخدمين وإرجاع {'users': [...], 'source': 'rest' | 'author' | None}"""
+        self.logger.info(f"جاري تعداد مستخدمي ووردبريس في الموقع: {self.url}")
+
+        users = self.enumerate_rest()
+        if users is not None:
+            return {'users': users, 'source': 'rest'}
+
+        users = self.enumerate_authors()
+        return {'users': users, 'source': 'author' if users else None}
+
+    def enumerate_rest(self):
+        """جلب الصفحة الأولى لمعرفة X-WP-TotalPages ثم بقية الصفحات بالتوازي (None إذا كانت REST معطلة)"""
+        first_page, total_pages = self._fetch_rest_page(1)
+        if first_page is None:
+            return None
+
+        users = {}
+        for user in first_page:
+            users.setdefault(user['id'], user)
+        pages = range(2, min(total_pages, MAX_PAGES) + 1)
+        futures = [get_governor().submit_for_host(self.domain, 'http', self._fetch_rest_page, page) for page in pages]
+
+        for future in as_completed(futures):
+            page_users, _ = future.result()
+            for user in page_users or []:
+                users.setdefault(user['id'], user)
+
+        if self.verbose:
+            self.logger.debug(f"تم جلب {total_pages} صفحة من مستخدمي REST")
+
+        return [users[user_id] for user_id in sorted(users)]
+
+    def _fetch_rest_page(self, page):
+        """جلب صفحة مستخدمين وتحليلها تدريجيًا؛ تعيد (المستخدمين، عدد الصفحات) أو (None، 0)"""
+        url = urljoin(self.url, f'/wp-json/wp/v2/users?per_page={PER_PAGE}&page={page}')
+        response = safe_request(url, headers={'User-Agent': get_user_agent(), 'Accept': 'application/json'},
+                                timeout=self.timeout, max_retries=2, cancel_token=self.cancel_token, stream=True)
+        if response is None:
+            return None, 0
+
+        try:
+            if response.status_code != 200:
+                return None, 0
+
+            users = []
+            for item in iter_json_array(_decoded_chunks(response)):
+                if isinstance(item, dict) and isinstance(item.get('id'), int):
+                    users.append({field: item.get(field) for field in USER_FIELDS})
+
+            total_pages = response.headers.get('X-WP-TotalPages', '1')
+            return users, int(total_pages) if total_pages.isdigit() else 1
+
+        except ValueError as e:
+            # استجابة غير JSON (صفحة حماية أو خطأ مخصص) تعني أن REST غير متاحة
+            if self.verbose:
+                self.logger.debug(f"استجابة مستخدمين غير صالحة من {url}: {str(e)}")
+            return None, 0
+
+        finally:
+            response.close()
+
+    def enumerate_authors(self):
+        """فحص ?author=N بالتوازي بالترتيب والتوقف بعد عدد من المعرفات المتتالية غير الموجودة"""
+        token = new_token(parent=self.cancel_token)
+        governor = get_governor()
+        pending = {}
+        results = {}
+        next_id = 1
+        checked = 0
+        misses = 0
+
+        try:
+            while True:
+                while (not token.cancelled and misses < self.miss_limit and len(pending) < AUTHOR_WINDOW
+                       and next_id <= self.max_author_id):
+                    future = governor.submit_for_host(self.domain, 'http', self._probe_author, next_id, token)
+                    pending[future] = next_id
+                    next_id += 1
+
+                if not pending:
+                    break
+
+                done, _ = wait(list(pending), timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = None if future.cancelled() else future.result()
+
+                # عدّ الإخفاقات المتتالية بترتيب المعرفات فقط على الجزء المكتمل المتصل
+                while checked + 1 in results:
+                    checked += 1
+                    misses = 0 if results[checked] else misses + 1
+                    if misses >= self.miss_limit:
+                        break
+
+                if misses >= self.miss_limit or token.cancelled:
+                    break
+        finally:
+            token.cancel()
+            for future in pending:
+                future.cancel()
+
+        return [results[user_id] for user_id in sorted(results) if results[user_id] and user_id <= checked]
+
+    def _probe_author(self, user_id, cancel_token):
+        """طلب ?author=N دون تتبع التوجيه واستخراج اسم الكاتب (None إذا لم يوجد)"""
+        response = safe_request(urljoin(self.url, f'/?author={user_id}'), timeout=self.timeout, max_retries=1,
+                                allow_redirects=False, cancel_token=cancel_token)
+        if response is None:
+            return None
+
+        if response.status_code in (301, 302, 303, 307, 308):
+            match = _AUTHOR_LINK.search(response.headers.get('Location', ''))
+        elif response.status_code == 200:
+            # صنف body فقط؛ روابط الكتّاب تظهر في أي صفحة فلا تثبت وجود المعرف المطلوب
+            match = _AUTHOR_CLASS.search(response.text)
+        else:
+            match = None
+
+        if not match:
+            return None
+
+        return {'id': user_id, 'name': None, 'slug': unquote(match.group(1))}
@@ -19,6 +19,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/SaudiLinux/JawaL",
     packages=find_packages(),
+    package_data={"modules": ["data/*.json", "data/*.txt"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - أدوات مشتركة للاختبارات: خادم HTTP محلي متعدد الخيوط
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import threading
+from http.server import HTTPServer
+from socketserver import ThreadingMixIn
+
+class ThreadingServer(ThreadingMixIn, HTTPServer):
+    """خادم HTTP تجريبي يعالج كل اتصال في خيط مستقل"""
+
+    daemon_threads = True
+
+def start_server(handler, host='127.0.0.1'):
+    """تشغيل خادم تجريبي في الخلفية على منفذ عشوائي وإرجاع (الخادم، عنوانه الأساسي)"""
+    server = ThreadingServer((host, 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+def stop_server(server):
+    """إيقاف الخادم التجريبي وإغلاق مقبسه"""
+    server.shutdown()
+    server.server_close()
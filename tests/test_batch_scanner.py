@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة الفحص الدفعي
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import io
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.batch_scanner import BatchScanner, iter_targets
+
+class TestBatchScanner(unittest.TestCase):
+    """اختبارات لوحدة الفحص الدفعي"""
+
+    def test_iter_targets(self):
+        """اختبار قراءة الأهداف مع تجاهل الأسطر الفارغة والتعليقات"""
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write('http://a.example\n\n# تعليق\n  https://b.example  \n')
+            path = f.name
+        try:
+            self.assertEqual(list(iter_targets(path)), ['http://a.example', 'https://b.example'])
+        finally:
+            os.unlink(path)
+
+    def test_iter_targets_stdin(self):
+        """اختبار قراءة الأهداف من الإدخال القياسي"""
+        original_stdin = sys.stdin
+        sys.stdin = io.StringIO('http://a.example\nhttp://b.example\n')
+        try:
+            self.assertEqual(list(iter_targets('-')), ['http://a.example', 'http://b.example'])
+        finally:
+            sys.stdin = original_stdin
+
+    def test_run_continues_past_failures(self):
+        """اختبار استمرار الفحص بعد فشل هدف وكتابة النتائج تدريجيًا"""
+        def scan_func(url):
+            if 'bad' in url:
+                raise RuntimeError('فشل')
+            return {'url': url}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_file = os.path.join(tmp, 'out.jsonl')
+            scanner = BatchScanner(scan_func, max_workers=2, output_file=output_file)
+            targets = ['http://a.example', 'http://bad.example', 'http://', 'http://c.example']
+            stats = scanner.run(iter(targets))
+
+            with open(output_file, encoding='utf-8') as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(stats['total'], 4)
+        self.assertEqual(stats['succeeded'], 2)
+        self.assertEqual(stats['failed'], 1)
+        self.assertEqual(stats['skipped'], 1)
+        self.assertEqual(len(records), 4)
+        statuses = sorted(record['status'] for record in records)
+        self.assertEqual(statuses, ['error', 'ok', 'ok', 'skipped'])
+
+if __name__ == '__main__':
+    unittest.main()
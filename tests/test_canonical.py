@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة تحديد العنوان الأساسي النهائي للهدف
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import threading
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.canonical import resolve_base_url, redirect_chain, canonical_base, clear_base_urls
+from modules.cms_probe import ProbeSession
+from tests.helpers import start_server, stop_server
+
+class _CanonicalHandler(BaseHTTPRequestHandler):
+    """الخادم النهائي: /site يوجه إلى /site/ ومسار الدخول يوجه إلى صفحة تسجيل الدخول"""
+
+    counts = Counter()
+    lock = threading.Lock()
+
+    def do_HEAD(self):
+        self._respond()
+
+    def do_GET(self):
+        self._respond()
+
+    def _respond(self):
+        with self.lock:
+            self.counts[self.path] += 1
+        if self.path == '/site':
+            self._redirect('/site/')
+        elif self.path == '/site/admin/':
+            self._redirect('/site/login.php')
+        else:
+            self.send_response(200)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    def _redirect(self, location):
+        self.send_response(301)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+class _RedirectHandler(_CanonicalHandler):
+    """الخادم الأول: يوجه كل الطلبات إلى الخادم النهائي (مثل HTTP إلى HTTPS)"""
+
+    counts = Counter()
+    target = ''
+
+    def _respond(self):
+        with self.lock:
+            self.counts[self.path] += 1
+        self._redirect(self.target + self.path)
+
+class TestCanonical(unittest.TestCase):
+    """اختبارات لتحديد العنوان الأساسي وتسجيل توجيه المسارات"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.servers = [start_server(handler)[0] for handler in (_CanonicalHandler, _RedirectHandler)]
+        cls.final = f"http://127.0.0.1:{cls.servers[0].server_address[1]}"
+        cls.first = f"http://localhost:{cls.servers[1].server_address[1]}"
+        _RedirectHandler.target = cls.final
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in cls.servers:
+            stop_server(server)
+
+    def setUp(self):
+        clear_base_urls()
+        _CanonicalHandler.counts.clear()
+        _RedirectHandler.counts.clear()
+
+    def test_canonical_base(self):
+        """اختبار أن الأساس يأخذ مضيف العنوان النهائي ويتجاهل توجيه الصفحة الرئيسية إلى مسار آخر"""
+        self.assertEqual(canonical_base('http://example.com', 'https://www.example.com/'), 'https://www.example.com/')
+        self.assertEqual(canonical_base('http://example.com/blog', 'https://example.com/blog/'),
+                         'https://example.com/blog/')
+        self.assertEqual(canonical_base('http://example.com/', 'https://example.com/login.php'),
+                         'https://example.com/')
+
+    def test_resolved_once_per_target(self):
+        """اختبار تتبع سلسلة التوجيه مرة واحدة فقط لكل هدف وحفظها"""
+        url = f"{self.first}/site"
+        self.assertEqual(resolve_base_url(url, timeout=5), f"{self.final}/site/")
+        self.assertEqual(resolve_base_url(url, timeout=5), f"{self.final}/site/")
+        self.assertEqual(resolve_base_url(f"{self.final}/site/", timeout=5), f"{self.final}/site/")
+
+        self.assertEqual(sum(_RedirectHandler.counts.values()), 1)
+        self.assertEqual([status for _, _, status in redirect_chain(url)], [301, 301])
+
+    def test_probe_redirects_not_followed(self):
+        """اختبار أن طلبات المسارات تسجل وجهة التوجيه دون اتباعها"""
+        session = ProbeSession(f"{self.final}/site/", timeout=5)
+        response = session.get('admin/')
+
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(session.redirects, {'admin/': '/site/login.php'})
+        self.assertNotIn('/site/login.php', _CanonicalHandler.counts)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة الكشف عن نظام إدارة المحتوى
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import unittest
+import requests
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.cms_detector import CMSDetector, enumerator_for
+
+def make_response(body, headers=None, cookies=None):
+    """إنشاء استجابة HTTP وهمية للاختبار"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body.encode('utf-8')
+    response.encoding = 'utf-8'
+    response.headers.update(headers or {})
+    for name, value in (cookies or {}).items():
+        response.cookies.set(name, value)
+    return response
+
+class TestCMSDetector(unittest.TestCase):
+    """اختبارات لوحدة الكشف عن نظام إدارة المحتوى"""
+
+    def setUp(self):
+        self.detector = CMSDetector('http://example.com')
+
+    def test_wordpress_generator(self):
+        """اختبار الحسم من وسم generator واستخراج الإصدار دون طلبات إضافية"""
+        response = make_response(
+            '<meta name="generator" content="WordPress 6.4.2" />'
+            '<link rel="stylesheet" href="/wp-content/themes/x/style.css">'
+        )
+        result = self.detector.detect(response=response)
+
+        self.assertEqual(result['cms'], 'wordpress')
+        self.assertEqual(result['version'], '6.4.2')
+        self.assertFalse(result['probed'])
+        self.assertEqual(enumerator_for(result['cms']), 'wordpress')
+        # الفاحص الذي يرث الجلسة يستخدم الاستجابة الممررة بدل طلب الصفحة الرئيسية
+        self.assertIs(self.detector.session.homepage(), response)
+
+    def test_headers_and_cookies(self):
+        """اختبار الإشارات من الرؤوس وملفات تعريف الارتباط"""
+        response = make_response(
+            '<div data-drupal-selector="x"></div>',
+            headers={'X-Drupal-Cache': 'HIT'},
+            cookies={'SESS0123456789abcdef0123456789abcdef': '1'}
+        )
+        scores, evidence, _ = self.detector.score_response(response)
+
+        self.assertEqual(max(scores, key=scores.get), 'drupal')
+        self.assertEqual(len(evidence['drupal']), 3)
+        self.assertEqual(enumerator_for('drupal'), 'web')
+
+    def test_ambiguity(self):
+        """اختبار أن الإشارات الضعيفة أو المتقاربة تتطلب طلبات تحقق إضافية"""
+        self.assertEqual(self.detector._ambiguous_candidates({}), [])
+        self.assertEqual(self.detector._ambiguous_candidates({'wordpress': 100}), [])
+        self.assertEqual(self.detector._ambiguous_candidates({'wordpress': 30}), ['wordpress'])
+        self.assertEqual(
+            sorted(self.detector._ambiguous_candidates({'wordpress': 70, 'joomla': 60})),
+            ['joomla', 'wordpress']
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات محرك فحص مسارات أنظمة إدارة المحتوى
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import threading
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.cms_probe import ProbePlan, ProbeSession, run_plans
+from modules.wordpress_scanner import WordpressScanner, WORDPRESS_PATHS
+from modules.joomla_scanner import JoomlaScanner, JOOMLA_PATHS
+from tests.helpers import start_server, stop_server
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    """خادم تجريبي يعد الطلبات لكل مسار ويعيد 404 إلا لملف robots.txt وملف readme.html"""
+
+    counts = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.counts[self.path] += 1
+        if self.path == '/robots.txt':
+            body, status = b'User-agent: *\nDisallow: /administrator/\n', 200
+        elif self.path == '/readme.html':
+            body, status = b'<html>WordPress Version 6.1.1</html>', 200
+        else:
+            body, status = b'not found', 404
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestProbeSession(unittest.TestCase):
+    """اختبارات لجلسة الفحص وخطط الفحص المدمجة"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_server(_CountingHandler)
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_server(cls.server)
+
+    def setUp(self):
+        _CountingHandler.counts.clear()
+
+    def test_merged_plans_cost_union(self):
+        """اختبار أن دمج خطط عدة أنظمة يطلب كل مسار مشترك مرة واحدة فقط"""
+        extra = ProbePlan('extra', [{'name': 'robots', 'path': '/robots.txt', 'pattern': r'Disallow: (\S+)'}])
+        session = ProbeSession(self.url, timeout=5)
+        results = run_plans(session, [WORDPRESS_PATHS, JOOMLA_PATHS, extra])
+
+        union = set(WORDPRESS_PATHS.paths()) | set(JOOMLA_PATHS.paths()) | set(extra.paths())
+        self.assertEqual(session.requested, len(union))
+        self.assertEqual(max(_CountingHandler.counts.values()), 1)
+        self.assertEqual(len(results['joomla-paths']), len(JOOMLA_PATHS))
+        self.assertEqual(results['extra'][0][1], 'تم العثور على "/administrator/" في /robots.txt')
+
+    def test_scanners_share_session(self):
+        """اختبار أن فاحصي ووردبريس وجوملا على جلسة واحدة لا يكرران المسارات المطلوبة مسبقًا"""
+        session = ProbeSession(self.url, timeout=5)
+        wordpress = WordpressScanner(self.url, timeout=5, session=session)
+        joomla = JoomlaScanner(self.url, timeout=5, session=session)
+
+        self.assertFalse(wordpress.verify_wordpress(threshold=20))
+        self.assertFalse(joomla.verify_joomla(threshold=20))
+        self.assertEqual(wordpress.session.get('/readme.html').status_code, 200)
+        findings = wordpress.session.findings(wordpress.VULNERABILITY_PLAN)
+
+        self.assertIn('كشف إصدار ووردبريس', [finding['name'] for finding in findings])
+        self.assertEqual(_CountingHandler.counts['/'], 1)
+        self.assertEqual(_CountingHandler.counts['/readme.html'], 1)
+        self.assertEqual(max(_CountingHandler.counts.values()), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة التحكم في التوازي
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import time
+import threading
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.concurrency import ConcurrencyGovernor, CancellationToken, parse_budgets, get_rate_limiter
+
+class TestConcurrencyGovernor(unittest.TestCase):
+    """اختبارات لوحدة التحكم في التوازي"""
+
+    def test_budget_limits_parallelism(self):
+        """اختبار عدم تجاوز ميزانية المورد"""
+        governor = ConcurrencyGovernor({'http': 2, 'socket': 1, 'cpu': 1})
+        lock = threading.Lock()
+        state = {'current': 0, 'peak': 0}
+
+        def task():
+            with lock:
+                state['current'] += 1
+                state['peak'] = max(state['peak'], state['current'])
+            time.sleep(0.05)
+            with lock:
+                state['current'] -= 1
+
+        futures = governor.map('http', lambda _: task(), range(6))
+        for future in futures:
+            future.result()
+        governor.shutdown()
+
+        self.assertEqual(state['peak'], 2)
+
+    def test_nested_cpu_work(self):
+        """اختبار تنفيذ مهام cpu من داخل مهام http دون استنزاف"""
+        governor = ConcurrencyGovernor({'http': 2, 'socket': 1, 'cpu': 1})
+        futures = governor.map('http', lambda n: governor.run('cpu', lambda: n * 2), range(5))
+        self.assertEqual([future.result() for future in futures], [0, 2, 4, 6, 8])
+        governor.shutdown()
+
+    def test_host_limit_and_fairness(self):
+        """اختبار حد المضيف وعدم حجب مضيف بطيء لمضيف سريع"""
+        governor = ConcurrencyGovernor({'http': 4, 'socket': 1, 'cpu': 1, 'host': 2})
+        lock = threading.Lock()
+        inflight = {'slow': 0, 'fast': 0}
+        peaks = {'slow': 0, 'fast': 0}
+
+        def task(host, delay):
+            with lock:
+                inflight[host] += 1
+                peaks[host] = max(peaks[host], inflight[host])
+            time.sleep(delay)
+            with lock:
+                inflight[host] -= 1
+            return host
+
+        slow = [governor.submit_for_host('slow', 'http', task, 'slow', 0.3) for _ in range(4)]
+        fast = [governor.submit_for_host('fast', 'http', task, 'fast', 0.01) for _ in range(10)]
+
+        start_time = time.time()
+        for future in fast:
+            self.assertEqual(future.result(), 'fast')
+        fast_elapsed = time.time() - start_time
+        for future in slow:
+            future.result()
+        governor.shutdown()
+
+        self.assertLess(fast_elapsed, 0.3)
+        self.assertEqual(peaks['slow'], 2)
+        self.assertLessEqual(peaks['fast'], 2)
+
+    def test_host_queue_after_plain_submit(self):
+        """اختبار خدمة طوابير المضيفين بعد تحرير السعة من مهام عادية"""
+        governor = ConcurrencyGovernor({'http': 1, 'socket': 1, 'cpu': 1})
+        plain = governor.submit('http', time.sleep, 0.05)
+        queued = governor.submit_for_host('example.com', 'http', lambda: 'ok')
+        plain.result()
+        self.assertEqual(queued.result(timeout=2), 'ok')
+        governor.shutdown()
+
+    def test_unknown_resource(self):
+        """اختبار رفض فئات الموارد غير المعروفة"""
+        governor = ConcurrencyGovernor()
+        self.assertRaises(ValueError, governor.submit, 'gpu', lambda: None)
+        governor.shutdown()
+
+    def test_parse_budgets(self):
+        """اختبار تحليل مواصفات الميزانيات"""
+        self.assertEqual(parse_budgets('http=64, socket=256'), {'http': 64, 'socket': 256})
+        self.assertEqual(parse_budgets('host=4'), {'host': 4})
+        self.assertEqual(parse_budgets(''), {})
+        self.assertRaises(ValueError, parse_budgets, 'gpu=2')
+        self.assertRaises(ValueError, parse_budgets, 'http=0')
+        self.assertRaises(ValueError, parse_budgets, 'http')
+
+class TestRateLimiter(unittest.TestCase):
+    """اختبارات لمحددات المعدل المشتركة"""
+
+    def test_shared_per_host_and_rate(self):
+        """اختبار أن المعدلات المختلفة للمضيف نفسه لا يستبدل أحدها الآخر"""
+        slow = get_rate_limiter('limits.test', 20)
+        fast = get_rate_limiter('limits.test', 50)
+
+        self.assertIs(get_rate_limiter('limits.test', 20), slow)
+        self.assertIs(get_rate_limiter('limits.test', 50.0), fast)
+        self.assertIsNot(slow, fast)
+        self.assertEqual((slow.rate, fast.rate), (20.0, 50.0))
+
+class TestCancellationToken(unittest.TestCase):
+    """اختبارات لرمز الإلغاء التعاوني"""
+
+    def test_deadline_and_clamp(self):
+        """اختبار انتهاء المهلة وتقليص مهلة العمليات الفردية"""
+        token = CancellationToken(deadline=0.2)
+        self.assertFalse(token.cancelled)
+        self.assertLessEqual(token.clamp_timeout(30), 0.2)
+        self.assertEqual(CancellationToken().clamp_timeout(30), 30)
+        time.sleep(0.25)
+        self.assertTrue(token.cancelled)
+        self.assertEqual(token.clamp_timeout(30), 0)
+
+    def test_parent_cancellation(self):
+        """اختبار وراثة الإلغاء من الرمز الأب"""
+        parent = CancellationToken()
+        child = CancellationToken(deadline=60, parent=parent)
+        parent.cancel()
+        self.assertTrue(child.cancelled)
+        self.assertEqual(child.remaining(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة اكتشاف المحتوى
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.content_discovery import ContentDiscovery, expand
+from tests.helpers import start_server, stop_server
+
+# المسارات الموجودة فعلًا (بعد قاعدة الموقع /site/) ومحتواها
+PAGES = {
+    '/site/backup.zip': b'PK' + b'\x00' * 4000,
+    '/site/admin/': b'<html>' + b'admin panel ' * 300 + b'</html>',
+    '/site/admin/secret.php': b'secret ' * 500,
+}
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    """خادم تجريبي باتصالات دائمة يجيب 200 بصفحة خطأ مخصصة لكل مسار غير موجود ويوجه /site/admin إلى /site/admin/"""
+
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+    lock = threading.Lock()
+
+    def do_HEAD(self):
+        self._respond(head=True)
+
+    def do_GET(self):
+        self._respond(head=False)
+
+    def _respond(self, head):
+        with self.lock:
+            self.connections.add(self.client_address)
+
+        if self.path == '/site/admin':
+            status, body, extra = 301, b'', {'Location': '/site/admin/'}
+        elif self.path in PAGES:
+            status, body, extra = 200, PAGES[self.path], {}
+        else:
+            status, body, extra = 200, f"<html>Page {self.path} was not found</html>".encode('utf-8'), {}
+
+        self.send_response(status)
+        for name, value in extra.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestContentDiscovery(unittest.TestCase):
+    """اختبارات لاكتشاف المحتوى"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_server(_SiteHandler)
+        cls.url += 'site/'
+
+        handle, cls.wordlist = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w') as f:
+            f.write('# قائمة تجريبية\nadmin\nbackup\nsecret\n/missing/\nnothing\nreadme.txt\n')
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_server(cls.server)
+        os.remove(cls.wordlist)
+
+    def setUp(self):
+        _SiteHandler.connections.clear()
+
+    def test_expand(self):
+        """اختبار توسيع الكلمات بالامتدادات وعدم توسيع الكلمات ذات الامتداد"""
+        self.assertEqual(list(expand(['admin', 'robots.txt'], ['php', 'bak'])),
+                         [('admin', ''), ('admin', '.php'), ('admin', '.bak'), ('robots', '.txt')])
+
+    def test_discovers_with_recursion(self):
+        """اختبار اكتشاف الملفات والمجلدات والتعمق فيها مع استبعاد صفحات الخطأ المخصصة"""
+        discovery = ContentDiscovery(self.url, timeout=5, rate=1000, concurrency=4)
+        streamed = []
+        results = discovery.run(wordlist=self.wordlist, extensions=['php', 'zip'], recursion=1,
+                                on_found=streamed.append)
+
+        found = {item['path']: item for item in results['found']}
+        self.assertEqual(set(found), {'/backup.zip', '/admin', '/admin/secret.php'})
+        self.assertTrue(found['/admin']['directory'])
+        self.assertEqual(found['/admin/secret.php']['depth'], 1)
+        self.assertEqual(found['/backup.zip']['url'], f"{self.url}backup.zip")
+        self.assertEqual(streamed, results['found'])
+        self.assertFalse(results['truncated'])
+
+        # الطلبات تُعاد على اتصالات المجمع بدل اتصال جديد لكل طلب
+        self.assertGreater(results['probed'], 20)
+        self.assertLessEqual(len(_SiteHandler.connections), 8)
+
+    def test_stops_when_generator_closed(self):
+        """اختبار أن إغلاق المولّد بعد أول نتيجة يوقف الفحص"""
+        discovery = ContentDiscovery(self.url, timeout=5, rate=1000, concurrency=2)
+        results = discovery.discover(wordlist=self.wordlist, extensions=['php', 'zip'], recursion=1)
+        first = next(results)
+        results.close()
+
+        self.assertIn(first['path'], {'/backup.zip', '/admin'})
+        self.assertLess(discovery.probed, 20)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة التعداد النشط لامتدادات جوملا
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.joomla_enumerator import JoomlaEnumerator, extension_name
+from modules.joomla_scanner import JoomlaScanner
+from tests.helpers import start_server, stop_server
+
+def _manifest(name, version):
+    return (f'<?xml version="1.0" encoding="utf-8"?>\n<extension type="component" method="upgrade">\n'
+            f'<name>{name}</name>\n<author>Example</author>\n<version>{version}</version>\n'
+            f'<description>{"x" * 200}</description>\n</extension>\n').encode('utf-8')
+
+class _JoomlaHandler(BaseHTTPRequestHandler):
+    """خادم تجريبي يعيد 200 بصفحة خطأ مخصصة لكل المسارات غير الموجودة"""
+
+    existing = {
+        '/administrator/components/com_k2/k2.xml': _manifest('K2', '2.11.0'),
+        '/plugins/editors/jce/jce.xml': _manifest('plg_editors_jce', '2.9.40'),
+        '/plugins/editors/jckeditor/jckeditor.xml': _manifest('plg_editors_jckeditor', '6.4.4'),
+        '/plugins/system/slow/slow.xml': _manifest('plg_system_slow', '1.0.0'),
+    }
+
+    def do_HEAD(self):
+        body = self.existing.get(self.path, b'<html>Page not found</html>')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+    def do_GET(self):
+        body = self.existing.get(self.path, b'<html>Page not found</html>')
+        # ملف بيان بطيء عند قراءته كاملًا (لا عند فحص وجوده) لاختبار تقييد القراءة بالميزانية الزمنية
+        if self.path.startswith('/plugins/system/slow/') and self.headers.get('Range') != 'bytes=0-1023':
+            time.sleep(3)
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestJoomlaEnumerator(unittest.TestCase):
+    """اختبارات للتعداد النشط لامتدادات جوملا"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_server(_JoomlaHandler)
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_server(cls.server)
+
+    def setUp(self):
+        self.slug_files = {}
+        for kind, content in (('component', 'akeebabackup\nk2\n'), ('plugin', 'editors/jce\nsystem/t3\n')):
+            handle, path = tempfile.mkstemp(suffix='.txt')
+            with os.fdopen(handle, 'w', encoding='utf-8') as f:
+                f.write(content)
+            self.slug_files[kind] = path
+
+    def tearDown(self):
+        for path in self.slug_files.values():
+            os.remove(path)
+
+    def test_probe_path(self):
+        """اختبار مسارات ملفات البيان لكل نوع"""
+        enumerator = JoomlaEnumerator(self.url)
+        self.assertEqual(enumerator.probe_path('component', 'k2'), '/administrator/components/com_k2/k2.xml')
+        self.assertEqual(enumerator.probe_path('module', 'djmegamenu'), '/modules/mod_djmegamenu/mod_djmegamenu.xml')
+        self.assertEqual(enumerator.probe_path('plugin', 'editors/jce'), '/plugins/editors/jce/jce.xml')
+        self.assertEqual(extension_name('plugin', 'editors/jce'), 'plg_editors_jce')
+
+    def test_enumerate_with_manifest_versions(self):
+        """اختبار التمييز عن صفحة الخطأ المخصصة وقراءة الإصدار من ملف البيان"""
+        enumerator = JoomlaEnumerator(self.url, timeout=5, rate=100, slug_files=self.slug_files)
+        results = enumerator.enumerate(kinds=('component', 'plugin'))
+
+        self.assertEqual([(item['name'], item['version']) for item in results['components']], [('com_k2', '2.11.0')])
+        self.assertEqual([(item['name'], item['version']) for item in results['plugins']],
+                         [('plg_editors_jce', '2.9.40')])
+        self.assertEqual(results['probed'], 4)
+        self.assertFalse(results['truncated'])
+
+    def test_manifest_reads_respect_time_budget(self):
+        """اختبار ترك قراءات البيانات المعلقة عند انتهاء الميزانية الزمنية مع إبقاء الامتداد المكتشف"""
+        with open(self.slug_files['plugin'], 'a', encoding='utf-8') as f:
+            f.write('system/slow\n')
+        enumerator = JoomlaEnumerator(self.url, timeout=5, rate=100, time_budget=1.5,
+                                      slug_files={'plugin': self.slug_files['plugin']})
+
+        start = time.time()
+        results = enumerator.enumerate(kinds=('plugin',))
+        self.assertLess(time.time() - start, 2.5)
+
+        slow = [item for item in results['plugins'] if item['slug'] == 'system/slow']
+        self.assertEqual(len(slow), 1)
+        self.assertEqual(slow[0]['name'], 'plg_system_slow')
+        self.assertNotIn('version', slow[0])
+        self.assertTrue(results['truncated'])
+
+    def test_enumerated_extensions_reach_vulnerability_index(self):
+        """اختبار فحص الإضافات المكتشفة بالتعداد النشط وإصداراتها مقابل قاعدة الثغرات"""
+        enumerator = JoomlaEnumerator(self.url, timeout=5, rate=100, slug_files={'plugin': self.slug_files['plugin']})
+        with open(self.slug_files['plugin'], 'a', encoding='utf-8') as f:
+            f.write('editors/jckeditor\n')
+        results = enumerator.enumerate(kinds=('plugin',))
+
+        vulnerabilities = JoomlaScanner(self.url, timeout=5).scan_vulnerabilities(version='', extensions=results)
+        self.assertTrue(any(vuln['name'].startswith('CVE-2018-17254') for vuln in vulnerabilities))
+
+if __name__ == '__main__':
+    unittest.main()
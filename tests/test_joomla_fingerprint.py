@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة بصمات إصدارات جوملا
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.joomla_fingerprint import build_database, FingerprintDatabase, JoomlaFingerprinter
+from tests.helpers import start_server, stop_server
+
+# ثمانية إصدارات تجريبية: كل ملف يتغير عند بت مختلف من رقم الإصدار، وملف ثابت لا يميز بينها
+VERSIONS = [f'4.0.{i}' for i in range(8)]
+
+def _release_files(index):
+    return {
+        'media/system/js/core.js': f'core {index >> 2}',
+        'media/system/css/joomla.css': f'css {(index >> 1) & 1}',
+        'media/vendor/bootstrap.js': f'bootstrap {index & 1}',
+        'media/system/js/static.js': 'unchanged',
+    }
+
+class TestJoomlaFingerprint(unittest.TestCase):
+    """اختبارات لبناء قاعدة البصمات واختيار الطلبات"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        releases = {}
+        for index, version in enumerate(VERSIONS):
+            releases[version] = os.path.join(self.root, version)
+            for path, content in _release_files(index).items():
+                full_path = os.path.join(releases[version], path)
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                with open(full_path, 'w') as f:
+                    f.write(content)
+        self.database = build_database(releases)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_build_database(self):
+        """اختبار استبعاد الملفات غير المميزة"""
+        self.assertEqual(self.database['versions'], VERSIONS)
+        self.assertNotIn('media/system/js/static.js', self.database['files'])
+        self.assertEqual(len(self.database['files']), 3)
+
+    def test_identify_with_minimal_probes(self):
+        """اختبار تحديد الإصدار بثلاثة طلبات فقط (log2 لثمانية إصدارات)"""
+        served = _release_files(5)
+        requested = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requested.append(self.path)
+                body = served.get(self.path.lstrip('/'))
+                self.send_response(200 if body else 404)
+                self.end_headers()
+                if body:
+                    self.wfile.write(body.encode())
+
+            def log_message(self, *args):
+                pass
+
+        server, url = start_server(Handler)
+        self.addCleanup(stop_server, server)
+
+        result = JoomlaFingerprinter(url, timeout=5, database=FingerprintDatabase(self.database)).identify()
+
+        self.assertEqual(result['version'], '4.0.5')
+        self.assertEqual(len(requested), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة قراءة ملفات بيان جوملا
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.joomla_manifest import parse_manifest
+
+MANIFEST = b'''<?xml version="1.0" encoding="utf-8"?>
+<extension type="component" method="upgrade">
+    <name>com_example</name>
+    <author>Example Ltd</author>
+    <version>3.2.1</version>
+    <files><version>9.9.9</version></files>
+'''
+
+class TestJoomlaManifest(unittest.TestCase):
+    """اختبارات للتحليل التدريجي لملفات البيان"""
+
+    def test_stops_at_version(self):
+        """اختبار التوقف عند <version> دون قراءة بقية الملف"""
+        chunks = [MANIFEST[i:i + 16] for i in range(0, len(MANIFEST), 16)]
+        consumed = []
+
+        def feed():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+            # بقية الملف لا يجب أن تُطلب
+            raise AssertionError('تمت القراءة بعد <version>')
+
+        self.assertEqual(parse_manifest(feed()),
+                         {'name': 'com_example', 'author': 'Example Ltd', 'version': '3.2.1'})
+        self.assertLess(len(consumed), len(chunks))
+
+    def test_rejects_html(self):
+        """اختبار رفض صفحات HTML والمحتوى غير الصالح (صفحات الخطأ المخصصة)"""
+        self.assertIsNone(parse_manifest([b'<!DOCTYPE html><html><body>Not found</body></html>']))
+        self.assertIsNone(parse_manifest([b'not xml at all']))
+
+if __name__ == '__main__':
+    unittest.main()
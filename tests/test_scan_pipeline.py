@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة مخطط مراحل الفحص
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import time
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.scan_pipeline import ScanNode, ScanPipeline, build_pipeline, build_default_nodes
+from modules.concurrency import new_token
+
+class TestScanPipeline(unittest.TestCase):
+    """اختبارات لوحدة مخطط مراحل الفحص"""
+
+    def _build(self):
+        def resolve(url):
+            if 'bad' in url:
+                raise RuntimeError('فشل تحليل النطاق')
+            return {'ip': '127.0.0.1'}
+
+        def detect(ip):
+            return {'cms': 'wordpress'} if ip else None
+
+        nodes = [
+            ScanNode('resolve', resolve, inputs=['url'], outputs=['ip']),
+            ScanNode('detect', detect, inputs=['ip'], outputs=['cms']),
+            ScanNode('enumerate', lambda url, cms: {'plugins': [cms]}, inputs=['url', 'cms'], outputs=['plugins']),
+            ScanNode('report', lambda url, **artifacts: {'report': sorted(artifacts)},
+                     inputs=['url'], optional_inputs=['ip', 'plugins'], outputs=['report']),
+        ]
+        return ScanPipeline(nodes, max_workers=4)
+
+    def test_artifacts_are_shared(self):
+        """اختبار تمرير المخرجات بين العقد"""
+        records = list(self._build().run(['http://a.example']))
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['status'], 'ok')
+        self.assertEqual(records[0]['results']['plugins'], ['wordpress'])
+        self.assertEqual(records[0]['results']['report'], ['ip', 'plugins'])
+
+    def test_failed_prerequisites_skip_subgraph(self):
+        """اختبار تخطي العقد التي فشلت متطلباتها مع استمرار العقد الاختيارية"""
+        records = {record['target']: record for record in self._build().run(['http://bad.example', 'http://a.example'])}
+
+        bad = records['http://bad.example']
+        self.assertEqual(bad['status'], 'error')
+        self.assertEqual(bad['nodes']['resolve'], 'failed')
+        self.assertEqual(bad['nodes']['detect'], 'skipped')
+        self.assertEqual(bad['nodes']['enumerate'], 'skipped')
+        self.assertEqual(bad['nodes']['report'], 'done')
+        self.assertEqual(records['http://a.example']['status'], 'ok')
+
+    def test_deadline_truncates_target(self):
+        """اختبار إصدار نتائج جزئية عند انتهاء مهلة الهدف"""
+        nodes = [
+            ScanNode('fast', lambda url: {'a': 1}, inputs=['url'], outputs=['a']),
+            ScanNode('slow', lambda url, cancel_token: time.sleep(2) or {'b': 2},
+                     inputs=['url', 'cancel_token'], outputs=['b']),
+        ]
+        pipeline = ScanPipeline(nodes, max_workers=2, deadline=0.3)
+
+        start_time = time.time()
+        records = list(pipeline.run(['http://a.example']))
+
+        self.assertLess(time.time() - start_time, 1.5)
+        self.assertTrue(records[0]['truncated'])
+        self.assertEqual(records[0]['results'], {'a': 1})
+        self.assertEqual(records[0]['nodes']['slow'], 'cancelled')
+
+    def test_invalid_graph(self):
+        """اختبار رفض المدخلات غير المعروفة والحلقات"""
+        self.assertRaises(ValueError, ScanPipeline, [ScanNode('a', None, inputs=['missing'], outputs=['x'])])
+        self.assertRaises(ValueError, ScanPipeline, [
+            ScanNode('a', None, inputs=['y'], outputs=['x']),
+            ScanNode('b', None, inputs=['x'], outputs=['y']),
+        ])
+
+    def test_default_resolve(self):
+        """اختبار تحليل النطاق عبر المتحكم المشترك وتجاوز التحليل لعناوين IP"""
+        resolve = build_default_nodes(timeout=5)['resolve'].func
+        self.assertEqual(resolve(url='http://10.1.2.3:8080/', cancel_token=new_token()), {'ip': '10.1.2.3'})
+        self.assertEqual(resolve(url='http://localhost/', cancel_token=new_token(5))['ip'].split('.')[0], '127')
+
+    def test_profiles(self):
+        """اختبار بناء ملفات التعريف الافتراضية"""
+        for profile in ['web', 'cms', 'full']:
+            pipeline = build_pipeline(profile)
+            self.assertIn('report', [node.name for node in pipeline.nodes])
+        self.assertRaises(ValueError, build_pipeline, 'unknown')
+
+if __name__ == '__main__':
+    unittest.main()
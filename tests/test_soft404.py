@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة معايرة صفحات الخطأ المخصصة
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import time
+import uuid
+import threading
+import unittest
+from urllib.parse import urljoin
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.soft404 import simhash, hamming, path_shape, SIMHASH_DISTANCE, Soft404Detector
+from modules.utils import safe_request
+from modules.joomla_scanner import JoomlaScanner
+from modules.wp_enumerator import WordpressEnumerator
+from tests.helpers import start_server, stop_server
+
+PAGE = ('<html><head><title>Example Shop</title></head><body><nav>Home Products About Contact</nav>'
+        '<h1>Sorry, we could not find {path}</h1><p>Try searching our catalogue or return to the home page.</p>'
+        '<footer>Copyright Example Shop. All rights reserved.</footer></body></html>')
+
+class _CatchAllHandler(BaseHTTPRequestHandler):
+    """خادم تجريبي يعيد 200 لكل المسارات بصفحة تعكس المسار المطلوب، أو بمحتوى عشوائي في /random/"""
+
+    def do_HEAD(self):
+        self.send_response(405)
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path.startswith('/random/'):
+            body = ' '.join(uuid.uuid4().hex for _ in range(40))
+        else:
+            body = PAGE.format(path=self.path)
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestSoft404(unittest.TestCase):
+    """اختبارات لمعايرة صفحات الخطأ المخصصة"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_server(_CatchAllHandler)
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_server(cls.server)
+
+    def test_simhash_and_shapes(self):
+        """اختبار تقارب بصمات الصفحات المتشابهة وتباعد المختلفة وتصنيف أشكال المسارات"""
+        first, second = simhash(PAGE.format(path='/a')), simhash(PAGE.format(path='/b'))
+        self.assertLessEqual(hamming(first, second), SIMHASH_DISTANCE)
+        self.assertGreater(hamming(first, simhash('=== Akismet ===\nStable tag: 5.3\nContributors: automattic')),
+                           SIMHASH_DISTANCE)
+        self.assertEqual([path_shape(path) for path in ['/wp-admin/', '/xmlrpc.php', '/README.txt', '/feed']],
+                         ['dir', 'php', 'file', 'bare'])
+
+    def test_catch_all_does_not_verify(self):
+        """اختبار أن موقعًا يجيب 200 على كل شيء لا يُعد جوملا من المسارات وحدها"""
+        scanner = JoomlaScanner(self.url, timeout=5)
+        self.assertFalse(scanner.verify_joomla())
+        self.assertTrue(scanner.session.soft404.profile('dir').answers_everything)
+
+    def test_enumeration_short_circuits(self):
+        """اختبار إيقاف التعداد على موقع يجيب بصفحات متغيرة لا يمكن معايرتها"""
+        enumerator = WordpressEnumerator(self.url, timeout=5, rate=100)
+        enumerator.PROBE_FILES = {'plugin': '/random/{slug}/readme.txt'}
+        results = enumerator.enumerate(kinds=('plugin',), limit=20)
+
+        self.assertEqual(results['plugins'], [])
+        self.assertEqual(results['probed'], 0)
+
+    def test_profiles_calibrate_independently(self):
+        """اختبار أن معايرة شكل بطيء لا تحجز معايرة شكل آخر ولا تتكرر للطلبات المتزامنة"""
+        release = threading.Event()
+        requested = []
+
+        def request(path):
+            requested.append(path)
+            if path.endswith('.php'):
+                release.wait(5)
+            return safe_request(urljoin(self.url, path), timeout=5, max_retries=1)
+
+        detector = Soft404Detector(request)
+        waiters = [threading.Thread(target=detector.profile, args=('php',)) for _ in range(3)]
+        for waiter in waiters:
+            waiter.start()
+
+        # الشكل الآخر يُعاير بينما معايرة php متوقفة (دون انتظار مهلتها)
+        start = time.time()
+        self.assertTrue(detector.profile('dir').answers_everything)
+        self.assertLess(time.time() - start, 2)
+
+        release.set()
+        for waiter in waiters:
+            waiter.join(5)
+        self.assertTrue(detector.profile('php').answers_everything)
+        self.assertEqual(len([path for path in requested if path.endswith('.php')]), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة جدولة المراحل
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import time
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.concurrency import CancellationToken
+from modules.stage_scheduler import StageScheduler
+
+class TestStageScheduler(unittest.TestCase):
+    """اختبارات لوحدة جدولة المراحل"""
+
+    def test_independent_stages_run_concurrently(self):
+        """اختبار أن زمن التنفيذ يقارب أطول مرحلة وليس مجموع المراحل"""
+        scheduler = StageScheduler()
+        for name in ['a', 'b', 'c']:
+            scheduler.add_stage(name, lambda: time.sleep(0.2) or True)
+
+        start_time = time.time()
+        results = scheduler.run()
+
+        self.assertLess(time.time() - start_time, 0.5)
+        self.assertEqual(results, {'a': True, 'b': True, 'c': True})
+
+    def test_dependencies_receive_results(self):
+        """اختبار تمرير نتائج المراحل إلى المراحل المعتمدة عليها"""
+        completed = []
+        scheduler = StageScheduler(on_stage_done=lambda name, _: completed.append(name))
+        scheduler.add_stage('version', lambda: {'version': '6.4.2'})
+        scheduler.add_stage('vulnerabilities', lambda version: [version['version']], depends_on=['version'])
+
+        results = scheduler.run()
+
+        self.assertEqual(results['vulnerabilities'], ['6.4.2'])
+        self.assertEqual(completed, ['version', 'vulnerabilities'])
+
+    def test_failed_stage_is_isolated(self):
+        """اختبار أن فشل مرحلة لا يوقف بقية المراحل"""
+        def broken():
+            raise RuntimeError('خطأ')
+
+        scheduler = StageScheduler()
+        scheduler.add_stage('broken', broken)
+        scheduler.add_stage('ok', lambda: 1)
+
+        results = scheduler.run()
+
+        self.assertIsNone(results['broken'])
+        self.assertEqual(results['ok'], 1)
+        self.assertIn('broken', scheduler.errors)
+
+    def test_deadline_returns_partial_results(self):
+        """اختبار إرجاع النتائج الجزئية عند انتهاء المهلة دون انتظار المراحل البطيئة"""
+        scheduler = StageScheduler(cancel_token=CancellationToken(deadline=0.2))
+        scheduler.add_stage('fast', lambda: 1)
+        scheduler.add_stage('slow', lambda: time.sleep(2) or 2)
+
+        start_time = time.time()
+        results = scheduler.run()
+
+        self.assertLess(time.time() - start_time, 1)
+        self.assertEqual(results, {'fast': 1})
+        self.assertTrue(scheduler.truncated)
+
+    def test_invalid_dependencies(self):
+        """اختبار رفض الاعتماديات غير المعروفة والدائرية"""
+        scheduler = StageScheduler()
+        scheduler.add_stage('a', lambda missing: None, depends_on=['missing'])
+        self.assertRaises(ValueError, scheduler.run)
+
+        scheduler = StageScheduler()
+        scheduler.add_stage('a', lambda b: None, depends_on=['b'])
+        scheduler.add_stage('b', lambda a: None, depends_on=['a'])
+        self.assertRaises(ValueError, scheduler.run)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة اكتشاف النطاقات الفرعية
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from socketserver import ThreadingUDPServer, BaseRequestHandler
+
+import dns.message
+import dns.rcode
+import dns.rrset
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.subdomain_scanner import SubdomainScanner, parse_resolvers
+
+# سجلات المنطقة التجريبية؛ *.wild.test شامل يجيب على أي اسم
+RECORDS = {
+    'www.example.test.': ['10.0.0.1'],
+    'mail.example.test.': ['10.0.0.2', '10.0.0.3'],
+    'real.wild.test.': ['10.0.0.4'],
+}
+WILDCARD = {'wild.test.': '10.9.9.9'}
+
+class _DNSHandler(BaseRequestHandler):
+    """خادم DNS تجريبي يجيب من السجلات أعلاه؛ أول استعلام لكل اسم في flaky.test يُهمل (لاختبار إعادة المحاولة)"""
+
+    counts = Counter()
+    lock = threading.Lock()
+
+    def handle(self):
+        data, sock = self.request
+        query = dns.message.from_wire(data)
+        question = query.question[0]
+        name = question.name.to_text().lower()
+
+        with self.lock:
+            self.counts[name] += 1
+            attempt = self.counts[name]
+
+        if name.endswith('.flaky.test.'):
+            if attempt == 1:
+                return
+            addresses = ['10.1.1.1'] if name.split('.')[0] in ('www', 'mail', 'real') else None
+        else:
+            addresses = RECORDS.get(name)
+            parent = name.split('.', 1)[1]
+            if addresses is None and parent in WILDCARD:
+                addresses = [WILDCARD[parent]]
+
+        response = dns.message.make_response(query)
+        if addresses:
+            response.answer.append(dns.rrset.from_text_list(question.name, 60, 'IN', 'A', addresses))
+        else:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        sock.sendto(response.to_wire(), self.client_address)
+
+class TestSubdomainScanner(unittest.TestCase):
+    """اختبارات لاكتشاف النطاقات الفرعية"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingUDPServer(('127.0.0.1', 0), _DNSHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.resolver = ('127.0.0.1', cls.server.server_address[1])
+
+        handle, cls.wordlist = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w') as f:
+            f.write('# أسماء تجريبية\nwww\nmail\nWWW\nreal\nftp\ndev\n' + 'a' * 70 + '\n')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        os.remove(cls.wordlist)
+
+    def setUp(self):
+        _DNSHandler.counts.clear()
+
+    def test_resolves_and_streams(self):
+        """اختبار حل الأسماء الموجودة فقط وتمرير كل نتيجة فور حلها دون تكرار"""
+        streamed = []
+        scanner = SubdomainScanner('example.test', resolvers=[self.resolver], timeout=1)
+        results = scanner.run(wordlist=self.wordlist, on_found=streamed.append)
+
+        hosts = {item['host']: item['addresses'] for item in results['subdomains']}
+        self.assertEqual(hosts, {'www.example.test': ['10.0.0.1'], 'mail.example.test': ['10.0.0.2', '10.0.0.3']})
+        self.assertEqual(streamed, results['subdomains'])
+        self.assertEqual(results['wildcard'], [])
+        self.assertEqual(_DNSHandler.counts['www.example.test.'], 1)
+        self.assertEqual((results['queried'], results['resolved']), (6, 2))
+        self.assertFalse(results['truncated'])
+
+    def test_wildcard_filtered(self):
+        """اختبار استبعاد الأسماء التي لا تُحل إلا إلى عنوان DNS الشامل"""
+        scanner = SubdomainScanner('wild.test', resolvers=[self.resolver], timeout=1)
+        results = scanner.run(wordlist=self.wordlist)
+
+        self.assertEqual(results['wildcard'], ['10.9.9.9'])
+        self.assertEqual([item['host'] for item in results['subdomains']], ['real.wild.test'])
+
+    def test_retries_after_timeout(self):
+        """اختبار إعادة المحاولة بعد مهلة الاستعلام الأول دون فقدان أي اسم"""
+        scanner = SubdomainScanner('flaky.test', resolvers=[self.resolver, self.resolver], timeout=0.3)
+        results = scanner.run(wordlist=self.wordlist)
+
+        self.assertEqual(sorted(item['host'] for item in results['subdomains']),
+                         ['mail.flaky.test', 'real.flaky.test', 'www.flaky.test'])
+        self.assertEqual(results['failed'], 0)
+        self.assertEqual(_DNSHandler.counts['www.flaky.test.'], 2)
+
+    def test_parse_resolvers(self):
+        """اختبار تحليل قائمة الخوادم بالمنافذ"""
+        self.assertEqual(parse_resolvers('1.1.1.1, 127.0.0.1:5353,[::1]:53,2001:db8::1'),
+                         [('1.1.1.1', 53), ('127.0.0.1', 5353), ('::1', 53), ('2001:db8::1', 53)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة الفرز السريع
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.triage import triage_score, plan_deep_scans
+
+class TestTriage(unittest.TestCase):
+    """اختبارات لوحدة الفرز السريع"""
+
+    def test_unreachable_target_scores_zero(self):
+        """اختبار أن الهدف غير القابل للوصول يحصل على درجة صفر"""
+        self.assertEqual(triage_score({'reachable': False, 'open_ports': []}), 0)
+
+    def test_score_weights(self):
+        """اختبار ترجيح نظام إدارة المحتوى والمنافذ الخطرة والثغرات"""
+        plain = triage_score({'reachable': True})
+        cms = triage_score({'reachable': True, 'cms': 'wordpress'})
+        risky = triage_score({'reachable': True, 'open_ports': [{'port': 3306}]})
+        vulnerable = triage_score({'reachable': True, 'vulnerabilities': [{'severity': 'عالية'}] * 10})
+
+        self.assertGreater(cms, plain)
+        self.assertGreater(risky, plain)
+        self.assertEqual(vulnerable, 100)
+
+    def test_plan_orders_by_score(self):
+        """اختبار ترتيب الأهداف تنازليًا واستبعاد ما دون العتبة"""
+        records = [
+            {'target': 'http://a.example', 'status': 'ok', 'results': {'score': 20, 'cms': None}},
+            {'target': 'http://b.example', 'status': 'ok', 'results': {'score': 60, 'cms': 'joomla'}},
+            {'target': 'http://c.example', 'status': 'ok', 'results': {'score': 0, 'cms': None}},
+            {'target': 'http://d.example', 'status': 'error', 'error': 'خطأ'},
+        ]
+
+        self.assertEqual(plan_deep_scans(records), [('http://b.example', 'joomla'), ('http://a.example', None)])
+        self.assertEqual(plan_deep_scans(records, threshold=50), [('http://b.example', 'joomla')])
+
+if __name__ == '__main__':
+    unittest.main()
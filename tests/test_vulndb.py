@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة قاعدة بيانات الثغرات
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import tempfile
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.vulndb import VulnDatabase, parse_version, parse_range, load_database, export_sqlite, DATA_DIR
+
+class TestVulnDatabase(unittest.TestCase):
+    """اختبارات لوحدة قاعدة بيانات الثغرات"""
+
+    def setUp(self):
+        self.db = VulnDatabase([
+            {'kind': 'plugin', 'slug': 'demo', 'id': 'A', 'affected': '<1.2'},
+            {'kind': 'plugin', 'slug': 'demo', 'id': 'B', 'affected': '>=2.0,<=2.3'},
+            {'kind': 'plugin', 'slug': 'demo', 'id': 'C', 'affected': '>=3.0,<3.1||>=1.0,<1.0.5'},
+        ], latest={'plugin:demo': '3.2'})
+
+    def test_parse(self):
+        """اختبار تحليل الإصدارات والنطاقات"""
+        self.assertEqual(parse_version('5.3.2-beta'), (5, 3, 2))
+        self.assertEqual(parse_version('5.3.0'), parse_version('5.3'))
+        self.assertIsNone(parse_version('trunk'))
+        self.assertEqual(parse_range('>2.0,<=3'), [((2,), False, (3,), True)])
+        self.assertRaises(ValueError, parse_range, '~1.0')
+
+    def test_lookup(self):
+        """اختبار مطابقة الإصدارات مع حدود الفترات"""
+        ids = lambda version: sorted(record['id'] for record in self.db.lookup('plugin', 'Demo', version))
+
+        self.assertEqual(ids('1.0.1'), ['A', 'C'])
+        self.assertEqual(ids('1.2'), [])
+        self.assertEqual(ids('2.3'), ['B'])
+        self.assertEqual(ids('2.3.1'), [])
+        self.assertEqual(ids('3.0.9'), ['C'])
+        self.assertEqual(self.db.lookup('plugin', 'other', '1.0'), [])
+        self.assertTrue(self.db.is_outdated('plugin', 'demo', '3.1'))
+        self.assertIsNone(self.db.is_outdated('plugin', 'other', '3.1'))
+
+    def test_bundled_and_sqlite(self):
+        """اختبار تحميل القاعدة المضمنة وتحويلها إلى SQLite"""
+        json_path = os.path.join(DATA_DIR, 'wordpress_vulns.json')
+        bundled = load_database(json_path)
+        self.assertTrue(bundled.lookup('plugin', 'wp-file-manager', '6.8'))
+
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = export_sqlite(json_path, os.path.join(directory, 'wordpress.db'))
+            converted = load_database(db_path)
+
+        self.assertEqual(len(converted), len(bundled))
+        self.assertTrue(converted.lookup('plugin', 'wp-file-manager', '6.8'))
+        self.assertEqual(converted.latest_version('core', 'wordpress'), bundled.latest_version('core', 'wordpress'))
+
+    def test_bundled_joomla(self):
+        """اختبار نطاقات النواة والامتدادات في قاعدة ثغرات جوملا المضمنة"""
+        bundled = load_database(os.path.join(DATA_DIR, 'joomla_vulns.json'))
+        ids = lambda kind, slug, version: sorted(record['id'] for record in bundled.lookup(kind, slug, version))
+
+        self.assertIn('CVE-2023-23752', ids('core', 'joomla', '4.2.7'))
+        self.assertNotIn('CVE-2023-23752', ids('core', 'joomla', '4.2.8'))
+        self.assertEqual(ids('core', 'joomla', '3.7.0'), ['CVE-2017-8917'])
+        self.assertIn('CVE-2015-8562', ids('core', 'joomla', '2.5.28'))
+        self.assertEqual(ids('component', 'com_k2', '2.8.0'), ['CVE-2018-7482'])
+        self.assertEqual(ids('component', 'com_akeeba', '4.0.4'), ['CVE-2014-7229'])
+        self.assertEqual(ids('component', 'com_akeeba', '4.0.5'), [])
+        self.assertEqual(ids('plugin', 'plg_editors_jckeditor', '6.4.4'), ['CVE-2018-17254'])
+        self.assertTrue(bundled.is_outdated('core', 'joomla', '4.3.3'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة فحص مواقع الويب
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.web_scanner import WebScanner
+from tests.helpers import start_server, stop_server
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    """خادم تجريبي يوجه robots.txt إلى صفحة تسجيل الدخول ويعيد sitemap.xml مباشرة"""
+
+    def do_GET(self):
+        if self.path == '/robots.txt':
+            self.send_response(302)
+            self.send_header('Location', '/login')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = b'<?xml version="1.0"?><urlset></urlset>' if self.path == '/sitemap.xml' else b'<html><title>Login</title></html>'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestWebScanner(unittest.TestCase):
+    """اختبارات لجمع معلومات الموقع"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_server(_SiteHandler)
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_server(cls.server)
+
+    def test_site_files_do_not_follow_redirects(self):
+        """اختبار أن توجيه robots.txt يُسجل ولا يُعد وجودًا للملف"""
+        scanner = WebScanner(self.url, timeout=5)
+        site_info = scanner.get_site_info()
+
+        self.assertEqual(site_info['robots.txt'], 'توجيه إلى /login')
+        self.assertEqual(site_info['sitemap.xml'], 'موجود')
+        self.assertEqual(scanner.redirects, {'/robots.txt': '/login'})
+
+if __name__ == '__main__':
+    unittest.main()
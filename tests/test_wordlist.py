@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة قوائم الكلمات الكبيرة
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import tempfile
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.wordlist import Wordlist, BloomFilter, iter_wordlist, mutate, parse_suffixes
+
+class TestWordlist(unittest.TestCase):
+    """اختبارات لقراءة قوائم الكلمات وتقسيمها وإزالة تكرارها"""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.txt')
+        self.words = [f"word{index}" for index in range(500)]
+        with os.fdopen(handle, 'wb') as f:
+            f.write(b'# comment\r\n\n')
+            f.write('\r\n'.join(self.words[:250]).encode('utf-8'))
+            f.write('\nكلمة\n'.encode('utf-8'))
+            # السطر الأخير بلا سطر جديد
+            f.write('\n'.join(self.words[250:] + self.words[:10]).encode('utf-8'))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_iterates_lines(self):
+        """اختبار قراءة الأسطر مع تجاهل التعليقات والفراغات ونهايات الأسطر المختلفة"""
+        words = list(Wordlist(self.path))
+        self.assertEqual(words, self.words[:250] + ['كلمة'] + self.words[250:] + self.words[:10])
+
+    def test_shards_cover_every_line_once(self):
+        """اختبار أن المقاطع بالإزاحة تغطي كل سطر مرة واحدة بأي عدد من العمال"""
+        wordlist = Wordlist(self.path)
+        for count in (1, 2, 3, 7, 64, 10000):
+            shards = wordlist.shards(count)
+            self.assertEqual([word for shard in shards for word in shard], list(wordlist))
+            self.assertEqual(shards[0].start, 0)
+            self.assertEqual(shards[-1].end, wordlist.size)
+
+    def test_dedupe_and_mutations(self):
+        """اختبار إزالة التكرار وترتيب صيغ التحويل"""
+        words = list(iter_wordlist(self.path))
+        self.assertEqual(len(words), 501)
+        self.assertEqual(len(set(words)), 501)
+
+        self.assertEqual(list(mutate(['Admin'], case=True, suffixes=['1'], extensions=['php'])),
+                         ['Admin', 'Admin.php', 'Admin1', 'Admin1.php', 'admin', 'admin.php', 'admin1', 'admin1.php',
+                          'ADMIN', 'ADMIN.php', 'ADMIN1', 'ADMIN1.php'])
+        self.assertEqual(parse_suffixes('1-3,2024,_old,1'), ['1', '2', '3', '2024', '_old'])
+
+    def test_bloom_filter(self):
+        """اختبار أن المرشح لا يخطئ في العناصر المضافة وأن إيجابياته الكاذبة ضمن النسبة"""
+        bloom = BloomFilter(10000, error_rate=0.01)
+        for index in range(10000):
+            bloom.add(f"item{index}")
+
+        self.assertTrue(all(f"item{index}" in bloom for index in range(10000)))
+        false_positives = sum(f"other{index}" in bloom for index in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_empty_file(self):
+        """اختبار ملف فارغ"""
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            self.assertEqual(list(iter_wordlist(path)), [])
+            self.assertEqual(len(Wordlist(path).shards(4)), 1)
+        finally:
+            os.remove(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة فحص ووردبريس
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.wordpress_scanner import WordpressScanner
+from tests.helpers import start_server, stop_server
+
+class _Handler(BaseHTTPRequestHandler):
+    """خادم تجريبي: ثلاثة مسارات ووردبريس سريعة وبقية مسارات ووردبريس بطيئة والمسارات العشوائية 404 فورًا"""
+
+    fast_paths = ['/wp-login.php', '/wp-admin/', '/wp-content/']
+
+    def do_GET(self):
+        if self.path in self.fast_paths:
+            self.send_response(200)
+        elif self.path.startswith('/jawal'):
+            # مسارات المعايرة العشوائية لصفحة الخطأ
+            self.send_response(404)
+        else:
+            time.sleep(2)
+            self.send_response(404)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+class TestWordpressScanner(unittest.TestCase):
+    """اختبارات لوحدة فحص ووردبريس"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_server(_Handler)
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_server(cls.server)
+
+    def test_verify_exits_early(self):
+        """اختبار انتهاء التحقق فور بلوغ عتبة الثقة دون انتظار المسارات البطيئة"""
+        scanner = WordpressScanner(self.url, timeout=5)
+
+        start_time = time.time()
+        self.assertTrue(scanner.verify_wordpress())
+        self.assertLess(time.time() - start_time, 1.5)
+
+    def test_plugin_status_unknown_without_latest(self):
+        """اختبار أن حالة الإضافة غير معروفة (لا محدثة) عندما لا يُعرف آخر إصدار لها"""
+        scanner = WordpressScanner(self.url, timeout=5)
+        self.assertIsNone(scanner._is_outdated_plugin('contact-form-7', '5.0'))
+
+if __name__ == '__main__':
+    unittest.main()
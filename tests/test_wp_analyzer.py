@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة تحليل الصفحة الرئيسية لووردبريس
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.wp_analyzer import analyze_homepage, parse_readme, parse_style_header, merge_version
+
+HOMEPAGE = '''
+<meta name="generator" content="WordPress 6.4.2" />
+<link rel="stylesheet" href="https://example.com/wp-content/themes/astra/style.min.css?ver=4.5.0" />
+<link rel="stylesheet" href="/wp-includes/css/dist/block-library/style.min.css?ver=6.4.2" />
+<script src="/wp-includes/js/jquery/jquery.min.js?ver=3.7.1"></script>
+<script src="/wp-content/plugins/contact-form-7/includes/js/index.js?ver=5.8.4"></script>
+<script src="/wp-content/plugins/contact-form-7/includes/swv/js/index.js?ver=5.8.4"></script>
+<script src="/wp-content/plugins/akismet/_inc/akismet-frontend.js?ver=6.4.2"></script>
+<script>var cfg = {"url":"https:\\/\\/example.com\\/wp-content\\/plugins\\/elementor\\/assets\\/"};</script>
+'''
+
+class TestWordpressAnalyzer(unittest.TestCase):
+    """اختبارات لوحدة تحليل الصفحة الرئيسية لووردبريس"""
+
+    def setUp(self):
+        self.analysis = analyze_homepage(HOMEPAGE)
+
+    def test_core_version(self):
+        """اختبار تفضيل وسم generator وتجاهل إصدارات المكتبات المضمنة"""
+        versions = [candidate['version'] for candidate in self.analysis['core']]
+        self.assertEqual(versions, ['6.4.2'])
+        self.assertEqual(self.analysis['core'][0]['confidence'], 'عالية')
+
+    def test_plugins(self):
+        """اختبار استخراج الإضافات بترتيب ظهورها مع الإصدارات والأدلة"""
+        plugins = {plugin['slug']: plugin for plugin in self.analysis['plugins']}
+
+        self.assertEqual(list(plugins), ['contact-form-7', 'akismet', 'elementor'])
+        self.assertEqual(plugins['contact-form-7']['version'], '5.8.4')
+        self.assertEqual(len(plugins['contact-form-7']['evidence']), 2)
+        # الإصدار المطابق لإصدار النواة منخفض الثقة لأن ووردبريس يضيفه افتراضيًا
+        self.assertEqual(plugins['akismet']['confidence'], 'منخفضة')
+        self.assertIsNone(plugins['elementor']['version'])
+
+    def test_themes(self):
+        """اختبار استخراج القالب وإصداره"""
+        self.assertEqual(self.analysis['themes'][0]['slug'], 'astra')
+        self.assertEqual(self.analysis['themes'][0]['version'], '4.5.0')
+
+    def test_empty_page(self):
+        """اختبار صفحة بدون مراجع ووردبريس"""
+        self.assertEqual(analyze_homepage(''), {'core': [], 'themes': [], 'plugins': []})
+
+    def test_header_files(self):
+        """اختبار تحليل ترويسات readme.txt و style.css"""
+        self.assertEqual(parse_readme('=== Akismet ===\nStable tag: 5.3\n')['version'], '5.3')
+        self.assertIsNone(parse_readme('Stable tag: trunk\n')['version'])
+
+        header = parse_style_header('/*\nTheme Name: Astra\nAuthor: Brainstorm Force\nVersion: 4.5.0\n*/')
+        self.assertEqual(header, {'version': '4.5.0', 'author': 'Brainstorm Force'})
+
+    def test_merge_version(self):
+        """اختبار دمج إصدار الصفحة الرئيسية مع إصدار الملف"""
+        self.assertEqual(merge_version('5.8.4', 'متوسطة', '5.8.4'), ('5.8.4', 'عالية'))
+        self.assertEqual(merge_version('6.4.2', 'منخفضة', '5.3'), ('5.3', 'متوسطة'))
+        self.assertEqual(merge_version('4.5.0', 'متوسطة', None), ('4.5.0', 'متوسطة'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة التعداد النشط لووردبريس
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import tempfile
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.enumerator import load_slugs, Enumerator
+from modules.wp_enumerator import WordpressEnumerator
+from tests.helpers import start_server, stop_server
+
+class _SoftNotFoundHandler(BaseHTTPRequestHandler):
+    """خادم تجريبي لا يدعم HEAD ويعيد 200 بصفحة خطأ مخصصة لكل المسارات غير الموجودة"""
+
+    existing = {
+        '/wp-content/plugins/akismet/readme.txt': b'=== Akismet ===\nStable tag: 5.3\n' * 20,
+        '/wp-content/plugins/woocommerce/readme.txt': b'=== WooCommerce ===\nStable tag: 8.5.1\n' * 20,
+    }
+
+    def do_HEAD(self):
+        self.send_response(405)
+        self.end_headers()
+
+    def do_GET(self):
+        body = self.existing.get(self.path, b'<html>Page not found</html>')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestWordpressEnumerator(unittest.TestCase):
+    """اختبارات للتعداد النشط للإضافات"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.url = start_server(_SoftNotFoundHandler)
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_server(cls.server)
+
+    def setUp(self):
+        handle, self.slug_file = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write('# تعليق\nwoocommerce\nelementor\nakismet\nelementor\njetpack\n')
+
+    def tearDown(self):
+        os.remove(self.slug_file)
+
+    def test_load_slugs(self):
+        """اختبار قراءة المعرفات بالترتيب مع تجاهل التعليقات والتكرار"""
+        self.assertEqual(load_slugs(self.slug_file), ['woocommerce', 'elementor', 'akismet', 'jetpack'])
+        self.assertEqual(load_slugs(self.slug_file, limit=2), ['woocommerce', 'elementor'])
+
+    def test_base_requires_probe_path(self):
+        """اختبار أن الفئة الأساسية لا تُنشأ دون تحديد مسار الفحص"""
+        with self.assertRaises(TypeError):
+            Enumerator(self.url)
+        self.assertEqual(WordpressEnumerator(self.url).probe_path('plugin', 'akismet'),
+                         '/wp-content/plugins/akismet/readme.txt')
+
+    def test_enumerate_with_soft_404(self):
+        """اختبار التمييز عن صفحة الخطأ المخصصة والرجوع إلى GET مع الحفاظ على ترتيب الشعبية"""
+        enumerator = WordpressEnumerator(self.url, timeout=5, rate=100, slug_files={'plugin': self.slug_file})
+        results = enumerator.enumerate(kinds=('plugin',))
+
+        self.assertEqual([item['slug'] for item in results['plugins']], ['woocommerce', 'akismet'])
+        self.assertEqual(enumerator._calibration['plugin']['method'], 'GET')
+        self.assertEqual(results['probed'], 4)
+        self.assertFalse(results['truncated'])
+
+if __name__ == '__main__':
+    unittest.main()
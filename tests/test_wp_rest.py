@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة اكتشاف الإضافات من فهرس REST
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import unittest
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.wp_rest import NamespaceTable, map_namespaces, get_namespace_table
+
+class TestWordpressRest(unittest.TestCase):
+    """اختبارات لتحويل مساحات أسماء REST إلى إضافات"""
+
+    def setUp(self):
+        self.table = NamespaceTable(
+            {'wc/v3': 'woocommerce', 'wc/store': 'woocommerce', 'yoast/v1': 'wordpress-seo',
+             'tribe/events/v1': 'the-events-calendar', 'tribe/tickets/v1': 'event-tickets'},
+            core=['wp/v2', 'oembed/1.0']
+        )
+
+    def test_resolve(self):
+        """اختبار المطابقة التامة ومطابقة الجزء الأول واستبعاد النواة"""
+        self.assertEqual(self.table.resolve('yoast/v1'), ('wordpress-seo', 'exact'))
+        self.assertEqual(self.table.resolve('wc/v4'), ('woocommerce', 'prefix'))
+        self.assertEqual(self.table.resolve('wp/v2'), (None, 'core'))
+        # الجزء المشترك بين إضافتين لا يُستخدم للمطابقة الجزئية
+        self.assertEqual(self.table.resolve('tribe/views/v2'), (None, 'unknown'))
+
+    def test_map_namespaces(self):
+        """اختبار تجميع مساحات الأسماء لكل إضافة وإرجاع غير المعروفة"""
+        result = map_namespaces(['oembed/1.0', 'wc/v3', 'wc/store', 'wp/v2', 'custom/v1'], table=self.table)
+
+        self.assertEqual(result['plugins'], [
+            {'slug': 'woocommerce', 'namespaces': ['wc/v3', 'wc/store'], 'confidence': 'عالية'}
+        ])
+        self.assertEqual(result['unknown'], ['custom/v1'])
+
+    def test_bundled_table(self):
+        """اختبار تحميل الجدول المضمن"""
+        self.assertEqual(get_namespace_table().resolve('contact-form-7/v1'), ('contact-form-7', 'exact'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+JawaL - اختبارات وحدة تعداد مستخدمي ووردبريس
+المطور: Saudi Linux
+البريد الإلكتروني: SaudiLinux7@gmail.com
+'''
+
+import os
+import sys
+import json
+import unittest
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.wp_users import WordpressUserEnumerator, iter_json_array
+from tests.helpers import start_server, stop_server
+
+class _Handler(BaseHTTPRequestHandler):
+    """خادم تجريبي: 250 مستخدمًا عبر REST على المنفذ الأول، و?author=N فقط على الثاني"""
+
+    rest_enabled = True
+    authors = {1: 'admin', 2: 'editor', 4: 'writer'}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == '/wp-json/wp/v2/users' and self.server.rest_enabled:
+            page = int(query['page'][0])
+            users = [{'id': i, 'name': f'User {i}', 'slug': f'user{i}', 'description': 'x' * 200}
+                     for i in range((page - 1) * 100 + 1, min(page * 100, 250) + 1)]
+            body = json.dumps(users).encode()
+            self.send_response(200)
+            self.send_header('X-WP-TotalPages', '3')
+        elif url.path == '/' and 'author' in query:
+            slug = self.authors.get(int(query['author'][0]))
+            self.send_response(301 if slug else 404)
+            if slug:
+                self.send_header('Location', f'/author/{slug}/')
+            body = b''
+        else:
+            self.send_response(404)
+            body = b'<html>not found</html>'
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestWordpressUsers(unittest.TestCase):
+    """اختبارات لتعداد المستخدمين"""
+
+    def _serve(self, rest_enabled):
+        server, url = start_server(_Handler)
+        server.rest_enabled = rest_enabled
+        self.addCleanup(stop_server, server)
+        return url
+
+    def test_iter_json_array(self):
+        """اختبار التحليل التدريجي لمصفوفة مقسمة على أجزاء عشوائية"""
+        text = json.dumps([{'id': 1, 'name': 'a]b'}, {'id': 2}, [3, 4]])
+        chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+        self.assertEqual(list(iter_json_array(chunks)), [{'id': 1, 'name': 'a]b'}, {'id': 2}, [3, 4]])
+
+        with self.assertRaises(ValueError):
+            list(iter_json_array(['<html>']))
+
+    def test_rest_pagination(self):
+        """اختبار جلب جميع الصفحات والاحتفاظ بالحقول المطلوبة فقط"""
+        result = WordpressUserEnumerator(self._serve(True), timeout=5).enumerate()
+
+        self.assertEqual(result['source'], 'rest')
+        self.assertEqual(len(result['users']), 250)
+        self.assertEqual(result['users'][0], {'id': 1, 'name': 'User 1', 'slug': 'user1'})
+
+    def test_author_fallback(self):
+        """اختبار الرجوع إلى ?author=N والتوقف بعد الإخفاقات المتتالية"""
+        result = WordpressUserEnumerator(self._serve(False), timeout=5, miss_limit=3).enumerate()
+
+        self.assertEqual(result['source'], 'author')
+        self.assertEqual([user['slug'] for user in result['users']], ['admin', 'editor', 'writer'])
+
+if __name__ == '__main__':
+    unittest.main()